@@ -7,24 +7,101 @@ feature in Scythe. It sets the X-SCYTHE-TARGET-VERSION header on all responses
 to simulate a real web application that provides version information.
 
 Usage:
-    python test_server_with_version.py [port] [version]
+    python test_server_with_version.py [port] [version] [--quiet] [--workers N]
 
 Examples:
     python test_server_with_version.py 8080 1.3.2
     python test_server_with_version.py 3000 2.1.0-beta
+    python test_server_with_version.py 8080 1.3.2 --quiet   # no request log (benchmarking)
+    python test_server_with_version.py 8080 1.3.2 --workers 4   # 4 processes sharing the port (Linux)
 """
 
+import os
+import queue
+import signal
+import socket
 import sys
+import tempfile
+import threading
 import time
+from email.utils import formatdate
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 
 
+# Formatted timestamps only change once per second; cache the last one so a
+# request flood doesn't call strftime for every response.
+_ts_cache = [0, "", b"", b""]
+
+
+def _refresh_ts_cache():
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        http_date = formatdate(now, usegmt=True).encode('ascii')
+        _ts_cache[:] = [now, formatted, formatted.encode('ascii'), http_date]
+
+
+def _now_str():
+    """Return the current time as 'YYYY-MM-DD HH:MM:SS', cached per second."""
+    _refresh_ts_cache()
+    return _ts_cache[1]
+
+
+def _now_bytes():
+    """Same as _now_str(), already encoded for writing to the socket."""
+    _refresh_ts_cache()
+    return _ts_cache[2]
+
+
+def _http_date_bytes():
+    """Return the current time as an encoded HTTP Date value, cached per second."""
+    _refresh_ts_cache()
+    return _ts_cache[3]
+
+
+# Request log lines are written by a background thread so stdout I/O stays
+# off the request path; the drain thread writes whatever has queued up in
+# one call.
+_LOG_Q = queue.Queue()
+_LOG_BATCH_SIZE = 256
+
+
+def _drain_log_queue():
+    """Write queued log lines to stdout in batches. Runs forever."""
+    while True:
+        batch = [_LOG_Q.get()]
+        while len(batch) < _LOG_BATCH_SIZE:
+            try:
+                batch.append(_LOG_Q.get_nowait())
+            except queue.Empty:
+                break
+        sys.stdout.write(''.join(batch))
+        sys.stdout.flush()
+
+
 class VersionHeaderServer(BaseHTTPRequestHandler):
     """HTTP request handler that sets version headers on all responses."""
     
     # Class variable to store the version (can be set by server initialization)
     server_version_string = "1.0.0"
+
+    # Disable per-request logging entirely (set by run_server)
+    quiet = False
+
+    # Pages whose content never changes while the server runs; run_server
+    # renders them once into temp files that are served with sendfile.
+    STATIC_PATHS = ('/', '/about', '/login', '/dashboard')
+    page_files = {}
+
+    # /api/health changes only in its timestamp; run_server pre-encodes the
+    # bytes before and after it as (head, tail).
+    health_parts = None
+
+    # Encoded "status line + Server:" and the fixed headers that follow Date;
+    # built once by build_response_head_parts so no header is formatted per
+    # request.
+    response_head_parts = None
     
     def do_GET(self):
         """Handle GET requests."""
@@ -40,23 +117,74 @@ class VersionHeaderServer(BaseHTTPRequestHandler):
         parsed_path = urlparse(self.path)
         path = parsed_path.path
         
-        # Set the version header on all responses
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.send_header('X-SCYTHE-TARGET-VERSION', self.server_version_string)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, X-SCYTHE-TARGET-VERSION')
-        self.end_headers()
+        page = self.page_files.get(path)
         
-        # Generate response content based on path
-        content = self.generate_content(path)
-        self.wfile.write(content.encode('utf-8'))
+        if page is not None:
+            # Pre-rendered page: let the kernel copy it straight to the socket
+            page_file, size = page
+            self.write_parts(self.response_head(size))
+            self.send_page_file(page_file, size)
+        else:
+            if path == '/api/health' and self.health_parts:
+                head, tail = self.health_parts
+                parts = (head, _now_bytes(), tail)
+            else:
+                # Generate response content based on path
+                parts = (self.generate_content(path).encode('utf-8'),)
+            self.write_parts(self.response_head(sum(map(len, parts))), *parts)
         
-        # Log the request
-        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {self.command} {self.path} - Version: {self.server_version_string}")
-    
-    def generate_content(self, path):
+        # Log the request (written by the background drain thread)
+        if not self.quiet:
+            _LOG_Q.put(f"[{_now_str()}] {self.command} {self.path} - Version: {self.server_version_string}\n")
+    
+    @classmethod
+    def build_response_head_parts(cls):
+        """Encode the response head around its Date header; every response is a 200."""
+        status = f"{cls.protocol_version} 200 OK\r\nServer: {cls.server_version} {cls.sys_version}\r\nDate: "
+        fixed = (
+            "\r\nContent-type: text/html\r\n"
+            f"X-SCYTHE-TARGET-VERSION: {cls.server_version_string}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+            "Access-Control-Allow-Headers: Content-Type, X-SCYTHE-TARGET-VERSION\r\n"
+            "Content-Length: "
+        )
+        cls.response_head_parts = (status.encode('latin-1'), fixed.encode('latin-1'))
+        return cls.response_head_parts
+
+    def response_head(self, content_length):
+        """Return the encoded status line and headers for a body of content_length bytes."""
+        status, fixed = self.response_head_parts or self.build_response_head_parts()
+        return b''.join((status, _http_date_bytes(), fixed, b'%d\r\n\r\n' % content_length))
+
+    def write_parts(self, *parts):
+        """Write byte strings to the client, in a single writev call where available."""
+        if not hasattr(os, 'writev'):
+            # No writev on this platform (e.g. Windows)
+            self.wfile.write(b''.join(parts))
+            return
+        sent = os.writev(self.connection.fileno(), parts)
+        if sent < sum(map(len, parts)):
+            # Short write: hand whatever is left to the buffered writer
+            self.wfile.write(b''.join(parts)[sent:])
+
+    def send_page_file(self, page_file, size):
+        """Send a pre-rendered page, zero-copy where os.sendfile is available."""
+        if not hasattr(os, 'sendfile'):
+            # No sendfile on this platform (e.g. Windows): plain read
+            page_file.seek(0)
+            self.wfile.write(page_file.read(size))
+            return
+        # Explicit offsets keep concurrent sends of the same file independent
+        sock_fd = self.connection.fileno()
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(sock_fd, page_file.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    
+    def generate_content(self, path, timestamp=None):
         """Generate HTML content based on the requested path."""
         
         if path == '/':
@@ -152,7 +280,7 @@ class VersionHeaderServer(BaseHTTPRequestHandler):
     <div style="background: #e8f5e8; padding: 20px; border-radius: 5px;">
         <h2>✓ Status: Healthy</h2>
         <p><strong>Version:</strong> {self.server_version_string}</p>
-        <p><strong>Timestamp:</strong> {time.strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
+        <p><strong>Timestamp:</strong> {timestamp or _now_str()} UTC</p>
         <p><strong>Server:</strong> Test Server with Version Headers</p>
     </div>
     
@@ -288,24 +416,107 @@ class VersionHeaderServer(BaseHTTPRequestHandler):
         pass
 
 
-def run_server(port=8080, version="1.0.0"):
+class TunedHTTPServer(HTTPServer):
+    """
+    HTTPServer that tunes every accepted connection for small responses.
+
+    TCP_NODELAY stops Nagle's algorithm from holding back the last segment of
+    a response (which otherwise interacts with delayed ACKs and adds ~40ms to
+    timing-sensitive TTPs), and a larger send buffer lets a full page go out
+    without blocking. TCP_QUICKACK is applied where the platform has it.
+    """
+
+    SEND_BUFFER_SIZE = 262144
+
+    # Set SO_REUSEPORT before binding so several processes can listen on the
+    # same port and the kernel spreads incoming connections across them
+    reuse_port = False
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def get_request(self):
+        conn, addr = super().get_request()
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        if hasattr(socket, 'TCP_QUICKACK'):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        return conn, addr
+
+
+def prerender_pages(httpd):
+    """
+    Render every static page once into an anonymous temp file.
+
+    The files stay open for the life of the server so handle_request can
+    sendfile them without reopening or re-rendering anything. The health
+    page is pre-encoded too, minus its timestamp.
+    """
+    renderer = VersionHeaderServer.__new__(VersionHeaderServer)  # no request needed to render
+    renderer.server = httpd
+    page_files = {}
+    for path in VersionHeaderServer.STATIC_PATHS:
+        body = renderer.generate_content(path).encode('utf-8')
+        page_file = tempfile.TemporaryFile(prefix='scythe_test_', suffix='.html')
+        page_file.write(body)
+        page_file.flush()
+        page_files[path] = (page_file, len(body))
+    VersionHeaderServer.page_files = page_files
+
+    # Split the health page around its timestamp so only that part is
+    # produced per request
+    marker = '\x00timestamp\x00'
+    head, tail = renderer.generate_content('/api/health', timestamp=marker).split(marker)
+    VersionHeaderServer.health_parts = (head.encode('utf-8'), tail.encode('utf-8'))
+    VersionHeaderServer.build_response_head_parts()
+
+
+def _serve_worker(server_address, quiet):
+    """Forked worker: bind its own SO_REUSEPORT socket and serve until killed."""
+    try:
+        httpd = TunedHTTPServer(server_address, VersionHeaderServer)
+        if not quiet:
+            threading.Thread(target=_drain_log_queue, daemon=True).start()
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        os._exit(0)
+
+
+def run_server(port=8080, version="1.0.0", quiet=False, workers=1):
     """
     Start the test server with version headers.
     
     Args:
         port: Port number to listen on
         version: Version string to include in headers
+        quiet: Disable per-request logging
+        workers: Number of processes accepting on the port. Values above 1
+                 fork extra processes that share the port via SO_REUSEPORT
+                 (Linux/BSD only), sidestepping the GIL under heavy load.
     """
     # Set the version string on the handler class
     VersionHeaderServer.server_version_string = version
+    VersionHeaderServer.quiet = quiet
+    
+    if workers > 1 and not (hasattr(socket, 'SO_REUSEPORT') and hasattr(os, 'fork')):
+        print("SO_REUSEPORT or fork() is not available here; running a single process.")
+        workers = 1
+    TunedHTTPServer.reuse_port = workers > 1
     
     # Create and start the server
     server_address = ('', port)
-    httpd = HTTPServer(server_address, VersionHeaderServer)
+    httpd = TunedHTTPServer(server_address, VersionHeaderServer)
     
     # Store port on server object for template access
     httpd.server_port = port
     
+    # Render static pages once, after the version and port are known
+    prerender_pages(httpd)
+    
     print("="*60)
     print("SCYTHE TEST SERVER WITH VERSION HEADERS")
     print("="*60)
@@ -322,14 +533,36 @@ def run_server(port=8080, version="1.0.0"):
     print("To test with Scythe:")
     print(f"  python version_header_example.py http://localhost:{port}")
     print()
+    if workers > 1:
+        print(f"Worker processes: {workers} (SO_REUSEPORT)")
     print("Press Ctrl+C to stop the server")
     print("="*60)
+    sys.stdout.flush()
+    
+    # Fork after pre-rendering so every worker inherits the page files
+    children = []
+    for _ in range(workers - 1):
+        pid = os.fork()
+        if pid == 0:
+            httpd.server_close()
+            _serve_worker(server_address, quiet)
+        children.append(pid)
+    
+    if not quiet:
+        threading.Thread(target=_drain_log_queue, daemon=True).start()
     
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\nServer stopped by user.")
         httpd.server_close()
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
 
 
 def main():
@@ -337,16 +570,35 @@ def main():
     # Parse command line arguments
     port = 8080
     version = "1.0.0"
+    quiet = False
+    workers = 1
+    args = []
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg == "--quiet":
+            quiet = True
+        elif arg == "--workers":
+            try:
+                workers = int(next(argv, ""))
+            except ValueError:
+                print("--workers needs a positive integer")
+                sys.exit(1)
+        else:
+            args.append(arg)
+    
+    if workers < 1:
+        print(f"--workers must be at least 1, got: {workers}")
+        sys.exit(1)
     
-    if len(sys.argv) > 1:
+    if len(args) > 0:
         try:
-            port = int(sys.argv[1])
+            port = int(args[0])
         except ValueError:
-            print(f"Invalid port number: {sys.argv[1]}")
+            print(f"Invalid port number: {args[0]}")
             sys.exit(1)
     
-    if len(sys.argv) > 2:
-        version = sys.argv[2]
+    if len(args) > 1:
+        version = args[1]
     
     # Validate port range
     if not (1 <= port <= 65535):
@@ -355,7 +607,7 @@ def main():
     
     # Start the server
     try:
-        run_server(port, version)
+        run_server(port, version, quiet, workers)
     except OSError as e:
         if "Address already in use" in str(e):
             print(f"Error: Port {port} is already in use.")
@@ -14,9 +14,31 @@ Demonstrates:
 - SQL injection TTP in both UI and API modes
 - How to configure API endpoints and payloads
 - Rate limiting in API mode
+- Running independent API-mode examples concurrently
+- Firing API-mode payloads concurrently over HTTP/2 with httpx (optional)
+- Firing API-mode payloads concurrently over a pooled aiohttp session (optional)
+- Batching the payloads of several API-mode TTPs into one concurrent run (optional)
 """
 
-from scythe.payloads.generators import StaticPayloadGenerator
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# orjson (a C extension) encodes JSON several times faster than the stdlib;
+# use it for request bodies we serialize ourselves when it is installed.
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+from scythe.payloads.generators import StaticPayloadGenerator, MmapPayloadGenerator
 from scythe.ttps.web.login_bruteforce import LoginBruteforceTTP
 from scythe.ttps.web.sql_injection import InputFieldInjector, URLManipulation
 from scythe.journeys.base import Journey, Step
@@ -24,6 +46,48 @@ from scythe.journeys.actions import TTPAction, ApiRequestAction
 from scythe.journeys.executor import JourneyExecutor
 
 
+# Every example targets the same local test server. Using the IP literal
+# skips a getaddrinfo() lookup per new connection (and, on dual-stack hosts,
+# a failed ::1 connect attempt before falling back to 127.0.0.1).
+TARGET_URL = "http://127.0.0.1:8000"
+
+
+# Upper bound on threads an API-mode executor uses to send payloads
+MAX_WORKERS = 32
+
+
+# Payloads for the API-mode examples (2, 4 and 5) and the batched run
+LOGIN_PASSWORDS = ['password123', 'admin', 'letmein', '123456', 'welcome1']
+SQL_BODY_PAYLOADS = [
+    "' OR '1'='1",
+    "' OR 1=1--",
+    "admin'--",
+    "' UNION SELECT NULL--",
+    "1; DROP TABLE users--"
+]
+SQL_URL_PAYLOADS = [
+    "' OR '1'='1",
+    "1' OR '1'='1' --",
+    "1 UNION SELECT NULL, NULL--"
+]
+
+
+def make_pooled_session(pool_maxsize=64):
+    """
+    Build a requests.Session that keeps connections alive between payloads.
+
+    API-mode TTPs send one request per payload; a pooled keep-alive session
+    avoids paying a TCP (and TLS) handshake for each of them. urllib3 already
+    sets TCP_NODELAY on the sockets it opens.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
 def login_bruteforce_ui_mode_example():
     """
     Example: Login bruteforce using UI mode (traditional Selenium approach)
@@ -64,36 +128,38 @@ def login_bruteforce_ui_mode_example():
     
     step.add_action(TTPAction(
         ttp=login_ttp,
-        target_url="http://localhost:8000/login"
+        target_url=f"{TARGET_URL}/login"
     ))
     
     journey.add_step(step)
     
     # Execute
-    executor = JourneyExecutor(journey, target_url="http://localhost:8000", headless=True)
-    result = executor.execute()
+    executor = JourneyExecutor(journey, target_url=TARGET_URL, headless=True)
+    executor.run()
+    result = executor.was_successful()
     
     print(f"\nUI Mode Result: {'PASSED' if result else 'FAILED'}")
     return result
 
 
-def login_bruteforce_api_mode_example():
+def login_bruteforce_api_mode_example(wordlist_path=None):
     """
     Example: Login bruteforce using API mode (direct HTTP requests)
     Much faster than UI mode and can handle rate limiting better.
+
+    Pass wordlist_path to stream passwords from a (possibly huge) wordlist
+    file instead of the built-in list.
     """
     print("\n" + "="*80)
     print("Example 2: Login Bruteforce - API Mode")
     print("="*80)
     
-    # Create payload generator with common passwords
-    password_gen = StaticPayloadGenerator([
-        'password123',
-        'admin',
-        'letmein',
-        '123456',
-        'welcome1'
-    ])
+    if wordlist_path:
+        # Memory-mapped: the wordlist is never loaded into memory as a whole
+        password_gen = MmapPayloadGenerator(wordlist_path)
+    else:
+        # Create payload generator with common passwords
+        password_gen = StaticPayloadGenerator(LOGIN_PASSWORDS)
     
     # Create TTP in API mode
     login_ttp = LoginBruteforceTTP(
@@ -105,6 +171,10 @@ def login_bruteforce_api_mode_example():
         api_endpoint='/api/auth/login',
         username_field='username',  # JSON field name for username
         password_field='password',  # JSON field name for password
+        # Pre-serialized body: each password is spliced in at __PW__ instead of
+        # building and serializing a new dict for every request. It must use
+        # the same username and field names as above or __init__ raises.
+        body_template=b'{"username":"admin","password":"__PW__"}',
         success_indicators={
             'status_code': 200,  # Successful login returns 200
             'response_contains': 'token',  # Response should contain a token
@@ -126,7 +196,7 @@ def login_bruteforce_api_mode_example():
     
     step.add_action(TTPAction(
         ttp=login_ttp,
-        target_url="http://localhost:8000"
+        target_url=TARGET_URL
     ))
     
     journey.add_step(step)
@@ -134,15 +204,128 @@ def login_bruteforce_api_mode_example():
     # Execute in API mode
     executor = JourneyExecutor(
         journey, 
-        target_url="http://localhost:8000",
-        api_mode=True  # Enable API mode for the journey
+        target_url=TARGET_URL,
+        mode="API",  # Enable API mode for the journey
+        http_session=make_pooled_session(),  # Reuse connections across payloads
+        # Threads used to send payloads; a wordlist's length isn't known upfront
+        workers=MAX_WORKERS if wordlist_path else min(MAX_WORKERS, len(LOGIN_PASSWORDS))
     )
-    result = executor.execute()
+    executor.run()
+    result = executor.was_successful()
     
     print(f"\nAPI Mode Result: {'PASSED' if result else 'FAILED'}")
     return result
 
 
+def _is_login_success(status_code, text):
+    """Same success indicators as Example 2's LoginBruteforceTTP."""
+    text = text.lower()
+    return status_code == 200 and 'token' in text and 'invalid' not in text
+
+
+async def _bruteforce_http2(target_url, username, passwords, max_concurrency):
+    """Post every password concurrently over one multiplexed HTTP/2 client."""
+    import httpx
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limits = httpx.Limits(max_connections=max_concurrency)
+
+    async with httpx.AsyncClient(http2=True, base_url=target_url, limits=limits,
+                                 timeout=10.0) as client:
+        async def attempt(password):
+            async with semaphore:
+                response = await client.post(
+                    '/api/auth/login',
+                    content=_json_dumps({'username': username, 'password': password}),
+                    headers={'Content-Type': 'application/json'}
+                )
+            return _is_login_success(response.status_code, response.text)
+
+        return await asyncio.gather(*(attempt(p) for p in passwords))
+
+
+def login_bruteforce_api_mode_example_async(max_concurrency=32):
+    """
+    Example: Login bruteforce in API mode with concurrent HTTP/2 requests
+
+    Same check as Example 2, but every password is sent concurrently through a
+    single httpx.AsyncClient. Over HTTP/2 the requests are multiplexed on one
+    connection. Requires: pip install 'httpx[http2]'
+    """
+    print("\n" + "="*80)
+    print("Example 2b: Login Bruteforce - API Mode (async, HTTP/2)")
+    print("="*80)
+
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "httpx is required for the async example. "
+            "Install it with: pip install 'httpx[http2]'"
+        )
+
+    passwords = LOGIN_PASSWORDS
+    successes = asyncio.run(_bruteforce_http2(
+        TARGET_URL, 'admin', passwords, max_concurrency
+    ))
+
+    # expected_result=False: security controls should stop every attempt
+    result = not any(successes)
+    print(f"\nAsync API Mode Result: {'PASSED' if result else 'FAILED'}")
+    return result
+
+
+async def _bruteforce_aiohttp(target_url, username, passwords, max_connections):
+    """Post every password concurrently through one pooled aiohttp session."""
+    import aiohttp
+
+    # One connector for every payload: sockets stay open between requests and
+    # the host is resolved once rather than per connection.
+    connector = aiohttp.TCPConnector(limit=max_connections, ttl_dns_cache=300,
+                                     use_dns_cache=True)
+    async with aiohttp.ClientSession(base_url=target_url, connector=connector) as session:
+        async def attempt(password):
+            async with session.post(
+                '/api/auth/login',
+                data=_json_dumps({'username': username, 'password': password}),
+                headers={'Content-Type': 'application/json'}
+            ) as response:
+                return _is_login_success(response.status, await response.text())
+
+        return await asyncio.gather(*(attempt(p) for p in passwords))
+
+
+def login_bruteforce_api_mode_example_aiohttp(max_connections=100):
+    """
+    Example: Login bruteforce in API mode with a pooled aiohttp session
+
+    Same check as Example 2, but every password is sent concurrently through
+    one aiohttp.ClientSession whose connector keeps connections alive and
+    caches DNS. Requires: pip install aiohttp
+    """
+    print("\n" + "="*80)
+    print("Example 2c: Login Bruteforce - API Mode (async, aiohttp)")
+    print("="*80)
+
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "aiohttp is required for this example. "
+            "Install it with: pip install aiohttp"
+        )
+
+    passwords = LOGIN_PASSWORDS
+    successes = asyncio.run(_bruteforce_aiohttp(
+        TARGET_URL, 'admin', passwords, max_connections
+    ))
+
+    # expected_result=False: security controls should stop every attempt
+    result = not any(successes)
+    print(f"\naiohttp API Mode Result: {'PASSED' if result else 'FAILED'}")
+    return result
+
+
 def sql_injection_ui_mode_example():
     """
     Example: SQL injection testing via UI form fields
@@ -161,7 +344,7 @@ def sql_injection_ui_mode_example():
     
     # Create TTP in UI mode
     sql_ttp = InputFieldInjector(
-        target_url="http://localhost:8000/search",
+        target_url=f"{TARGET_URL}/search",
         field_selector='input[name="query"]',
         submit_selector='button[type="submit"]',
         payload_generator=sql_payloads,
@@ -182,14 +365,15 @@ def sql_injection_ui_mode_example():
     
     step.add_action(TTPAction(
         ttp=sql_ttp,
-        target_url="http://localhost:8000/search"
+        target_url=f"{TARGET_URL}/search"
     ))
     
     journey.add_step(step)
     
     # Execute
-    executor = JourneyExecutor(journey, target_url="http://localhost:8000", headless=True)
-    result = executor.execute()
+    executor = JourneyExecutor(journey, target_url=TARGET_URL, headless=True)
+    executor.run()
+    result = executor.was_successful()
     
     print(f"\nUI Mode Result: {'PASSED' if result else 'FAILED'}")
     return result
@@ -205,13 +389,7 @@ def sql_injection_api_mode_example():
     print("="*80)
     
     # SQL injection payloads
-    sql_payloads = StaticPayloadGenerator([
-        "' OR '1'='1",
-        "' OR 1=1--",
-        "admin'--",
-        "' UNION SELECT NULL--",
-        "1; DROP TABLE users--"
-    ])
+    sql_payloads = StaticPayloadGenerator(SQL_BODY_PAYLOADS)
     
     # Create TTP in API mode
     sql_ttp = InputFieldInjector(
@@ -237,7 +415,7 @@ def sql_injection_api_mode_example():
     
     step.add_action(TTPAction(
         ttp=sql_ttp,
-        target_url="http://localhost:8000"
+        target_url=TARGET_URL
     ))
     
     journey.add_step(step)
@@ -245,10 +423,13 @@ def sql_injection_api_mode_example():
     # Execute in API mode
     executor = JourneyExecutor(
         journey, 
-        target_url="http://localhost:8000",
-        api_mode=True
+        target_url=TARGET_URL,
+        mode="API",
+        http_session=make_pooled_session(),
+        workers=min(MAX_WORKERS, len(SQL_BODY_PAYLOADS))
     )
-    result = executor.execute()
+    executor.run()
+    result = executor.was_successful()
     
     print(f"\nAPI Mode Result: {'PASSED' if result else 'FAILED'}")
     return result
@@ -263,11 +444,7 @@ def url_manipulation_api_mode_example():
     print("="*80)
     
     # SQL injection payloads
-    sql_payloads = StaticPayloadGenerator([
-        "' OR '1'='1",
-        "1' OR '1'='1' --",
-        "1 UNION SELECT NULL, NULL--"
-    ])
+    sql_payloads = StaticPayloadGenerator(SQL_URL_PAYLOADS)
     
     # Create TTP in API mode
     sql_ttp = URLManipulation(
@@ -291,7 +468,7 @@ def url_manipulation_api_mode_example():
     
     step.add_action(TTPAction(
         ttp=sql_ttp,
-        target_url="http://localhost:8000"
+        target_url=TARGET_URL
     ))
     
     journey.add_step(step)
@@ -299,15 +476,110 @@ def url_manipulation_api_mode_example():
     # Execute in API mode
     executor = JourneyExecutor(
         journey, 
-        target_url="http://localhost:8000",
-        api_mode=True
+        target_url=TARGET_URL,
+        mode="API",
+        http_session=make_pooled_session(),
+        workers=min(MAX_WORKERS, len(SQL_URL_PAYLOADS))
     )
-    result = executor.execute()
+    executor.run()
+    result = executor.was_successful()
     
     print(f"\nAPI Mode Result: {'PASSED' if result else 'FAILED'}")
     return result
 
 
+async def _send_batch(target_url, batch, max_in_flight):
+    """Send every (ttp, method, endpoint, request_kwargs) in one event loop."""
+    import httpx
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+
+    async with httpx.AsyncClient(base_url=target_url, timeout=10.0) as client:
+        async def send(ttp, method, endpoint, request_kwargs):
+            async with semaphore:
+                try:
+                    response = await client.request(method, endpoint, **request_kwargs)
+                except httpx.HTTPError:
+                    # Like TTPAction: a failed request counts as an unsuccessful payload
+                    return ttp, False
+            # verify_result_api only reads status_code and text, which httpx
+            # responses provide as well
+            return ttp, ttp.verify_result_api(response, {})
+
+        return await asyncio.gather(*(send(*item) for item in batch))
+
+
+def run_all_payloads_batched(max_in_flight=64):
+    """
+    Example: Examples 2, 4 and 5 as one concurrent batch
+
+    Instead of three journeys that each wait for their own payloads, every
+    payload from all three TTPs is queued up front and sent from a single
+    event loop, so the workloads overlap. The semaphore keeps at most
+    max_in_flight requests open to avoid overrunning the server's accept
+    queue. Requires: pip install httpx
+    """
+    print("\n" + "="*80)
+    print("Example 5b: Examples 2, 4 and 5 in one batch (async)")
+    print("="*80)
+
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "httpx is required for the batched example. "
+            "Install it with: pip install httpx"
+        )
+
+    json_headers = {'Content-Type': 'application/json'}
+    login_ttp = LoginBruteforceTTP(
+        payload_generator=StaticPayloadGenerator(LOGIN_PASSWORDS),
+        username='admin',
+        execution_mode='api',
+        success_indicators={
+            'status_code': 200,
+            'response_contains': 'token',
+            'response_not_contains': 'invalid'
+        },
+        expected_result=False
+    )
+    sql_ttp = InputFieldInjector(
+        payload_generator=StaticPayloadGenerator(SQL_BODY_PAYLOADS),
+        expected_result=False,
+        execution_mode='api'
+    )
+    url_ttp = URLManipulation(
+        payload_generator=StaticPayloadGenerator(SQL_URL_PAYLOADS),
+        expected_result=False,
+        execution_mode='api'
+    )
+
+    # (ttp, method, endpoint, build request kwargs from a payload)
+    workloads = [
+        (login_ttp, 'POST', '/api/auth/login',
+         lambda p: {'content': _json_dumps({'username': 'admin', 'password': p}),
+                    'headers': json_headers}),
+        (sql_ttp, 'POST', '/api/search',
+         lambda p: {'content': _json_dumps({'query': p}), 'headers': json_headers}),
+        (url_ttp, 'GET', '/api/items',
+         lambda p: {'params': {'id': p}}),
+    ]
+    batch = [
+        (ttp, method, endpoint, build(payload))
+        for ttp, method, endpoint, build in workloads
+        for payload in ttp.get_payloads()
+    ]
+
+    outcomes = asyncio.run(_send_batch(TARGET_URL, batch, max_in_flight))
+
+    results = {}
+    for ttp, _method, _endpoint, _build in workloads:
+        found = any(success for owner, success in outcomes if owner is ttp)
+        results[ttp.name] = found == ttp.expected_result
+        print(f"{ttp.name}: {'PASSED' if results[ttp.name] else 'FAILED'}")
+    return results
+
+
 def mixed_mode_with_authentication_example():
     """
     Example: Using API mode with authentication
@@ -348,7 +620,8 @@ def mixed_mode_with_authentication_example():
         description="Attempt bruteforce with authentication"
     )
     
-    password_gen = StaticPayloadGenerator(['wrong1', 'wrong2', 'wrong3'])
+    passwords = ['wrong1', 'wrong2', 'wrong3']
+    password_gen = StaticPayloadGenerator(passwords)
     
     login_ttp = LoginBruteforceTTP(
         payload_generator=password_gen,
@@ -362,7 +635,7 @@ def mixed_mode_with_authentication_example():
     
     ttp_step.add_action(TTPAction(
         ttp=login_ttp,
-        target_url="http://localhost:8000"
+        target_url=TARGET_URL
     ))
     
     journey.add_step(ttp_step)
@@ -370,10 +643,12 @@ def mixed_mode_with_authentication_example():
     # Execute in API mode
     executor = JourneyExecutor(
         journey, 
-        target_url="http://localhost:8000",
-        api_mode=True
+        target_url=TARGET_URL,
+        mode="API",
+        workers=min(MAX_WORKERS, len(passwords))
     )
-    result = executor.execute()
+    executor.run()
+    result = executor.was_successful()
     
     print(f"\nAuthenticated API Mode Result: {'PASSED' if result else 'FAILED'}")
     return result
@@ -422,13 +697,54 @@ def migration_comparison():
     print("\nBoth modes test the same security control, just at different layers!")
 
 
+# API-mode examples share no state, so they can run side by side.
+API_MODE_EXAMPLES = (
+    login_bruteforce_api_mode_example,
+    sql_injection_api_mode_example,
+    url_manipulation_api_mode_example,
+    mixed_mode_with_authentication_example,
+)
+
+
+def _run_example(example):
+    """Run one example in a worker process and return (name, result)."""
+    return example.__name__, example()
+
+
+def run_all_examples(examples=API_MODE_EXAMPLES, max_workers=None):
+    """
+    Run independent examples concurrently, one worker process per example.
+
+    Each example builds its own Journey and JourneyExecutor inside its worker
+    process, so nothing is shared between them. Total wall-clock time is
+    roughly that of the slowest example rather than the sum of all of them.
+
+    Note: the target server must handle concurrent connections. Start
+    examples/test_server_with_version.py with --workers N (N processes
+    sharing the port); with a single worker it serves one request at a time
+    and serializes the requests again.
+
+    Args:
+        examples: Example functions to run (must be module-level functions)
+        max_workers: Number of worker processes (defaults to one per example)
+
+    Returns:
+        Dict mapping example name to its result
+    """
+    examples = list(examples)
+    if not examples:
+        return {}
+    with ProcessPoolExecutor(max_workers=max_workers or len(examples)) as pool:
+        return dict(pool.map(_run_example, examples))
+
+
 if __name__ == '__main__':
     print("\n" + "="*80)
     print("TTP API Mode Demo")
     print("="*80)
     print("\nThis demo shows how to use TTPs in both UI and API modes.")
     print("API mode allows you to bypass Selenium and test backend APIs directly.")
-    print("\nNOTE: These examples assume a test server is running on localhost:8000")
+    print(f"\nNOTE: These examples assume a test server is running on {TARGET_URL}")
     print("See examples/test_server_with_version.py for a test server.")
     print("="*80)
     
@@ -440,11 +756,19 @@ if __name__ == '__main__':
     
     # Uncomment to run actual tests:
     # login_bruteforce_ui_mode_example()
-    # login_bruteforce_api_mode_example()
     # sql_injection_ui_mode_example()
-    # sql_injection_api_mode_example()
-    # url_manipulation_api_mode_example()
-    # mixed_mode_with_authentication_example()
+    #
+    # API-mode examples run concurrently, one process each:
+    # for name, passed in run_all_examples().items():
+    #     print(f"{name}: {'PASSED' if passed else 'FAILED'}")
+    #
+    # Or send every bruteforce payload at once over HTTP/2 (needs httpx):
+    # login_bruteforce_api_mode_example_async()
+    # ...or over a pooled aiohttp session (needs aiohttp):
+    # login_bruteforce_api_mode_example_aiohttp()
+    #
+    # Or send the payloads of examples 2, 4 and 5 as one batch (needs httpx):
+    # run_all_payloads_batched()
     
     print("\n" + "="*80)
     print("Demo Complete!")
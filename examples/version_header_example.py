@@ -13,19 +13,71 @@ Scythe will then extract this header and include it in test output so you can
 see which version of your web application is being tested.
 """
 
+import asyncio
+import functools
 import sys
 import os
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
 
 # Add the parent directory to the path so we can import scythe
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from scythe.core.ttp import TTP
-from scythe.core.executor import TTPExecutor
+from scythe.core.headers import HeaderExtractor
 from scythe.journeys.base import Journey, Step
 from scythe.journeys.actions import NavigateAction, AssertAction
 from scythe.journeys.executor import JourneyExecutor
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
-from typing import Generator, Any
+from typing import Generator, Any, Dict, List, Optional
+
+
+class PageResultCache:
+    """
+    LRU of (loaded, version) per absolute URL.
+
+    Shared by the TTP and journey examples so a page one of them has already
+    checked is not loaded in a browser again. Only results are stored, never
+    drivers, so entries outlive the executors that produced them.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.enabled = True
+        self._results: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        # "http://host" and "http://host/" are the same page
+        parsed = urlparse(url)
+        return parsed._replace(path=parsed.path or "/").geturl()
+
+    def get(self, url: str) -> Optional[tuple]:
+        if not self.enabled:
+            return None
+        key = self._key(url)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def put(self, url: str, result: tuple) -> None:
+        if not self.enabled:
+            return
+        key = self._key(url)
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+
+PAGE_RESULTS = PageResultCache()
 
 
 class VersionTestTTP(TTP):
@@ -53,34 +105,174 @@ class VersionTestTTP(TTP):
             "/dashboard"
         ]
         
-        for path in paths:
-            yield path
+        # dict.fromkeys drops repeated paths while keeping their order
+        yield from dict.fromkeys(paths)
     
     def execute_step(self, driver: WebDriver, payload: Any) -> None:
         """Navigate to the URL path."""
         current_url = driver.current_url
-        base_url = current_url.split('/', 3)[:3]  # Get protocol://domain
-        target_url = '/'.join(base_url) + str(payload)
+        base_url = '/'.join(current_url.split('/', 3)[:3])  # Get protocol://domain
+        self.visit(driver, base_url, payload)
+
+    @staticmethod
+    def page_url(base_url: str, payload: Any) -> str:
+        """Return the absolute URL for a payload path."""
+        return base_url.rstrip('/') + str(payload)
+
+    def visit(self, driver: WebDriver, base_url: str, payload: Any) -> str:
+        """Navigate the given driver to payload relative to base_url; return the URL."""
+        target_url = self.page_url(base_url, payload)
         
         print(f"Navigating to: {target_url}")
         driver.get(target_url)
+        return target_url
     
+    # One round trip for everything verify_result needs, plus an optional
+    # <meta name="x-scythe-target-version"> that pages may use to expose the
+    # version without relying on browser performance logs
+    PAGE_STATE_SCRIPT = (
+        "var meta = document.querySelector('meta[name=x-scythe-target-version]');"
+        "return [document.title, document.readyState, meta ? meta.content : null];"
+    )
+
+    def inspect_page(self, driver: WebDriver) -> tuple:
+        """Return (loaded successfully, version from meta tag or None) for the current page."""
+        try:
+            title, ready_state, meta_version = driver.execute_script(self.PAGE_STATE_SCRIPT)
+        except Exception:
+            return False, None
+        loaded = bool(title) and "404" not in title.lower() and ready_state != "loading"
+        return loaded, meta_version or None
+
     def verify_result(self, driver: WebDriver) -> bool:
         """Check if the page loaded successfully."""
+        return self.inspect_page(driver)[0]
+
+
+class WebDriverPool:
+    """
+    Bounded pool of headless Chrome drivers for concurrent page visits.
+
+    Drivers are started lazily, so a run never launches more browsers than
+    it has visits in flight, and are kept warm until close() is called.
+    """
+
+    def __init__(self, size: int = 5, headless: bool = True):
+        self.size = size
+        self.options = Options()
+        if headless:
+            self.options.add_argument("--headless")
+        self.options.add_argument("--no-sandbox")
+        self.options.add_argument("--disable-dev-shm-usage")
+        # Same capabilities TTPExecutor enables, so version headers can be read
+        HeaderExtractor.enable_logging_for_driver(self.options)
+        self._drivers: List[WebDriver] = []
+        self._idle: List[WebDriver] = []
+        self._available = None
+
+    async def acquire(self) -> WebDriver:
+        """Return an idle driver, starting a new one if the pool isn't full."""
+        if self._available is None:
+            self._available = asyncio.Semaphore(self.size)
+        await self._available.acquire()
+        if self._idle:
+            return self._idle.pop()
+        loop = asyncio.get_running_loop()
         try:
-            # Simple check: page title exists and page loaded
-            title = driver.title
-            return len(title) > 0 and "404" not in title.lower()
+            driver = await loop.run_in_executor(
+                None, functools.partial(webdriver.Chrome, options=self.options)
+            )
         except Exception:
-            return False
+            # No driver to hand back later, so give the permit back now
+            self._available.release()
+            raise
+        self._drivers.append(driver)
+        return driver
 
+    def get_driver(self) -> WebDriver:
+        """Return a warm driver for synchronous use, starting one if none exists yet."""
+        if self._drivers:
+            driver = self._drivers[0]
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                pass
+            return driver
+        driver = webdriver.Chrome(options=self.options)
+        self._drivers.append(driver)
+        self._idle.append(driver)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Hand a driver back to the pool, clearing cookies left by its last visit."""
+        try:
+            driver.delete_all_cookies()
+        except Exception:
+            pass
+        self._idle.append(driver)
+        self._available.release()
 
-def run_ttp_example(target_url: str) -> bool:
+    def close(self) -> None:
+        """Quit every driver the pool started."""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers.clear()
+        self._idle.clear()
+        self._available = None
+
+
+async def _visit_all(version_ttp: VersionTestTTP, target_url: str,
+                     pool: WebDriverPool) -> List[Dict[str, Any]]:
+    """Visit every payload path concurrently, one pooled driver per visit."""
+    extractor = HeaderExtractor()
+    loop = asyncio.get_running_loop()
+
+    def visit_and_verify(driver: WebDriver, path: Any) -> Dict[str, Any]:
+        url = version_ttp.visit(driver, target_url, path)
+        success, version = version_ttp.inspect_page(driver)
+        if success and version is None:
+            version = extractor.extract_target_version(driver, url)
+        PAGE_RESULTS.put(url, (success, version))
+        return {"payload": path, "url": url, "actual": success, "target_version": version}
+
+    async def visit(path: Any) -> Dict[str, Any]:
+        url = version_ttp.page_url(target_url, path)
+        cached = PAGE_RESULTS.get(url)
+        if cached is not None:
+            success, version = cached
+            return {"payload": path, "url": url, "actual": success, "target_version": version}
+        driver = None
+        try:
+            # Inside the try, so a browser that fails to start is reported
+            # like any other failed visit instead of aborting the gather
+            driver = await pool.acquire()
+            return await loop.run_in_executor(None, visit_and_verify, driver, path)
+        except Exception as e:
+            print(f"Error visiting {path}: {e}")
+            return {"payload": path, "url": None, "actual": False, "target_version": None}
+        finally:
+            if driver is not None:
+                pool.release(driver)
+
+    return await asyncio.gather(*[visit(path) for path in version_ttp.get_payloads()])
+
+
+def run_ttp_example(target_url: str, max_concurrency: int = 5,
+                    pool: WebDriverPool = None) -> bool:
     """
     Run a TTP test that demonstrates version header extraction.
+
+    Paths are visited concurrently across a pool of up to max_concurrency
+    headless browsers instead of one after another in a single browser.
     
     Args:
         target_url: URL of the target web application
+        max_concurrency: Maximum number of browsers visiting pages at once
+            (ignored when pool is given)
+        pool: Optional WebDriverPool to reuse; it is left open afterwards
         
     Returns:
         True if all test results matched expectations, False otherwise
@@ -99,27 +291,69 @@ def run_ttp_example(target_url: str) -> bool:
     print("  X-SCYTHE-TARGET-VERSION: 1.3.2")
     print()
     
-    # Create and run the TTP
+    # Create the TTP and visit its paths through the pool
     version_ttp = VersionTestTTP()
-    executor = TTPExecutor(
-        ttp=version_ttp,
-        target_url=target_url,
-        headless=True,
-        delay=1
-    )
-    
-    executor.run()
+    own_pool = pool is None
+    if own_pool:
+        pool = WebDriverPool(size=max_concurrency)
+    try:
+        results = asyncio.run(_visit_all(version_ttp, target_url, pool))
+    finally:
+        if own_pool:
+            pool.close()
+
+    for result in results:
+        status = "OK " if result["actual"] else "FAIL"
+        version = result["target_version"] or "not detected"
+        print(f"  [{status}] {result['payload']} | Version: {version}")
+
+    summary = HeaderExtractor().get_version_summary(results)
+    print(f"\nVersion detected in {summary['results_with_version']}/{summary['total_results']} results")
+    for version, count in summary["version_counts"].items():
+        print(f"  Version {version}: {count} times")
     
-    # Return whether the test was successful
-    return executor.was_successful()
+    # Successful when every visit matched the TTP's expectation
+    return all(r["actual"] == version_ttp.expected_result for r in results)
 
 
-def run_journey_example(target_url: str) -> bool:
+class CachedStep(Step):
+    """
+    Step that is skipped as a whole when PAGE_RESULTS already saw its page load.
+
+    On a cache hit none of the step's actions run, so neither the navigation
+    nor any assertions about the page are checked against a stale page; the
+    cached outcome and version are reported instead. On a miss the step runs
+    as usual. Pass --no-cache to load and check every page.
+    """
+
+    def __init__(self, url: str, name: str, description: str):
+        super().__init__(name=name, description=description)
+        self.url = url
+
+    def execute(self, driver: WebDriver, context: Dict[str, Any]) -> bool:
+        actual_url = self.url.format(**context)
+        cached = PAGE_RESULTS.get(actual_url)
+        if cached is None or not cached[0]:
+            return super().execute(driver, context)
+        version = cached[1]
+        print(f"Cached: {actual_url} | Version: {version or 'not detected'}")
+        self.execution_results = []
+        self.step_data = {}
+        if version:
+            context["target_version"] = version
+        self.store_data("cached", True)
+        self.store_data("target_version", version)
+        return True
+
+
+def run_journey_example(target_url: str, driver: WebDriver = None) -> bool:
     """
     Run a Journey test that demonstrates version header extraction.
     
     Args:
         target_url: URL of the target web application
+        driver: Optional already-running WebDriver to use instead of
+            starting a new browser; it is left running afterwards
         
     Returns:
         True if journey succeeded as expected, False otherwise
@@ -138,7 +372,8 @@ def run_journey_example(target_url: str) -> bool:
     )
     
     # Step 1: Home page
-    home_step = Step(
+    home_step = CachedStep(
+        url=target_url,
         name="Visit Home Page",
         description="Navigate to application home page"
     )
@@ -147,8 +382,9 @@ def run_journey_example(target_url: str) -> bool:
     journey.add_step(home_step)
     
     # Step 2: About page
-    about_step = Step(
-        name="Visit About Page", 
+    about_step = CachedStep(
+        url=f"{target_url}/about",
+        name="Visit About Page",
         description="Navigate to about page"
     )
     about_step.add_action(NavigateAction(url=f"{target_url}/about"))
@@ -156,7 +392,8 @@ def run_journey_example(target_url: str) -> bool:
     journey.add_step(about_step)
     
     # Step 3: API endpoint
-    api_step = Step(
+    api_step = CachedStep(
+        url=f"{target_url}/api/health",
         name="Check API Endpoint",
         description="Navigate to API health endpoint"
     )
@@ -167,7 +404,8 @@ def run_journey_example(target_url: str) -> bool:
     executor = JourneyExecutor(
         journey=journey,
         target_url=target_url,
-        headless=True
+        headless=True,
+        driver=driver
     )
     
     result = executor.run()
@@ -196,24 +434,33 @@ def main():
     # Default target URL - change this to your application
     default_url = "http://localhost:8080"
     
-    if len(sys.argv) > 1:
-        target_url = sys.argv[1]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if "--no-cache" in sys.argv[1:]:
+        # Load every page in the browser even if another example already did
+        PAGE_RESULTS.enabled = False
+    
+    if args:
+        target_url = args[0]
     else:
         target_url = default_url
         print(f"No URL provided, using default: {default_url}")
-        print("Usage: python version_header_example.py <target_url>")
+        print("Usage: python version_header_example.py <target_url> [--no-cache]")
         print()
     
     # Track overall success
     all_tests_passed = True
+
+    # One set of browsers for both examples: the journey reuses a driver the
+    # TTP example already warmed up instead of cold-starting its own
+    pool = WebDriverPool()
     
     try:
         # Run TTP example
-        ttp_success = run_ttp_example(target_url)
+        ttp_success = run_ttp_example(target_url, pool=pool)
         all_tests_passed = all_tests_passed and ttp_success
         
         # Run Journey example
-        journey_success = run_journey_example(target_url)
+        journey_success = run_journey_example(target_url, driver=pool.get_driver())
         all_tests_passed = all_tests_passed and journey_success
         
         print("\n" + "="*60)
@@ -247,6 +494,8 @@ def main():
         print(f"\nError running example: {e}")
         print("Make sure the target URL is accessible and try again.")
         sys.exit(1)
+    finally:
+        pool.close()
 
 
 if __name__ == "__main__":
@@ -6,10 +6,21 @@ authenticate before executing their main functionality.
 """
 
 from .base import Authentication
-from .bearer import BearerTokenAuth
-from .basic import BasicAuth
 from .cookie_jwt import CookieJWTAuth
 
+
+def __getattr__(name):
+    # The form-filling auth classes need selenium at import time; load them on
+    # first use so API-only CookieJWTAuth users don't pay for it
+    if name == "BearerTokenAuth":
+        from .bearer import BearerTokenAuth
+        return BearerTokenAuth
+    if name == "BasicAuth":
+        from .basic import BasicAuth
+        return BasicAuth
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'Authentication',
     'BearerTokenAuth', 
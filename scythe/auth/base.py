@@ -1,8 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, TYPE_CHECKING
-from selenium.webdriver.remote.webdriver import WebDriver
 
 if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
     from ..core.csrf import CSRFProtection
 
 
@@ -109,6 +111,15 @@ class Authentication(ABC):
         """
         self.auth_data[key] = value
     
+    def store_auth_data_bulk(self, kv: Dict[str, Any]) -> None:
+        """
+        Store several authentication-related values in one update.
+        
+        Args:
+            kv: Mapping of keys to the values to store under them
+        """
+        self.auth_data.update(kv)
+    
     def get_auth_data(self, key: str, default: Any = None) -> Any:
         """
         Retrieve authentication-related data.
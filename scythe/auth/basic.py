@@ -119,8 +119,7 @@ class BasicAuth(Authentication):
             # Check if authentication was successful
             if self._check_authentication_result(driver):
                 self.authenticated = True
-                self.store_auth_data('username', self.username)
-                self.store_auth_data('login_time', time.time())
+                self.store_auth_data_bulk({'username': self.username, 'login_time': time.time()})
                 return True
             else:
                 raise AuthenticationError("Authentication failed - invalid credentials or login error")
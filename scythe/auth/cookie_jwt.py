@@ -1,49 +1,313 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import logging
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Any, TYPE_CHECKING
 from urllib.parse import urlparse
 
 try:
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter
+    from requests.structures import CaseInsensitiveDict
+    from urllib3.util.request import ACCEPT_ENCODING as _ACCEPT_ENCODING
+    from urllib3.util.retry import Retry
 except Exception:  # pragma: no cover - tests may run without requests installed
     requests = None  # type: ignore
-from selenium.webdriver.remote.webdriver import WebDriver
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:  # stdlib parser when orjson isn't installed
+    _json_loads = json.loads
 
 from .base import Authentication, AuthenticationError
 
 if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
     from ..core.csrf import CSRFProtection
 
+logger = logging.getLogger(__name__)
 
-def _extract_by_dot_path(data: Any, path: str) -> Optional[Any]:
+
+# Process-wide login token cache shared by all CookieJWTAuth instances:
+# {cache key: (token, login_time)}
+_TOKEN_CACHE: Dict[tuple, tuple] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Connection pool shared by the sessions CookieJWTAuth creates, so repeated
+# logins to the same host reuse kept-alive connections instead of paying a
+# new TCP/TLS handshake. Only the adapter is shared: each instance keeps its
+# own cookie jar.
+_SHARED_ADAPTER = (
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    if requests is not None
+    else None
+)
+
+
+def _pooled_session(cookies: Any = None) -> "requests.Session":
+    """Create a session whose connections come from the shared pool."""
+    session = requests.Session()
+    if cookies is not None:
+        session.cookies = cookies
+    session.mount("https://", _SHARED_ADAPTER)
+    session.mount("http://", _SHARED_ADAPTER)
+    return session
+
+
+def _close_response(resp: Any) -> None:
+    """Close a login response, if it supports it, to return its connection."""
+    close = getattr(resp, "close", None)
+    if close is not None:
+        close()
+
+
+# Pages kept per CookieJWTAuth instance for CSRF GET revalidation (see
+# _conditional_get). Per instance, since a page's headers and body belong to
+# the session (cookie jar) that fetched it.
+_PAGE_CACHE_SIZE = 64
+
+
+class _CachedPageResponse:
+    """Answer to a 304 revalidation: the cached page with refreshed headers."""
+
+    def __init__(self, response: Any, headers: Dict[str, str], content: bytes):
+        self.status_code = 200
+        self.url = getattr(response, "url", None)
+        self.cookies = response.cookies
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return _json_loads(self.content)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _is_shareable_page(headers: Any) -> bool:
+    """True if a page may be kept for revalidation by the session that fetched it."""
+    cache_control = (headers.get("Cache-Control") or "").lower()
+    if "no-store" in cache_control or "private" in cache_control:
+        return False
+    vary = (headers.get("Vary") or "").lower()
+    return "cookie" not in vary and "*" not in vary
+
+
+def _conditional_get(
+    session: Any, url: str, cache: "OrderedDict[str, tuple]", timeout: float = 15
+) -> Any:
     """
-    Extract a value from a nested dict/list structure using a simple dot path.
-    Supports numeric indices for lists, e.g., "data.items.0.token".
+    GET url, reusing the cached body when the server answers 304 Not Modified.
+
+    cache maps url -> (etag, last_modified, headers, content) and must belong
+    to the session's owner. Set-Cookie is never stored, so a 304 carries only
+    the cookies the server sends with it.
+    """
+    with _CACHE_LOCK:
+        cached = cache.get(url)
+        if cached is not None:
+            cache.move_to_end(url)
+
+    validators = {}
+    if cached is not None:
+        etag, last_modified = cached[0], cached[1]
+        if etag:
+            validators["If-None-Match"] = etag
+        if last_modified:
+            validators["If-Modified-Since"] = last_modified
+
+    if validators:
+        resp = session.get(url, headers=validators, timeout=timeout)
+    else:
+        resp = session.get(url, timeout=timeout)
+
+    if cached is not None and resp.status_code == 304:
+        headers = CaseInsensitiveDict(cached[2])
+        headers.update(resp.headers)
+        return _CachedPageResponse(resp, headers, cached[3])
+
+    resp_headers = getattr(resp, "headers", None) or {}
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if (
+        resp.status_code == 200
+        and (isinstance(etag, str) or isinstance(last_modified, str))
+        and _is_shareable_page(resp_headers)
+    ):
+        headers = {
+            k: v for k, v in resp_headers.items() if k.lower() != "set-cookie"
+        }
+        with _CACHE_LOCK:
+            cache[url] = (
+                etag if isinstance(etag, str) else None,
+                last_modified if isinstance(last_modified, str) else None,
+                headers,
+                resp.content,
+            )
+            cache.move_to_end(url)
+            while len(cache) > _PAGE_CACHE_SIZE:
+                cache.popitem(last=False)
+    return resp
+
+
+def _parse_json_body(resp: Any) -> Any:
+    """Parse a response body as JSON, with orjson when it is installed."""
+    content = getattr(resp, "content", None)
+    if isinstance(content, (bytes, bytearray, str)):
+        return _json_loads(content)
+    # Response-like objects without raw content (e.g. test doubles)
+    return resp.json()
+
+
+def _http2_client() -> Optional[Any]:
+    """Create an HTTP/2 httpx.Client, or return None if httpx isn't installed."""
+    try:
+        import httpx  # type: ignore
+    except ImportError:
+        logger.warning(
+            "httpx is required for http2=True; falling back to requests. "
+            "Install it with: pip install 'scythe-ttp[http2]'"
+        )
+        return None
+    return httpx.Client(
+        http2=True,
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    )
+
+
+def _compile_dot_path(path: str) -> tuple:
+    """
+    Pre-parse a dot path into (key, list_index) pairs for _extract_by_parts.
+
+    list_index is the segment as an int, or None if it isn't numeric.
     """
     if not path:
+        return ()
+    parts = []
+    for part in path.split("."):
+        try:
+            index: Optional[int] = int(part)
+        except ValueError:
+            index = None
+        parts.append((part, index))
+    return tuple(parts)
+
+
+def _extract_by_parts(data: Any, parts: tuple) -> Optional[Any]:
+    """Walk a nested dict/list structure along a path from _compile_dot_path."""
+    if not parts:
         return None
-    parts = path.split(".")
     current: Any = data
-    for part in parts:
+    for key, index in parts:
         if isinstance(current, dict):
-            if part in current:
-                current = current[part]
-            else:
-                return None
-        elif isinstance(current, list):
             try:
-                idx = int(part)
-            except ValueError:
+                current = current[key]
+            except KeyError:
                 return None
-            if idx < 0 or idx >= len(current):
+        elif isinstance(current, list):
+            if index is None or index < 0 or index >= len(current):
                 return None
-            current = current[idx]
+            current = current[index]
         else:
             return None
     return current
 
 
+def _extract_by_dot_path(data: Any, path: str) -> Optional[Any]:
+    """
+    Extract a value from a nested dict/list structure using a simple dot path.
+    Supports numeric indices for lists, e.g., "data.items.0.token".
+    """
+    return _extract_by_parts(data, _compile_dot_path(path))
+
+
+# One aiohttp session per event loop, shared by every async login on it. It
+# keeps no cookies, so logins for different users never see each other's.
+# {id(loop): (loop, session, closer task)}. Keyed by id because the session
+# holds a strong reference to its loop, so a weak key would never be dropped;
+# the closer task removes the entry instead.
+_AIOHTTP_SESSIONS: Dict[int, tuple] = {}
+
+
+def _aiohttp_session() -> Any:
+    """Return this event loop's shared aiohttp.ClientSession, creating it if needed."""
+    try:
+        import aiohttp  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "aiohttp is required for async logins. "
+            "Install it with: pip install 'scythe-ttp[aiohttp]'"
+        )
+    loop = asyncio.get_running_loop()
+    entry = _AIOHTTP_SESSIONS.get(id(loop))
+    if entry is not None and entry[0] is loop and not entry[1].closed:
+        return entry[1]
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+        cookie_jar=aiohttp.DummyCookieJar(),
+        timeout=aiohttp.ClientTimeout(total=15),
+    )
+    closer = loop.create_task(_close_on_shutdown(loop, session))
+    _AIOHTTP_SESSIONS[id(loop)] = (loop, session, closer)
+    return session
+
+
+async def _close_on_shutdown(loop: Any, session: Any) -> None:
+    """
+    Wait until cancelled, then close session and forget it.
+
+    asyncio.run() cancels the tasks still pending when its main coroutine
+    returns, so the session is closed before the loop is.
+    """
+    try:
+        await loop.create_future()
+    finally:
+        entry = _AIOHTTP_SESSIONS.get(id(loop))
+        if entry is not None and entry[1] is session:
+            del _AIOHTTP_SESSIONS[id(loop)]
+        await session.close()
+
+
+async def close_async_sessions() -> None:
+    """
+    Close the shared aiohttp session of the running event loop, if any.
+
+    Loops run with asyncio.run() close it on their own when they finish;
+    call this on loops you manage yourself, before closing them.
+    """
+    entry = _AIOHTTP_SESSIONS.pop(id(asyncio.get_running_loop()), None)
+    if entry is not None:
+        _, session, closer = entry
+        closer.cancel()
+        await asyncio.gather(closer, return_exceptions=True)
+        # A closer cancelled before it first ran never reaches its finally
+        await session.close()
+
+
+def _same_netloc(driver: WebDriver, netloc: str) -> bool:
+    """True if the browser's current page is already on netloc."""
+    try:
+        current = driver.current_url
+    except Exception:
+        return False
+    return isinstance(current, str) and urlparse(current).netloc == netloc
+
+
 class CookieJWTAuth(Authentication):
     """
     Hybrid authentication where a JWT is acquired from an API login response and
@@ -63,6 +327,20 @@ class CookieJWTAuth(Authentication):
     - jwt_source: Either "json" (default) to extract JWT from the JSON response body
       using jwt_json_path, or "cookie" to extract it from the Set-Cookie response header
       using cookie_name.
+    - session: Optional requests.Session for the login requests. By default
+      each instance gets one session per thread that uses it, drawing
+      connections from a pool shared by all instances; all of an instance's
+      sessions share one cookie jar. Pass a session to control pooling
+      yourself (it is then used by every thread).
+    - http2: Send the login requests with an HTTP/2 httpx.Client instead of
+      requests, so the CSRF/session GET and the login POST are multiplexed on
+      one connection. Ignored when a session is passed; falls back to requests
+      if httpx is not installed.
+    - token_ttl: Seconds a login token is shared with other instances that use
+      the same login URL, credentials and extraction settings, so repeated
+      runs don't log in again. 0 or None disables sharing. Logins that go
+      through CSRF or a session_endpoint are never shared, since they depend
+      on cookies held by this instance's session.
     """
 
     def __init__(
@@ -81,6 +359,8 @@ class CookieJWTAuth(Authentication):
         description: str = "Authenticate via API and set JWT cookie",
         csrf_protection: Optional["CSRFProtection"] = None,
         session_endpoint: Optional[str] = None,
+        token_ttl: Optional[float] = 300.0,
+        http2: bool = False,
     ):
         super().__init__(
             name="Cookie JWT Authentication",
@@ -95,22 +375,202 @@ class CookieJWTAuth(Authentication):
         self.password_field = password_field
         self.extra_fields = extra_fields or {}
         self.jwt_json_path = jwt_json_path
+        self._jwt_path_parts = _compile_dot_path(jwt_json_path)
         self.cookie_name = cookie_name
         self.content_type = content_type
         self.jwt_source = jwt_source
-        # Avoid importing requests in test environments; allow injected session
-        self._session = session or (
-            requests.Session() if requests is not None else None
+        if session is None and http2:
+            # httpx.Client mirrors the requests.Session calls used below
+            session = _http2_client()
+        # An injected session is used as-is by every thread; otherwise each
+        # thread lazily gets its own pooled session (see _session), all on
+        # this instance's cookie jar
+        self._given_session = session
+        self._tls = threading.local()
+        self._cookies = (
+            requests.cookies.RequestsCookieJar() if requests is not None else None
         )
+        self.token_ttl = token_ttl
         self.token: Optional[str] = None
+        # Origin sent with CSRF logins, and parsed target URLs for authenticate()
+        parsed_login = urlparse(login_url)
+        self._login_origin = f"{parsed_login.scheme}://{parsed_login.netloc}"
+        self._url_cache: Dict[str, tuple] = {}
+        # CSRF pages this instance's session fetched, for conditional GETs
+        self._page_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @property
+    def _session(self) -> Any:
+        """
+        Session used for login requests.
+
+        Without an injected session, each thread gets its own, so parallel
+        workers sharing this instance don't contend on one connection pool.
+        The sessions share the instance's cookie jar, so cookies set during a
+        login on one thread (e.g. the CSRF cookie) are seen on every other.
+        """
+        if self._given_session is not None:
+            return self._given_session
+        session = getattr(self._tls, "session", None)
+        if session is None and requests is not None:
+            session = self._tls.session = _pooled_session(self._cookies)
+        return session
+
+    @_session.setter
+    def _session(self, session: Any) -> None:
+        self._given_session = session
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Per-thread sessions aren't copied (orchestrators deepcopy TTPs per run)
+        state = self.__dict__.copy()
+        del state["_tls"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._tls = threading.local()
+
+    def _cache_key(self) -> Optional[tuple]:
+        """Key this instance's login in the shared token cache, or None if not shareable."""
+        if not self.token_ttl or self.csrf_protection or self.session_endpoint:
+            return None
+        return (
+            self.login_url,
+            self.username,
+            hashlib.sha256((self.password or "").encode("utf-8")).digest(),
+            repr(sorted(self.extra_fields.items())),
+            self.content_type,
+            self.jwt_source,
+            self.jwt_json_path if self.jwt_source != "cookie" else self.cookie_name,
+        )
+
+    @classmethod
+    def invalidate_cache(cls, key: Optional[tuple] = None) -> None:
+        """
+        Evict a cached login token, or every cached token if key is None.
+
+        Call this when a server rejects a cached token (e.g. with a 401) so
+        the next login goes back to the server.
+        """
+        with _CACHE_LOCK:
+            if key is None:
+                _TOKEN_CACHE.clear()
+            else:
+                _TOKEN_CACHE.pop(key, None)
 
     def _login_and_get_token(self) -> str:
+        key = self._cache_key()
+        token = self._use_cached_token(key)
+        if token is not None:
+            return token
+
+        token = self._login()
+        self._remember_token(key, token)
+        return token
+
+    async def _login_and_get_token_async(self) -> str:
+        """
+        Async counterpart of _login_and_get_token for concurrent logins.
+
+        Plain logins are sent on a shared aiohttp session. CSRF and
+        session_endpoint logins need this instance's session cookies, so they
+        run the synchronous flow in a worker thread instead; its cookies land
+        in the instance's shared jar.
+        """
+        key = self._cache_key()
+        token = self._use_cached_token(key)
+        if token is not None:
+            return token
+
+        if self.csrf_protection or self.session_endpoint:
+            # run_in_executor rather than asyncio.to_thread, which needs 3.9+
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._login_and_get_token
+            )
+
+        session = _aiohttp_session()
+        payload = {
+            **self.extra_fields,
+            self.username_field: self.username,
+            self.password_field: self.password,
+        }
+        body = {"data": payload} if self.content_type == "form" else {"json": payload}
+        if self.jwt_source == "cookie":
+            body["headers"] = {"Accept-Encoding": "identity"}
+        try:
+            async with session.post(self.login_url, **body) as resp:
+                resp.raise_for_status()
+                if self.jwt_source == "cookie":
+                    morsel = resp.cookies.get(self.cookie_name)
+                    raw_token = morsel.value if morsel is not None else None
+                else:
+                    content = await resp.read()
+        except Exception as e:
+            raise AuthenticationError(f"Login request failed: {e}", self.name)
+
+        if self.jwt_source == "cookie":
+            token = self._jwt_from_cookie(raw_token)
+        else:
+            try:
+                data = _json_loads(content)
+            except Exception as e:
+                raise AuthenticationError(
+                    f"Failed to parse JSON response: {e}", self.name
+                )
+            token = self._jwt_from_json(data)
+
+        self.token = token
+        self.store_auth_data_bulk({"jwt": token, "login_time": time.time()})
+        self._remember_token(key, token)
+        return token
+
+    def _use_cached_token(self, key: Optional[tuple]) -> Optional[str]:
+        """Adopt a still-valid token from the shared cache, if there is one."""
+        if key is None:
+            return None
+        with _CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(key)
+        if cached is None or time.time() - cached[1] >= self.token_ttl:
+            return None
+        token, login_time = cached
+        self.token = token
+        self.store_auth_data_bulk({"jwt": token, "login_time": login_time})
+        return token
+
+    def _remember_token(self, key: Optional[tuple], token: str) -> None:
+        """Share a freshly obtained token through the cache."""
+        if key is not None:
+            with _CACHE_LOCK:
+                _TOKEN_CACHE[key] = (token, self.get_auth_data("login_time"))
+
+    def _jwt_from_cookie(self, token: Any) -> str:
+        """Validate a JWT taken from the login response's cookies."""
+        if not token or not isinstance(token, str):
+            raise AuthenticationError(
+                f"JWT cookie '{self.cookie_name}' not found in login response",
+                self.name,
+            )
+        return token
+
+    def _jwt_from_json(self, data: Any) -> str:
+        """Extract and validate the JWT from a parsed login response body."""
+        token = _extract_by_parts(data, self._jwt_path_parts)
+        if not token or not isinstance(token, str):
+            raise AuthenticationError(
+                f"JWT not found at path '{self.jwt_json_path}' in login response",
+                self.name,
+            )
+        return token
+
+    def _login(self) -> str:
+        """POST the credentials to login_url and extract the JWT."""
         # Import here to avoid circular imports
         from ..core.csrf import CSRFProtection
 
         # Create auth context for CSRF
         context = {}
-        headers = {}
+        csrf_endpoint = None
+        used_cached_csrf = False
 
         # If CSRF protection is configured, get initial CSRF token
         if isinstance(self.csrf_protection, CSRFProtection):
@@ -120,14 +580,19 @@ class CookieJWTAuth(Authentication):
             csrf_endpoint = (
                 self.session_endpoint if self.session_endpoint else self.login_url
             )
-            try:
-                resp = self._session.get(csrf_endpoint, timeout=15)
-                # Extract CSRF token from the GET response
-                self.csrf_protection.extract_token(
-                    response=resp, session=self._session, context=context
+            # A still-valid token from an earlier response on this session makes
+            # the GET unnecessary. Not with a session_endpoint: its GET also
+            # establishes the server-side session the login depends on.
+            cached_csrf = None
+            if not self.session_endpoint:
+                cached_csrf = self.csrf_protection.get_cached_token(
+                    csrf_endpoint, session=self._session
                 )
-            except Exception as e:
-                raise AuthenticationError(f"Failed to get CSRF token: {e}", self.name)
+            if cached_csrf:
+                context["csrf_token"] = cached_csrf
+                used_cached_csrf = True
+            else:
+                self._fetch_csrf_token(csrf_endpoint, context)
         elif self.session_endpoint:
             # No CSRF, but session_endpoint is set - just establish the session
             try:
@@ -138,14 +603,93 @@ class CookieJWTAuth(Authentication):
                     self.name,
                 )
 
-        payload: Dict[str, Any] = dict(self.extra_fields)
-        payload[self.username_field] = self.username
-        payload[self.password_field] = self.password
+        resp = None
+        try:
+            try:
+                resp = self._post_credentials(context)
+                if used_cached_csrf and resp.status_code in (403, 419):
+                    # The reused CSRF token was rejected: fetch a fresh one, retry once
+                    _close_response(resp)
+                    self.csrf_protection.invalidate_cached_token()
+                    context.pop("csrf_token", None)
+                    self._fetch_csrf_token(csrf_endpoint, context)
+                    resp = self._post_credentials(context)
+                # try json; raise on non-2xx to surface errors
+                resp.raise_for_status()
+            except AuthenticationError:
+                raise
+            except Exception as e:
+                raise AuthenticationError(f"Login request failed: {e}", self.name)
+
+            # Decode a JSON body once; the CSRF and JWT extraction below both use it
+            data = None
+            parse_error = None
+            if self.jwt_source != "cookie":
+                try:
+                    data = _parse_json_body(resp)
+                except Exception as e:
+                    parse_error = e
+
+            # Extract updated CSRF token from response if auto-extraction enabled
+            if (
+                isinstance(self.csrf_protection, CSRFProtection)
+                and self.csrf_protection.auto_extract
+            ):
+                self.csrf_protection.extract_token(
+                    response=resp, session=self._session, context=context, parsed_body=data
+                )
+
+            # Extract token from either response cookies or JSON body
+            if self.jwt_source == "cookie":
+                token = self._jwt_from_cookie(resp.cookies.get(self.cookie_name))
+            else:
+                if parse_error is not None:
+                    raise AuthenticationError(
+                        f"Failed to parse JSON response: {parse_error}", self.name
+                    )
+                token = self._jwt_from_json(data)
+        finally:
+            # Hand the connection back to the pool on success or failure
+            if resp is not None:
+                _close_response(resp)
+
+        self.token = token
+        self.store_auth_data_bulk({"jwt": token, "login_time": time.time()})
+        return token
+
+    def _fetch_csrf_token(self, csrf_endpoint: str, context: Dict[str, Any]) -> None:
+        """GET csrf_endpoint and extract the CSRF token into context."""
+        try:
+            if self.csrf_protection.auto_extract:
+                # auto_extract wants a fresh token from every response, so
+                # don't answer from a cached page
+                resp = self._session.get(csrf_endpoint, timeout=15)
+            else:
+                resp = _conditional_get(
+                    self._session, csrf_endpoint, self._page_cache, timeout=15
+                )
+            # Extract CSRF token from the GET response
+            self.csrf_protection.extract_token(
+                response=resp, session=self._session, context=context
+            )
+        except Exception as e:
+            raise AuthenticationError(f"Failed to get CSRF token: {e}", self.name)
+
+    def _post_credentials(self, context: Dict[str, Any]) -> Any:
+        """POST the login payload, with CSRF token and headers when configured."""
+        # Import here to avoid circular imports
+        from ..core.csrf import CSRFProtection
+
+        headers = {}
+        # A fresh dict per call, so inject_token may update it in place
+        payload: Dict[str, Any] = {
+            **self.extra_fields,
+            self.username_field: self.username,
+            self.password_field: self.password,
+        }
 
         # Inject CSRF token into login request
         if isinstance(self.csrf_protection, CSRFProtection):
-            from urllib.parse import urlparse
-
             headers, payload = self.csrf_protection.inject_token(
                 headers=headers, data=payload, method="POST", context=context
             )
@@ -153,8 +697,7 @@ class CookieJWTAuth(Authentication):
             # Add Origin header for CSRF validation
             # Many CSRF implementations check Origin/Referer headers in addition to tokens
             # Browsers automatically send these for cross-origin requests
-            parsed_url = urlparse(self.login_url)
-            origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            origin = self._login_origin
             if headers is None:
                 headers = {}
             if "Origin" not in headers:
@@ -179,58 +722,25 @@ class CookieJWTAuth(Authentication):
                 if "Cookie" not in headers:
                     headers["Cookie"] = f"{csrf_cookie_name}={csrf_cookie_value}"
 
-        try:
-            if self.content_type == "form":
-                resp = self._session.post(
-                    self.login_url, data=payload, headers=headers or None, timeout=15
-                )
-            else:
-                resp = self._session.post(
-                    self.login_url, json=payload, headers=headers or None, timeout=15
-                )
-            # try json; raise on non-2xx to surface errors
-            resp.raise_for_status()
-        except Exception as e:
-            raise AuthenticationError(f"Login request failed: {e}", self.name)
-
-        # Extract updated CSRF token from response if auto-extraction enabled
-        if (
-            isinstance(self.csrf_protection, CSRFProtection)
-            and self.csrf_protection.auto_extract
-        ):
-            self.csrf_protection.extract_token(
-                response=resp, session=self._session, context=context
-            )
-
-        # Extract token from either response cookies or JSON body
-        token = None
+        if headers is None:
+            headers = {}
         if self.jwt_source == "cookie":
-            # Extract from response cookies
-            token = resp.cookies.get(self.cookie_name)
-            if not token or not isinstance(token, str):
-                raise AuthenticationError(
-                    f"JWT cookie '{self.cookie_name}' not found in login response",
-                    self.name,
-                )
-        else:
-            # Extract from JSON response body
-            try:
-                data = resp.json()
-            except Exception as e:
-                raise AuthenticationError(
-                    f"Failed to parse JSON response: {e}", self.name
-                )
-            token = _extract_by_dot_path(data, self.jwt_json_path)
-            if not token or not isinstance(token, str):
-                raise AuthenticationError(
-                    f"JWT not found at path '{self.jwt_json_path}' in login response",
-                    self.name,
-                )
-
-        self.token = token
-        self.store_auth_data("jwt", token)
-        self.store_auth_data("login_time", time.time())
-        return token
+            # Only the Set-Cookie header is needed: ask for an uncompressed body.
+            # It is still read in full (not streamed), since urllib3 drops
+            # rather than pools a connection whose body was left unread.
+            headers.setdefault("Accept-Encoding", "identity")
+        elif requests is not None:
+            # Ask for a compressed JSON body explicitly, even on injected sessions
+            # without default headers; urllib3 lists br only when it can decode it
+            headers.setdefault("Accept-Encoding", _ACCEPT_ENCODING)
+
+        if self.content_type == "form":
+            return self._session.post(
+                self.login_url, data=payload, headers=headers or None, timeout=15
+            )
+        return self._session.post(
+            self.login_url, json=payload, headers=headers or None, timeout=15
+        )
 
     def get_auth_cookies(self) -> Dict[str, str]:
         """
@@ -242,6 +752,17 @@ class CookieJWTAuth(Authentication):
             return {}
         return {self.cookie_name: self.token}
 
+    async def get_auth_cookies_async(self) -> Dict[str, str]:
+        """
+        Async version of get_auth_cookies(), for logging many instances in
+        concurrently from one event loop (e.g. with asyncio.gather).
+        """
+        if not self.token:
+            await self._login_and_get_token_async()
+        if not self.token:
+            return {}
+        return {self.cookie_name: self.token}
+
     def get_auth_headers(self) -> Dict[str, str]:
         """
         Return headers for API mode. If CSRF protection is configured,
@@ -313,32 +834,67 @@ class CookieJWTAuth(Authentication):
                 self._login_and_get_token()
             if not self.token:
                 return False
-            # Navigate to the target domain base so cookie domain matches
-            parsed = urlparse(target_url)
-            base = f"{parsed.scheme}://{parsed.netloc}"
-            try:
-                driver.get(base)
-            except Exception:
-                pass
+            base, netloc, hostname = self._target_parts(target_url)
             cookie_dict = {
                 "name": self.cookie_name,
                 "value": self.token,
                 "path": "/",
             }
             # If domain available, set explicitly to be safe
-            if parsed.netloc:
-                cookie_dict["domain"] = parsed.hostname or parsed.netloc
-            driver.add_cookie(cookie_dict)
+            if netloc:
+                cookie_dict["domain"] = hostname or netloc
+            if not self._set_cookie_via_cdp(driver, cookie_dict):
+                # add_cookie only works for the page's own domain; navigate
+                # there first unless the browser is already on it
+                if not _same_netloc(driver, netloc):
+                    try:
+                        driver.get(base)
+                    except Exception:
+                        pass
+                driver.add_cookie(cookie_dict)
             self.authenticated = True
             return True
         except Exception as e:
             raise AuthenticationError(f"Cookie auth failed: {e}", self.name)
 
+    def _target_parts(self, target_url: str) -> tuple:
+        """Return (base URL, netloc, hostname) for target_url, parsed once per URL."""
+        parts = self._url_cache.get(target_url)
+        if parts is None:
+            parsed = urlparse(target_url)
+            parts = (f"{parsed.scheme}://{parsed.netloc}", parsed.netloc, parsed.hostname)
+            if len(self._url_cache) >= 4:
+                # Executors pass the same handful of URLs; drop the oldest
+                self._url_cache.pop(next(iter(self._url_cache)))
+            self._url_cache[target_url] = parts
+        return parts
+
+    @staticmethod
+    def _set_cookie_via_cdp(driver: WebDriver, cookie_dict: Dict[str, Any]) -> bool:
+        """
+        Set the cookie through Chrome DevTools, which needs no page load on the
+        cookie's domain. Returns False for non-Chromium drivers or on failure.
+        """
+        try:
+            from selenium.webdriver.chromium.webdriver import ChromiumDriver
+        except ImportError:
+            return False
+        if not isinstance(driver, ChromiumDriver):
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.setCookie", cookie_dict)
+            return True
+        except Exception:
+            return False
+
     def is_authenticated(self, driver: WebDriver) -> bool:
         return self.authenticated and self.token is not None
 
     def logout(self, driver: WebDriver) -> bool:
         try:
+            key = self._cache_key()
+            if key is not None:
+                self.invalidate_cache(key)
             self.token = None
             self.authenticated = False
             self.clear_auth_data()
@@ -1,13 +1,15 @@
 import argparse
 import ast
+import atexit
+import contextlib
+import functools
 import json
 import os
 import re
-import sqlite3
-import subprocess
+import stat
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from scythe.cli.diagnostics import envelope, print_json_report
 from scythe.cli.discover import discover_routes
@@ -18,11 +20,10 @@ from scythe.cli.intent import classify_intent
 from scythe.cli.snippets import load_snippets, lookup_snippets
 from scythe.fixtures.profiles import list_profiles, load_profile, load_profile_file
 
-# Typer is used for the CLI. Import at module level for static analyzers; runtime guard in main.
-try:
-    import typer  # type: ignore
-except Exception:  # pragma: no cover
-    typer = None  # type: ignore
+# typer, sqlite3 and subprocess are imported where they're used, so importing
+# this module (and commands that don't touch the DB or run tests) stays cheap
+if TYPE_CHECKING:
+    import sqlite3
 
 
 PROJECT_DIRNAME = ".scythe"
@@ -1134,6 +1135,12 @@ TEST_TEMPLATES: Dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _template_bytes(template: str) -> bytes:
+    """UTF-8 encoding of a test template, computed once per template."""
+    return template.encode("utf-8")
+
+
 class ScytheCLIError(Exception):
     pass
 
@@ -1146,11 +1153,18 @@ class ExitWithCode(Exception):
         super().__init__()
 
 
-def _find_project_root(start: Optional[str] = None) -> Optional[str]:
-    """Walk upwards from start (or cwd) to find a directory containing .scythe."""
-    cur = os.path.abspath(start or os.getcwd())
+def _is_dir(path: str) -> bool:
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _find_project_root_cached(start_abs: str) -> Optional[str]:
+    cur = start_abs
     while True:
-        if os.path.isdir(os.path.join(cur, PROJECT_DIRNAME)):
+        if _is_dir(os.path.join(cur, PROJECT_DIRNAME)):
             return cur
         parent = os.path.dirname(cur)
         if parent == cur:
@@ -1158,43 +1172,133 @@ def _find_project_root(start: Optional[str] = None) -> Optional[str]:
         cur = parent
 
 
+def _find_project_root(start: Optional[str] = None) -> Optional[str]:
+    """Walk upwards from start (or cwd) to find a directory containing .scythe."""
+    start_abs = os.path.abspath(start or os.getcwd())
+    root = _find_project_root_cached(start_abs)
+    if root is None or not _is_dir(os.path.join(root, PROJECT_DIRNAME)):
+        # Don't keep a miss (a project may be initialized later) or a project
+        # that has since been removed
+        _find_project_root_cached.cache_clear()
+        if root is not None:
+            root = _find_project_root_cached(start_abs)
+    return root
+
+
 def _db_path(project_root: str) -> str:
     return os.path.join(project_root, PROJECT_DIRNAME, DB_FILENAME)
 
 
-def _ensure_db(conn: sqlite3.Connection) -> None:
-    cur = conn.cursor()
-    cur.execute(
+# Stored in PRAGMA user_version once _ensure_db has brought a database up to
+# date, so later opens (including other processes) can skip the DDL
+_SCHEMA_VERSION = 1
+
+
+def _ensure_db(conn: "sqlite3.Connection") -> None:
+    # Both tables in one transaction, so a new database costs a single commit
+    conn.executescript(
         """
+        BEGIN;
         CREATE TABLE IF NOT EXISTS tests (
             name TEXT PRIMARY KEY,
             path TEXT NOT NULL,
             created_date TEXT NOT NULL,
             compatible_versions TEXT
-        )
-        """
-    )
-    cur.execute(
-        """
+        );
         CREATE TABLE IF NOT EXISTS runs (
             datetime TEXT NOT NULL,
             name_of_test TEXT NOT NULL,
             x_scythe_target_version TEXT,
             result TEXT NOT NULL,
-            raw_output TEXT NOT NULL
-        )
+            raw_output TEXT NOT NULL,
+            raw_output_len INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_runs_name ON runs(name_of_test);
+        CREATE INDEX IF NOT EXISTS idx_runs_dt ON runs(datetime);
+        COMMIT;
         """
     )
-    conn.commit()
+    # Databases created before raw_output_len existed
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+    if "raw_output_len" not in columns:
+        conn.execute("ALTER TABLE runs ADD COLUMN raw_output_len INTEGER")
+    conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as e.g. 2024-01-31T12:00:00Z."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+_SQL_INSERT_TEST = (
+    "INSERT OR REPLACE INTO tests(name, path, created_date, compatible_versions) VALUES(?,?,?,?)"
+)
+_SQL_INSERT_RUN = (
+    "INSERT INTO runs(datetime, name_of_test, x_scythe_target_version, result, raw_output, raw_output_len)"
+    " VALUES(?,?,?,?,?,?)"
+)
+
+# Longest raw_output stored per run; longer output keeps its head and tail
+_MAX_OUT = 64 * 1024
+
+# One connection per database file for the life of the process, with the schema
+# checked only on first open
+_CONN_CACHE: Dict[str, "sqlite3.Connection"] = {}
+_SCHEMA_READY: set = set()
 
 
-def _open_db(project_root: str) -> sqlite3.Connection:
+def _open_db(project_root: str) -> "sqlite3.Connection":
     path = _db_path(project_root)
-    conn = sqlite3.connect(path)
-    _ensure_db(conn)
+    conn = _CONN_CACHE.get(path)
+    if conn is None:
+        import sqlite3
+
+        # Statements are compiled once per connection and reused from its cache.
+        # Autocommit mode: writes are bracketed explicitly with _write_txn()
+        conn = _CONN_CACHE[path] = sqlite3.connect(
+            path, isolation_level=None, cached_statements=256
+        )
+    if path not in _SCHEMA_READY:
+        # WAL with synchronous=NORMAL: a run insert appends to the log instead
+        # of fsyncing the database on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-16384")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            _ensure_db(conn)
+        _SCHEMA_READY.add(path)
     return conn
 
 
+@contextlib.contextmanager
+def _write_txn(conn: "sqlite3.Connection"):
+    """Run the block's statements in one BEGIN IMMEDIATE ... COMMIT transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _close_db(project_root: str) -> None:
+    path = _db_path(project_root)
+    _SCHEMA_READY.discard(path)
+    conn = _CONN_CACHE.pop(path, None)
+    if conn is not None:
+        conn.close()
+
+
+@atexit.register
+def _close_all_dbs() -> None:
+    while _CONN_CACHE:
+        _, conn = _CONN_CACHE.popitem()
+        conn.close()
+    _SCHEMA_READY.clear()
+
+
 def _init_project(path: str) -> str:
     root = os.path.abspath(path or ".")
     os.makedirs(root, exist_ok=True)
@@ -1205,12 +1309,10 @@ def _init_project(path: str) -> str:
     os.makedirs(project_dir, exist_ok=True)
     os.makedirs(tests_dir, exist_ok=True)
 
-    # Initialize the sqlite DB with required tables
-    conn = sqlite3.connect(os.path.join(project_dir, DB_FILENAME))
-    try:
-        _ensure_db(conn)
-    finally:
-        conn.close()
+    # Initialize the sqlite DB with required tables; drop any connection cached
+    # for a database that may since have been removed
+    _close_db(root)
+    _open_db(root)
 
     # Write a helpful README
     readme_path = os.path.join(project_dir, "README.md")
@@ -1226,8 +1328,10 @@ def _init_project(path: str) -> str:
     gitignore_path = os.path.join(project_dir, ".gitignore")
     if not os.path.exists(gitignore_path):
         with open(gitignore_path, "w", encoding="utf-8") as f:
-            f.write("scythe.db\n")
+            f.write("scythe.db\nscythe.db-wal\nscythe.db-shm\n")
 
+    # A cached lookup may point at an enclosing project this one now shadows
+    _find_project_root_cached.cache_clear()
     return root
 
 
@@ -1244,29 +1348,38 @@ def _create_test(project_root: str, name: str, kind: str = DEFAULT_TEST_KIND) ->
     tests_dir = os.path.join(project_root, PROJECT_DIRNAME, TESTS_DIRNAME)
     os.makedirs(tests_dir, exist_ok=True)
     filepath = os.path.join(tests_dir, filename)
-    if os.path.exists(filepath):
+    # O_EXCL checks for an existing test and creates the file in one step
+    try:
+        fd = os.open(
+            filepath,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+            0o755,
+        )
+    except FileExistsError:
         raise ScytheCLIError(f"Test already exists: {filepath}")
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(template)
-    os.chmod(filepath, 0o755)
+    try:
+        data = memoryview(_template_bytes(template))
+        while data:
+            data = data[os.write(fd, data):]
+        # The mode passed to os.open is subject to the umask; chmod is not
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o755)
+        else:  # pragma: no cover - Windows
+            os.chmod(filepath, 0o755)
+    finally:
+        os.close(fd)
 
     # Insert into DB
-    conn = _open_db(project_root)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT OR REPLACE INTO tests(name, path, created_date, compatible_versions) VALUES(?,?,?,?)",
+    with _write_txn(_open_db(project_root)) as conn:
+        conn.execute(
+            _SQL_INSERT_TEST,
             (
                 filename,
                 os.path.relpath(filepath, project_root),
-                datetime.utcnow().isoformat(timespec="seconds") + "Z",
+                _utc_timestamp(),
                 "",
             ),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
     return filepath
 
@@ -1275,23 +1388,48 @@ _VERSION_RE = re.compile(
     r"['\"]?X-Scythe-Target-Version['\"]?\s*:\s*['\"]?([\w.-]+)['\"]?"
 )
 _DETECTED_LIST_RE = re.compile(r"Target versions detected:\s*\[?([^]]*)\]?")
+# Both patterns as one alternation, so the output is scanned once
+_VERSION_OR_LIST_RE = re.compile(
+    f"(?:{_VERSION_RE.pattern})|(?:{_DETECTED_LIST_RE.pattern})"
+)
+_VER_TOKEN_RE = re.compile(r"\d+(?:\.[\w\-]+)+")
+
+
+# The version header is printed near the start of a test's output and the
+# detected-versions summary near the end; only these windows are scanned
+_VERSION_SCAN_WINDOW = 8192
 
 
 def _parse_version_from_output(output: str) -> Optional[str]:
-    m = _VERSION_RE.search(output)
-    if m:
-        return m.group(1)
-    # Try from Detected target versions: ["1.2.3"] or like str(list)
-    m = _DETECTED_LIST_RE.search(output)
-    if m:
-        inner = m.group(1)
+    if len(output) > 2 * _VERSION_SCAN_WINDOW:
+        output = output[:_VERSION_SCAN_WINDOW] + "\n" + output[-_VERSION_SCAN_WINDOW:]
+    # A header anywhere wins over a "Target versions detected: [...]" list
+    detected: Optional[str] = None
+    for m in _VERSION_OR_LIST_RE.finditer(output):
+        if m.group(1) is not None:
+            return m.group(1)
+        inner = m.group(2)
+        # The list match may have swallowed a header that follows it
+        mh = _VERSION_RE.search(inner)
+        if mh:
+            return mh.group(1)
+        if detected is None:
+            detected = inner
+    if detected is not None:
         # extract first version-like token
-        mv = re.search(r"\d+(?:\.[\w\-]+)+", inner)
+        mv = _VER_TOKEN_RE.search(detected)
         if mv:
             return mv.group(0)
     return None
 
 
+_READ_CHUNK = 64 * 1024
+# Resolved once at import: the checkout test subprocesses import scythe from, and
+# the interpreter they run under
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+_PY_EXE = sys.executable
+
+
 def _run_test(
     project_root: str, name: str, extra_args: Optional[List[str]] = None
 ) -> Tuple[int, str, Optional[str]]:
@@ -1300,12 +1438,15 @@ def _run_test(
     if not os.path.exists(test_path):
         raise ScytheCLIError(f"Test not found: {test_path}")
 
-    # Ensure the subprocess can import the in-repo scythe package when running from a temp project
-    repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-    env = os.environ.copy()
-    existing_pp = env.get("PYTHONPATH", "")
-    if repo_root not in existing_pp.split(os.pathsep):
-        env["PYTHONPATH"] = os.pathsep.join([p for p in [existing_pp, repo_root] if p])
+    # Ensure the subprocess can import the in-repo scythe package when running from a temp project.
+    # The child inherits our environment unchanged unless PYTHONPATH needs the repo added
+    existing_pp = os.environ.get("PYTHONPATH", "")
+    env = None
+    if _REPO_ROOT not in existing_pp.split(os.pathsep):
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join([p for p in [existing_pp, _REPO_ROOT] if p]),
+        }
 
     # Normalize extra args (strip a leading "--" if provided as a separator)
     cmd_args: List[str] = []
@@ -1314,54 +1455,149 @@ def _run_test(
         if len(cmd_args) > 0 and cmd_args[0] == "--":
             cmd_args = cmd_args[1:]
 
-    # Execute the test as a subprocess using the same interpreter
-    proc = subprocess.run(
-        [sys.executable, test_path, *cmd_args],
+    # Execute the test as a subprocess using the same interpreter. Output is read
+    # in large binary chunks and decoded once at the end rather than through a
+    # text-mode pipe
+    import subprocess
+
+    buf = bytearray()
+    with subprocess.Popen(
+        [_PY_EXE, test_path, *cmd_args],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
         cwd=project_root,
         env=env,
-    )
-    output = proc.stdout
+        bufsize=_READ_CHUNK,
+    ) as proc:
+        while chunk := proc.stdout.read(_READ_CHUNK):
+            buf.extend(chunk)
+        returncode = proc.wait()
+    output = buf.decode("utf-8", "replace")
+    if "\r" in output:
+        # Same newlines as the text-mode pipe this used to read from
+        output = output.replace("\r\n", "\n").replace("\r", "\n")
     version = _parse_version_from_output(output)
-    return proc.returncode, output, version
+    return returncode, output, version
+
+
+def _truncate_output(output: str) -> str:
+    """Keep the first and last _MAX_OUT // 2 characters of an over-long output."""
+    if len(output) <= _MAX_OUT:
+        return output
+    half = _MAX_OUT // 2
+    return (
+        output[:half]
+        + f"\n...[truncated {len(output) - _MAX_OUT} characters]...\n"
+        + output[-half:]
+    )
+
+
+# Rows buffered by an active scythe_run_batch(), per project root
+_RUN_BATCHES: Dict[str, List[tuple]] = {}
 
 
 def _record_run(
     project_root: str, name: str, code: int, output: str, version: Optional[str]
 ) -> None:
-    conn = _open_db(project_root)
+    row = (
+        _utc_timestamp(),
+        name if name.endswith(".py") else f"{name}.py",
+        version or "",
+        "SUCCESS" if code == 0 else "FAILURE",
+        _truncate_output(output),
+        len(output),
+    )
+    batch = _RUN_BATCHES.get(project_root)
+    if batch is not None:
+        batch.append(row)
+        return
+    _record_runs_bulk(project_root, [row])
+
+
+def _record_runs_bulk(project_root: str, rows: List[tuple]) -> None:
+    """Insert several runs rows in one transaction."""
+    if not rows:
+        return
+    with _write_txn(_open_db(project_root)) as conn:
+        conn.executemany(_SQL_INSERT_RUN, rows)
+
+
+@contextlib.contextmanager
+def scythe_run_batch(project_root: str):
+    """
+    Buffer the _record_run() calls made for project_root inside the block and
+    write them in a single transaction on exit. Nested blocks for the same
+    project share the outermost buffer.
+    """
+    if project_root in _RUN_BATCHES:
+        yield
+        return
+    rows: List[tuple] = []
+    _RUN_BATCHES[project_root] = rows
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO runs(datetime, name_of_test, x_scythe_target_version, result, raw_output) VALUES(?,?,?,?,?)",
-            (
-                datetime.utcnow().isoformat(timespec="seconds") + "Z",
-                name if name.endswith(".py") else f"{name}.py",
-                version or "",
-                "SUCCESS" if code == 0 else "FAILURE",
-                output,
-            ),
-        )
-        conn.commit()
+        yield
     finally:
-        conn.close()
+        del _RUN_BATCHES[project_root]
+        _record_runs_bulk(project_root, rows)
 
 
 def _dump_db(project_root: str) -> Dict[str, List[Dict[str, str]]]:
     conn = _open_db(project_root)
+    cur = conn.cursor()
+    result: Dict[str, List[Dict[str, str]]] = {}
+    # Read both tables from one snapshot under a single shared lock
+    cur.execute("BEGIN")
     try:
-        cur = conn.cursor()
-        result: Dict[str, List[Dict[str, str]]] = {}
         for table in ("tests", "runs"):
             cur.execute(f"SELECT * FROM {table}")
             cols = [d[0] for d in cur.description]
             rows = [dict(zip(cols, r)) for r in cur.fetchall()]
             result[table] = rows
-        return result
     finally:
-        conn.close()
+        conn.execute("COMMIT")
+    return result
+
+
+_json_encode = json.JSONEncoder().encode
+
+
+def _row_json_template(description) -> str:
+    """
+    str.format template that renders a row's JSON-encoded values as the
+    indent=2 object json.dumps would produce for it inside the dump, without
+    building a dict per row.
+    """
+    fields = ",".join(
+        "\n      " + json.dumps(d[0]).replace("{", "{{").replace("}", "}}") + ": {}"
+        for d in description
+    )
+    return "{{" + fields + "\n    }}"
+
+
+def _write_db_dump(project_root: str, out=None) -> None:
+    """
+    Write the same JSON as json.dumps(_dump_db(...), indent=2) to out (stdout by
+    default), one row at a time instead of building the whole document first.
+    """
+    out = out or sys.stdout
+    conn = _open_db(project_root)
+    cur = conn.cursor()
+    cur.execute("BEGIN")
+    try:
+        out.write("{")
+        for t, table in enumerate(("tests", "runs")):
+            out.write(f'{"," if t else ""}\n  "{table}": [')
+            cur.execute(f"SELECT * FROM {table}")
+            format_row = _row_json_template(cur.description).format
+            first = True
+            for r in cur:
+                row = format_row(*map(_json_encode, r))
+                out.write(("\n    " if first else ",\n    ") + row)
+                first = False
+            out.write("]" if first else "\n  ]")
+        out.write("\n}\n")
+    finally:
+        conn.execute("COMMIT")
 
 
 def _test_file_path(project_root: str, name: str) -> str:
@@ -1434,10 +1670,9 @@ def _update_test_compatible_versions(
     test_path_rel = os.path.relpath(
         _test_file_path(project_root, filename), project_root
     )
-    conn = _open_db(project_root)
-    try:
+    compat_str = json.dumps(versions) if versions is not None else ""
+    with _write_txn(_open_db(project_root)) as conn:
         cur = conn.cursor()
-        compat_str = json.dumps(versions) if versions is not None else ""
         cur.execute(
             "UPDATE tests SET compatible_versions=? WHERE name=?",
             (compat_str, filename),
@@ -1445,17 +1680,14 @@ def _update_test_compatible_versions(
         if cur.rowcount == 0:
             # Insert a row if it doesn't exist yet
             cur.execute(
-                "INSERT OR REPLACE INTO tests(name, path, created_date, compatible_versions) VALUES(?,?,?,?)",
+                _SQL_INSERT_TEST,
                 (
                     filename,
                     test_path_rel,
-                    datetime.utcnow().isoformat(timespec="seconds") + "Z",
+                    _utc_timestamp(),
                     compat_str,
                 ),
             )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def _sync_compat(project_root: str, name: str) -> Optional[List[str]]:
@@ -1971,7 +2203,7 @@ def build_parser() -> argparse.ArgumentParser:
     sub = parser.add_subparsers(dest="command", required=True)
 
     p_init = sub.add_parser("init", help="Initialize a new .scythe project")
-    p_init.add_argument("--path", default=".", help="Target directory (default: .)")
+    p_init.add_argument("--path", "-p", default=".", help="Target directory (default: .)")
 
     p_new = sub.add_parser("new", help="Create a new test in scythe_tests")
     p_new.add_argument(
@@ -1979,6 +2211,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_new.add_argument(
         "--kind",
+        "-k",
         default=DEFAULT_TEST_KIND,
         choices=sorted(TEST_TEMPLATES.keys()),
         help=(
@@ -2379,8 +2612,7 @@ def _legacy_main(argv: Optional[List[str]] = None) -> int:
                     "Not inside a Scythe project. Run 'scythe init' first."
                 )
             if args.db_cmd == "dump":
-                data = _dump_db(project_root)
-                print(json.dumps(data, indent=2))
+                _write_db_dump(project_root)
                 return 0
             if args.db_cmd == "sync-compat":
                 versions = _sync_compat(project_root, args.name)
@@ -2404,12 +2636,47 @@ def _legacy_main(argv: Optional[List[str]] = None) -> int:
         return 2
 
 
+def _is_fast_path(argv: List[str]) -> bool:
+    """
+    Whether argv is a plain init/new/run/db invocation the argparse parser handles
+    identically, so main() can skip importing Typer and building its app.
+    """
+    if not argv or any(a in ("--help", "-h") for a in argv):
+        return False
+    if any(k.startswith("_") and k.endswith("_COMPLETE") for k in os.environ):
+        return False  # shell completion is Typer's
+    command, rest = argv[0], argv[1:]
+    if command in ("init", "new"):
+        return True
+    if command == "db":
+        return bool(rest) and rest[0] in ("dump", "sync-compat")
+    if command == "run":
+        # argparse passes everything after the test name to the test, while Typer
+        # still reads a later --json as its own option
+        if rest and rest[0] == "--json":
+            rest = rest[1:]
+        tail = rest[1:]
+        if "--" in tail:
+            tail = tail[: tail.index("--")]
+        return bool(rest) and "--json" not in tail
+    return False
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """Typer-based CLI entry point. When called programmatically, returns an exit code int.
 
     This constructs a Typer app with subcommands equivalent to the previous argparse
     version, then dispatches with argv forwarding for testability and programmatic use.
+    Plain init/new/run/db invocations go straight to the argparse implementation.
     """
+    args = sys.argv[1:] if argv is None else list(argv)
+    if _is_fast_path(args):
+        try:
+            return _legacy_main(args)
+        except SystemExit as e:
+            # argparse usage errors
+            return int(getattr(e, "code", 0) or 0)
+
     try:
         import typer
     except Exception:
@@ -2797,8 +3064,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             raise ScytheCLIError(
                 "Not inside a Scythe project. Run 'scythe init' first."
             )
-        data = _dump_db(project_root)
-        print(json.dumps(data, indent=2))
+        _write_db_dump(project_root)
         return 0
 
     @db_app.command("sync-compat")
@@ -6,7 +6,10 @@ to support testing web applications with CSRF protection enabled.
 """
 
 import logging
+import time
+import weakref
 from typing import Optional, Dict, Any, Literal
+from urllib.parse import urlparse
 import requests
 
 
@@ -53,6 +56,8 @@ class CSRFProtection:
         auto_extract: Automatically extract token from every response (default: True)
         required_for_methods: HTTP methods that require CSRF token (default: POST, PUT, PATCH, DELETE)
         retry_on_failure: Automatically retry on 403/419 errors after refreshing token (default: True)
+        token_ttl: Seconds get_cached_token() keeps returning an extracted token for the
+                   host it came from (default: 300). None never expires it.
     """
 
     def __init__(
@@ -66,6 +71,7 @@ class CSRFProtection:
         auto_extract: bool = True,
         required_for_methods: Optional[list] = None,
         retry_on_failure: bool = True,
+        token_ttl: Optional[float] = 300.0,
     ):
         """Initialize CSRF protection with configuration."""
         self.extract_from = extract_from
@@ -82,9 +88,15 @@ class CSRFProtection:
             "DELETE",
         ]
         self.retry_on_failure = retry_on_failure
+        self.token_ttl = token_ttl
 
         # Runtime state
         self._current_token: Optional[str] = None
+        # Origin of the response the current token was extracted from, and when
+        self._token_origin: Optional[str] = None
+        self._token_time: float = 0.0
+        # Weak reference to the cookie jar of the session the token came with
+        self._token_jar: Optional[weakref.ref] = None
 
         logger.debug(
             f"Initialized CSRF protection: extract_from={extract_from}, "
@@ -96,6 +108,7 @@ class CSRFProtection:
         response: Optional[requests.Response] = None,
         session: Optional[requests.Session] = None,
         context: Optional[Dict[str, Any]] = None,
+        parsed_body: Optional[Any] = None,
     ) -> Optional[str]:
         """
         Extract CSRF token from response or session.
@@ -104,6 +117,8 @@ class CSRFProtection:
             response: HTTP response object to extract from
             session: requests.Session object to extract cookies from
             context: Context dictionary (for accessing stored state)
+            parsed_body: Already-decoded JSON body of response, used instead of
+                         parsing it again when extract_from is "body"
 
         Returns:
             Extracted CSRF token or None if not found
@@ -136,9 +151,9 @@ class CSRFProtection:
 
         elif self.extract_from == "body":
             # Extract from JSON response body
-            if response:
+            if parsed_body is not None or response:
                 try:
-                    body = response.json()
+                    body = parsed_body if parsed_body is not None else response.json()
                     token = body.get(self.body_field)
                     if token:
                         logger.debug(
@@ -151,6 +166,9 @@ class CSRFProtection:
 
         if token:
             self._current_token = token
+            self._token_origin = self._origin(getattr(response, "url", None))
+            self._token_time = time.time()
+            self._token_jar = self._jar_ref(session)
             if context is not None:
                 context["csrf_token"] = token
         elif self.auto_extract:
@@ -173,6 +191,68 @@ class CSRFProtection:
             return context["csrf_token"]
         return self._current_token
 
+    def get_cached_token(
+        self, url: str, session: Optional[requests.Session] = None
+    ) -> Optional[str]:
+        """
+        Get the current CSRF token if it can be reused for a request to url.
+
+        A token is reusable when it was extracted from a response from the same
+        origin (scheme and host) within token_ttl seconds, so callers can skip
+        the GET they would otherwise make to obtain one.
+
+        Args:
+            url: URL the token would be sent to
+            session: Session the token would be sent with. When given, the token
+                     is only reused if it was extracted with a session sharing
+                     this session's cookie jar, since servers usually tie CSRF
+                     tokens to the session cookie.
+
+        Returns:
+            Cached CSRF token or None
+        """
+        if not self._current_token or self._token_origin is None:
+            return None
+        if self._origin(url) != self._token_origin:
+            return None
+        if session is not None:
+            jar = self._token_jar() if self._token_jar is not None else None
+            if jar is None or jar is not getattr(session, "cookies", None):
+                return None
+        if self.token_ttl is not None and time.time() - self._token_time >= self.token_ttl:
+            return None
+        return self._current_token
+
+    def invalidate_cached_token(self) -> None:
+        """Forget the current CSRF token, e.g. after the server rejected it."""
+        self._current_token = None
+        self._token_origin = None
+        self._token_jar = None
+
+    @staticmethod
+    def _jar_ref(session: Any) -> Optional[weakref.ref]:
+        """Weak reference to session's cookie jar, or None if there isn't one."""
+        jar = getattr(session, "cookies", None)
+        if jar is None:
+            return None
+        try:
+            return weakref.ref(jar)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def _origin(url: Any) -> Optional[str]:
+        """Return 'scheme://host[:port]' for a URL string, or None."""
+        if url is not None and not isinstance(url, str):
+            # httpx responses carry an httpx.URL rather than a string
+            url = str(url) if type(url).__module__.startswith("httpx") else None
+        if not url:
+            return None
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}".lower()
+
     def inject_token(
         self,
         token: Optional[str] = None,
@@ -2,6 +2,7 @@ import time
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
 from .ttp import TTP
 from typing import Optional, Dict, Any
 from ..behaviors.base import Behavior
@@ -22,6 +23,7 @@ class TTPExecutor:
         delay: int = 1,
         behavior: Optional[Behavior] = None,
         sleep_fn=None,
+        driver: Optional[WebDriver] = None,
     ):
         self.ttp = ttp
         self.target_url = target_url
@@ -39,13 +41,18 @@ class TTPExecutor:
         # Enable header extraction capabilities
         HeaderExtractor.enable_logging_for_driver(self.chrome_options)
 
-        self.driver = None
+        # A driver passed in by the caller is reused and left running afterwards
+        self.driver = driver
+        self._owns_driver = driver is None
         self.results = []
         self.header_extractor = HeaderExtractor()
         self.has_test_failures = False  # Track if any test had unexpected results
 
     def _setup_driver(self):
         """Initializes the WebDriver."""
+        if self.driver is not None:
+            self.logger.info("Using provided WebDriver.")
+            return
         try:
             self.driver = webdriver.Chrome(options=self.chrome_options)
             self.logger.info("WebDriver initialized.")
@@ -364,9 +371,10 @@ class TTPExecutor:
             self._cleanup()
 
     def _cleanup(self):
-        """Closes the WebDriver and prints a summary."""
-        if self.driver:
+        """Closes the WebDriver and header extractor, and prints a summary."""
+        if self.driver and self._owns_driver:
             self.driver.quit()
+        self.header_extractor.close()
 
         self.logger.info("\n" + "=" * 50)
         self.logger.info(f"TTP SUMMARY: {self.ttp.name}")
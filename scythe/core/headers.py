@@ -1,10 +1,36 @@
 import json
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, List, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.chrome.options import Options
 
+logger = logging.getLogger(__name__)
+
+# Most recent probe results kept per extractor when cache_ttl is set
+_PROBE_CACHE_SIZE = 64
+
+# Header names debug_headers flags as possible version headers
+_VERSION_HEADER_RE = re.compile(r"scythe|version", re.IGNORECASE)
+
+
+def _http2_client() -> Optional[Any]:
+    """Create an HTTP/2 httpx.Client, or return None if httpx isn't installed."""
+    try:
+        import httpx  # type: ignore
+    except ImportError:
+        logger.warning(
+            "httpx is required for http2=True; falling back to requests. "
+            "Install it with: pip install 'scythe-ttp[http2]'"
+        )
+        return None
+    return httpx.Client(http2=True, follow_redirects=True)
+
 
 class HeaderExtractor:
     """
@@ -16,8 +42,80 @@ class HeaderExtractor:
 
     SCYTHE_VERSION_HEADER = "X-Scythe-Target-Version"
 
-    def __init__(self):
+    def __init__(self, http2: bool = False, cache_ttl: float = 0.0):
+        """
+        Args:
+            http2: Send banner-grab requests with an HTTP/2 httpx.Client, so
+                HEAD and GET probes of one origin share a multiplexed
+                connection. Requires httpx (pip install 'scythe-ttp[http2]');
+                falls back to requests if it is not installed.
+            cache_ttl: Seconds a banner-grab result for a (method, URL) pair is
+                reused instead of probing the server again. 0 (the default)
+                disables caching, so every call sees the current version.
+        """
         self.logger = logging.getLogger("HeaderExtractor")
+        self.cache_ttl = cache_ttl
+        # {(method, url): (version, status_code, fetched_at)}
+        self._probe_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._probe_lock = threading.Lock()
+        # Errors that mean a probe failed and GET is worth a try
+        self._request_errors: Tuple[type, ...] = (
+            requests.exceptions.RequestException,
+        )
+        self._want_http2 = http2
+        self._http2 = False
+        # Created on the first probe, so executors that never banner-grab
+        # (e.g. UI mode) do not open a client at all
+        self._session: Any = None
+        self._session_lock = threading.Lock()
+
+    def _client(self) -> Any:
+        """Return the extractor's HTTP client, creating it on first use."""
+        if self._session is not None:
+            return self._session
+        with self._session_lock:
+            if self._session is not None:
+                return self._session
+            client = _http2_client() if self._want_http2 else None
+            if client is not None:
+                import httpx  # type: ignore
+
+                # httpx.Client offers the head/get calls used below
+                self._http2 = True
+                if httpx.HTTPError not in self._request_errors:
+                    self._request_errors += (httpx.HTTPError,)
+                self._session = client
+                return client
+            # Reused across probes so repeated requests to the same host keep
+            # their connection instead of paying a new TCP/TLS handshake
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+            return session
+
+    def close(self) -> None:
+        """Close the extractor's HTTP client and its pooled connections."""
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "HeaderExtractor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _send(self, method: str, url: str, timeout: float) -> Any:
+        """Send a HEAD or GET through the extractor's client, following redirects."""
+        session = self._client()
+        send = session.head if method == "HEAD" else session.get
+        if self._http2:
+            # The httpx client is created with follow_redirects=True
+            return send(url, timeout=timeout)
+        return send(url, timeout=timeout, allow_redirects=True)
 
     def _request_with_head_fallback(
         self, url: str, timeout: int = 10, method: str = "HEAD"
@@ -26,20 +124,20 @@ class HeaderExtractor:
         req_method = (method or "HEAD").upper()
         if req_method == "HEAD":
             try:
-                response = requests.head(url, timeout=timeout, allow_redirects=True)
+                response = self._send("HEAD", url, timeout)
                 # Some apps do not support HEAD and return 4xx/5xx on purpose.
                 # Fall back to GET in those cases for header extraction.
                 if response.status_code >= 400:
                     self.logger.debug(
                         f"HEAD {url} returned {response.status_code}; falling back to GET"
                     )
-                    return requests.get(url, timeout=timeout, allow_redirects=True)
+                    return self._send("GET", url, timeout)
                 return response
-            except requests.exceptions.RequestException:
+            except self._request_errors:
                 self.logger.debug(f"HEAD request failed for {url}; falling back to GET")
-                return requests.get(url, timeout=timeout, allow_redirects=True)
+                return self._send("GET", url, timeout)
 
-        return requests.get(url, timeout=timeout, allow_redirects=True)
+        return self._send("GET", url, timeout)
 
     @staticmethod
     def _normalize_url(url: str) -> str:
@@ -121,40 +219,90 @@ class HeaderExtractor:
         chrome_options.add_argument("--log-level=0")
         chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
+    def _try_version_request(
+        self, url: str, method: str, timeout: int
+    ) -> Tuple[Optional[str], int]:
+        """Issue one request through the pooled session and read the version header."""
+        key = (method, url)
+        if self.cache_ttl:
+            with self._probe_lock:
+                cached = self._probe_cache.get(key)
+                if cached is not None and time.monotonic() - cached[2] < self.cache_ttl:
+                    self._probe_cache.move_to_end(key)
+                    return cached[0], cached[1]
+
+        response = self._send(method, url, timeout)
+        version = self._find_version_header(dict(response.headers))
+
+        if self.cache_ttl:
+            with self._probe_lock:
+                self._probe_cache[key] = (
+                    version,
+                    response.status_code,
+                    time.monotonic(),
+                )
+                self._probe_cache.move_to_end(key)
+                if len(self._probe_cache) > _PROBE_CACHE_SIZE:
+                    self._probe_cache.popitem(last=False)
+        return version, response.status_code
+
     def banner_grab(
-        self, url: str, timeout: int = 10, method: str = "HEAD"
+        self,
+        url: str,
+        timeout: int = 10,
+        method: str = "HEAD",
+        force_all: bool = False,
     ) -> Optional[str]:
         """
         Perform a simple HTTP request to extract the X-SCYTHE-TARGET-VERSION header.
 
         This is a more reliable alternative to Selenium's performance logging
-        for cases where you just need to grab headers.
+        for cases where you just need to grab headers. With method="HEAD" the
+        HEAD response is used when it carries the header; GET is only sent when
+        HEAD fails, is rejected (4xx/5xx) or comes back without the header.
 
         Args:
             url: URL to make the request to
             timeout: Request timeout in seconds
             method: HTTP method to use ("HEAD" or "GET")
+            force_all: Send GET after HEAD even when HEAD already found the header
 
         Returns:
             Version string if header found, None otherwise
         """
         try:
             norm_url = self._normalize_url(url)
+            req_method = (method or "HEAD").upper()
             self.logger.debug(
-                f"Making {method} request to {norm_url} for header extraction"
+                f"Making {req_method} request to {norm_url} for header extraction"
             )
 
-            response = self._request_with_head_fallback(
-                norm_url, timeout=timeout, method=method
-            )
-            if response is None:
-                return None
+            version = None
+            if req_method == "HEAD":
+                try:
+                    version, status = self._try_version_request(
+                        norm_url, "HEAD", timeout
+                    )
+                    if version is None:
+                        self.logger.debug(
+                            f"HEAD {norm_url} returned {status} without the version "
+                            "header; falling back to GET"
+                        )
+                except self._request_errors:
+                    self.logger.debug(
+                        f"HEAD request failed for {norm_url}; falling back to GET"
+                    )
+                if version is None or force_all:
+                    get_version, _ = self._try_version_request(
+                        norm_url, "GET", timeout
+                    )
+                    version = version or get_version
+            else:
+                version, _ = self._try_version_request(norm_url, "GET", timeout)
 
-            # Look for the version header (case-insensitive)
-            version = self._find_version_header(dict(response.headers))
             if version:
                 self.logger.debug(
-                    f"Found target version '{version}' via {method} request to {url}"
+                    f"Found target version '{version}' via {req_method} request to {url}"
                 )
                 return version
             else:
@@ -163,7 +311,7 @@ class HeaderExtractor:
                 )
                 return None
 
-        except requests.exceptions.RequestException as e:
+        except self._request_errors as e:
             hint = (
                 " (tip: include http:// or https://)"
                 if isinstance(url, str)
@@ -203,7 +351,7 @@ class HeaderExtractor:
             # Convert headers to regular dict with string values
             return {k: str(v) for k, v in response.headers.items()}
 
-        except requests.exceptions.RequestException as e:
+        except self._request_errors as e:
             hint = (
                 " (tip: include http:// or https://)"
                 if isinstance(url, str)
@@ -227,41 +375,38 @@ class HeaderExtractor:
             url: URL to make the request to
             timeout: Request timeout in seconds
         """
-        print(f"\n{'=' * 60}")
-        print(f"DEBUG: Header dump for {url}")
-        print(f"{'=' * 60}")
+        # Collect the report and write it once, rather than a write per line
+        lines = [f"\n{'=' * 60}", f"DEBUG: Header dump for {url}", f"{'=' * 60}"]
 
         try:
             # Try HEAD request first
-            print("\n--- HEAD Request ---")
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
-            print(f"Status Code: {response.status_code}")
-            print(f"Headers ({len(response.headers)} total):")
-
-            for name, value in response.headers.items():
-                print(f"  {name}: {value}")
-                if "scythe" in name.lower() or "version" in name.lower():
-                    print("    *** POTENTIAL VERSION HEADER ***")
+            response = self._send("HEAD", url, timeout)
+            self._describe_headers("HEAD", response, lines)
 
             # Try GET request
-            print("\n--- GET Request ---")
-            response = requests.get(url, timeout=timeout, allow_redirects=True)
-            print(f"Status Code: {response.status_code}")
-            print(f"Headers ({len(response.headers)} total):")
-
-            for name, value in response.headers.items():
-                print(f"  {name}: {value}")
-                if "scythe" in name.lower() or "version" in name.lower():
-                    print("    *** POTENTIAL VERSION HEADER ***")
+            response = self._send("GET", url, timeout)
+            self._describe_headers("GET", response, lines)
 
             # Check specifically for the target header
             version = self._find_version_header(dict(response.headers))
-            print(f"\nTarget version extraction result: {version}")
+            lines.append(f"\nTarget version extraction result: {version}")
 
         except Exception as e:
-            print(f"ERROR: Failed to debug headers: {e}")
+            lines.append(f"ERROR: Failed to debug headers: {e}")
+
+        lines.append(f"{'=' * 60}\n")
+        print("\n".join(lines))
 
-        print(f"{'=' * 60}\n")
+    @staticmethod
+    def _describe_headers(method: str, response: Any, lines: List[str]) -> None:
+        """Append a debug_headers section for one response to lines."""
+        lines.append(f"\n--- {method} Request ---")
+        lines.append(f"Status Code: {response.status_code}")
+        lines.append(f"Headers ({len(response.headers)} total):")
+        for name, value in response.headers.items():
+            lines.append(f"  {name}: {value}")
+            if _VERSION_HEADER_RE.search(name):
+                lines.append("    *** POTENTIAL VERSION HEADER ***")
 
     def extract_target_version_hybrid(
         self, driver: WebDriver, target_url: Optional[str] = None
@@ -300,8 +445,88 @@ class HeaderExtractor:
         self.logger.debug("Using Selenium performance logs method")
         return self.extract_target_version(driver, target_url)
 
+    @staticmethod
+    def parse_performance_logs(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Decode performance log entries once, keeping only Network.responseReceived.
+
+        The returned entries keep the {"message": ...} shape with the message
+        already decoded, so passing them as preloaded_logs to both
+        extract_target_version and extract_all_headers doesn't decode every
+        CDP message twice.
+
+        Args:
+            logs: Entries from driver.get_log("performance")
+
+        Returns:
+            Decoded response entries, in log order
+        """
+        parsed = []
+        for log_entry in logs:
+            try:
+                message = log_entry.get("message", {})
+                if isinstance(message, str):
+                    message = json.loads(message)
+                method = message.get("message", {}).get("method")
+            except (json.JSONDecodeError, AttributeError, TypeError):
+                continue
+            if method == "Network.responseReceived":
+                parsed.append({"message": message})
+        return parsed
+
+    def wait_for_response_log(
+        self,
+        driver: WebDriver,
+        target_url: Optional[str] = None,
+        timeout: float = 2.0,
+        poll_interval: float = 0.05,
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect performance log responses until one for target_url arrives.
+
+        Use this after driver.get() instead of a fixed sleep: it returns as soon
+        as a Network.responseReceived entry matching target_url (or any URL if
+        None) has been logged, or after timeout seconds. Reading the log drains
+        the driver's buffer, so pass the returned entries to
+        extract_target_version/extract_all_headers as preloaded_logs.
+
+        Args:
+            driver: WebDriver instance with performance logging enabled
+            target_url: Optional URL the response must match
+            timeout: Maximum time to wait in seconds
+            poll_interval: Delay between log reads in seconds
+
+        Returns:
+            Response entries read while waiting, decoded as by parse_performance_logs
+        """
+        collected: List[Dict[str, Any]] = []
+        if not hasattr(driver, "get_log"):
+            self.logger.warning("WebDriver does not support get_log method")
+            return collected
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                entries = getattr(driver, "get_log")("performance")
+            except Exception as e:
+                self.logger.debug(f"Failed to read performance logs: {e}")
+                return collected
+            parsed = self.parse_performance_logs(entries)
+            collected.extend(parsed)
+            for log_entry in parsed:
+                params = log_entry["message"].get("message", {}).get("params", {})
+                response_url = params.get("response", {}).get("url", "")
+                if not target_url or target_url in response_url:
+                    return collected
+            if time.monotonic() >= deadline:
+                return collected
+            time.sleep(poll_interval)
+
     def extract_target_version(
-        self, driver: WebDriver, target_url: Optional[str] = None
+        self,
+        driver: WebDriver,
+        target_url: Optional[str] = None,
+        preloaded_logs: Optional[List[Dict[str, Any]]] = None,
     ) -> Optional[str]:
         """
         Extract the X-SCYTHE-TARGET-VERSION header from the most recent HTTP response.
@@ -309,17 +534,22 @@ class HeaderExtractor:
         Args:
             driver: WebDriver instance with performance logging enabled
             target_url: Optional URL to filter responses for (if None, uses any response)
+            preloaded_logs: Performance log entries already read from the driver,
+                raw or decoded (e.g. by wait_for_response_log or
+                parse_performance_logs); the driver is not queried when given
 
         Returns:
             Version string if header found, None otherwise
         """
         try:
+            if preloaded_logs is not None:
+                logs = preloaded_logs
             # Get performance logs - using getattr to handle type checking
-            if not hasattr(driver, "get_log"):
+            elif not hasattr(driver, "get_log"):
                 self.logger.warning("WebDriver does not support get_log method")
                 return None
-
-            logs = getattr(driver, "get_log")("performance")
+            else:
+                logs = getattr(driver, "get_log")("performance")
 
             # Look for Network.responseReceived events
             for log_entry in reversed(logs):  # Start with most recent
@@ -389,7 +619,10 @@ class HeaderExtractor:
         return None
 
     def extract_all_headers(
-        self, driver: WebDriver, target_url: Optional[str] = None
+        self,
+        driver: WebDriver,
+        target_url: Optional[str] = None,
+        preloaded_logs: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, str]:
         """
         Extract all headers from the most recent HTTP response.
@@ -399,17 +632,22 @@ class HeaderExtractor:
         Args:
             driver: WebDriver instance with performance logging enabled
             target_url: Optional URL to filter responses for
+            preloaded_logs: Performance log entries already read from the driver,
+                raw or decoded by parse_performance_logs; the driver is not
+                queried when given
 
         Returns:
             Dictionary of headers from the most recent response
         """
         try:
+            if preloaded_logs is not None:
+                logs = preloaded_logs
             # Get performance logs - using getattr to handle type checking
-            if not hasattr(driver, "get_log"):
+            elif not hasattr(driver, "get_log"):
                 self.logger.warning("WebDriver does not support get_log method")
                 return {}
-
-            logs = getattr(driver, "get_log")("performance")
+            else:
+                logs = getattr(driver, "get_log")("performance")
 
             for log_entry in reversed(logs):
                 try:
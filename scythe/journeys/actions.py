@@ -1,6 +1,8 @@
 import time
 import logging
-from typing import Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,6 +15,30 @@ from ..core.ttp import TTP
 from ..core.csrf import CSRFProtection
 
 
+def _bounded_map(
+    pool: ThreadPoolExecutor, fn: Callable[[Any], Any], items: Iterable[Any], window: int
+) -> Iterator[Any]:
+    """
+    Like pool.map(fn, items), but with at most window calls queued or running.
+
+    Executor.map submits every item up front, which drains a lazy payload
+    generator into millions of futures before the first result. Results are
+    yielded in input order.
+    """
+    pending: deque = deque()
+    items = iter(items)
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            break
+    while pending:
+        result = pending.popleft().result()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            break
+        yield result
+
+
 _JSON_MISSING = object()
 
 
@@ -624,37 +650,29 @@ class TTPAction(Action):
             )
             return False
 
-        # Execute TTP payloads via API
-        ttp_results = []
-        success_count = 0
-        total_count = 0
-
-        for payload in self.ttp.get_payloads():
-            total_count += 1
-
-            try:
-                # Execute step via API
-                response = self.ttp.execute_step_api(session, payload, context)
-
-                # Verify result
-                result = self.ttp.verify_result_api(response, context)
-
-                ttp_results.append(
-                    {
-                        "payload": str(payload),
-                        "success": result,
-                        "status_code": response.status_code,
-                        "url": response.url,
-                    }
+        # Execute TTP payloads via API, on a thread pool if the executor asked for one
+        workers = context.get("api_workers") or 1
+        payloads = self.ttp.get_payloads()
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                ttp_results = list(
+                    _bounded_map(
+                        pool,
+                        lambda payload: self._execute_api_payload(
+                            session, payload, context
+                        ),
+                        payloads,
+                        window=workers * 2,
+                    )
                 )
+        else:
+            ttp_results = [
+                self._execute_api_payload(session, payload, context)
+                for payload in payloads
+            ]
 
-                if result:
-                    success_count += 1
-
-            except Exception as e:
-                ttp_results.append(
-                    {"payload": str(payload), "success": False, "error": str(e)}
-                )
+        total_count = len(ttp_results)
+        success_count = sum(1 for r in ttp_results if r["success"])
 
         # Store results
         self.store_result("ttp_name", self.ttp.name)
@@ -680,6 +698,27 @@ class TTPAction(Action):
             # Expecting TTP to fail (security controls working)
             return not has_successes
 
+    def _execute_api_payload(
+        self, session, payload: Any, context: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send a single payload via API and return its result entry."""
+        try:
+            # Execute step via API
+            response = self.ttp.execute_step_api(session, payload, context)
+
+            # Verify result
+            result = self.ttp.verify_result_api(response, context)
+
+            return {
+                "payload": str(payload),
+                "success": result,
+                "status_code": response.status_code,
+                "url": response.url,
+            }
+
+        except Exception as e:
+            return {"payload": str(payload), "success": False, "error": str(e)}
+
 
 class AssertAction(Action):
     """Action to assert conditions and validate state."""
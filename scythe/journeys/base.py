@@ -612,6 +612,7 @@ class Journey:
                 logger.info(
                     f"Target versions detected: {list(set(results['target_versions']))}"
                 )
+            header_extractor.close()
 
             logger.info(f"Journey completed in {results['execution_time']:.2f} seconds")
             logger.info(f"Overall success: {results['overall_success']}")
@@ -2,6 +2,7 @@ import time
 import logging
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
 from typing import Optional, Dict, Any, List
 import requests
 from ..behaviors.base import Behavior
@@ -30,6 +31,9 @@ class JourneyExecutor:
         driver_options: Optional[Dict[str, Any]] = None,
         mode: str = "UI",
         sleep_fn=None,
+        http_session: Optional[requests.Session] = None,
+        workers: int = 1,
+        driver: Optional[WebDriver] = None,
     ):
         """
         Initialize the Journey executor.
@@ -40,12 +44,22 @@ class JourneyExecutor:
             headless: Whether to run browser in headless mode
             behavior: Optional behavior to control execution patterns
             driver_options: Additional Chrome driver options
+            http_session: Optional requests.Session to use in API mode. Pass a
+                          session with a mounted HTTPAdapter to control connection
+                          pooling; a fresh session is created per run otherwise.
+            workers: Number of threads TTP actions use to dispatch payloads in
+                     API mode. Defaults to 1 (payloads are sent one at a time).
+            driver: Optional WebDriver to run UI mode in instead of starting a
+                    new browser. It is not quit when the journey finishes, so
+                    one warm browser can be shared across executors.
         """
         self.journey = journey
         self.target_url = target_url
         self.behavior = behavior
         self.mode = (mode or "UI").upper()
         self._sleep_fn = sleep_fn or time.sleep
+        self.http_session = http_session
+        self.workers = max(1, int(workers))
         self.logger = logging.getLogger(f"Journey.{self.journey.name}")
 
         # Setup Chrome options
@@ -73,12 +87,17 @@ class JourneyExecutor:
         # Enable header extraction capabilities
         HeaderExtractor.enable_logging_for_driver(self.chrome_options)
 
-        self.driver = None
+        # A driver passed in by the caller is reused and left running afterwards
+        self.driver = driver
+        self._owns_driver = driver is None
         self.execution_results = None
         self.header_extractor = HeaderExtractor()
 
     def _setup_driver(self):
         """Initialize the WebDriver."""
+        if self.driver is not None:
+            self.logger.info("Using provided WebDriver for journey execution.")
+            return
         try:
             self.driver = webdriver.Chrome(options=self.chrome_options)
 
@@ -125,7 +144,11 @@ class JourneyExecutor:
         try:
             if self.mode == "API":
                 # API mode: no WebDriver, prepare requests session and context
-                session = requests.Session()
+                session = (
+                    self.http_session
+                    if self.http_session is not None
+                    else requests.Session()
+                )
                 auth_headers = {}
                 auth_cookies = {}
                 if getattr(self.journey, "authentication", None):
@@ -171,6 +194,7 @@ class JourneyExecutor:
                 # Seed journey context for API actions
                 self.journey.set_context("mode", "API")
                 self.journey.set_context("requests_session", session)
+                self.journey.set_context("api_workers", self.workers)
                 self.journey.set_context("auth_headers", auth_headers)
                 self.journey.set_context("auth_cookies", auth_cookies)
 
@@ -334,9 +358,10 @@ class JourneyExecutor:
         }
 
     def _cleanup(self):
-        """Close the WebDriver and print journey summary."""
-        if self.driver:
+        """Close the WebDriver and header extractor, and print journey summary."""
+        if self.driver and self._owns_driver:
             self.driver.quit()
+        self.header_extractor.close()
 
         if not self.execution_results:
             return
@@ -1,3 +1,5 @@
+import mmap
+import os
 from typing import List, Generator, Any
 
 class PayloadGenerator:
@@ -18,6 +20,35 @@ class WordlistPayloadGenerator(PayloadGenerator):
             for line in f:
                 yield line.strip()
 
+class MmapPayloadGenerator(PayloadGenerator):
+    """
+    Generates payloads from a memory-mapped file, one per line.
+
+    The file is never read into memory as a whole and each line is decoded
+    only when it is yielded, so memory use stays flat for very large
+    wordlists.
+
+    Lines are split on the raw newline byte before decoding, so ``encoding``
+    must be ASCII-compatible (UTF-8, latin-1, cp1252, ...). Encodings such as
+    UTF-16 raise ValueError; use WordlistPayloadGenerator for those files.
+    """
+    def __init__(self, filepath: str, encoding: str = 'utf-8'):
+        if ' \t\r\n'.encode(encoding) != b' \t\r\n':
+            raise ValueError(
+                f"MmapPayloadGenerator needs an ASCII-compatible encoding, got {encoding!r}"
+            )
+        self.filepath = filepath
+        self.encoding = encoding
+
+    def __iter__(self) -> Generator[str, None, None]:
+        with open(self.filepath, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b''):
+                    yield line.strip().decode(self.encoding, errors='replace')
+
 class StaticPayloadGenerator(PayloadGenerator):
     """Generates payloads from a static list in memory."""
     def __init__(self, payload_list: List[Any]):
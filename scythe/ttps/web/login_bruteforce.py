@@ -2,6 +2,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import NoSuchElementException
 from typing import Dict, Any, Optional
+import json
 import requests
 
 from ...core.ttp import TTP
@@ -16,6 +17,10 @@ class LoginBruteforceTTP(TTP):
     - UI mode: Uses Selenium to fill login forms
     - API mode: Makes direct HTTP POST requests to login endpoints
     """
+
+    # Marks where the password goes in a pre-serialized API request body
+    BODY_TEMPLATE_PLACEHOLDER = b'__PW__'
+
     def __init__(self,
                  payload_generator: PayloadGenerator,
                  username: str,
@@ -29,7 +34,8 @@ class LoginBruteforceTTP(TTP):
                  username_field: str = 'username',
                  password_field: str = 'password',
                  success_indicators: Optional[Dict[str, Any]] = None,
-                 csrf_protection=None):
+                 csrf_protection=None,
+                 body_template: Optional[bytes] = None):
         """
         Initialize the Login Bruteforce TTP.
 
@@ -48,6 +54,12 @@ class LoginBruteforceTTP(TTP):
             success_indicators: Dict with keys 'status_code' (int), 'response_contains' (str),
                               'response_not_contains' (str) to determine successful login in API mode
             csrf_protection: Optional CSRF protection configuration for API mode
+            body_template: Optional pre-serialized JSON body for API mode, e.g.
+                           b'{"username":"admin","password":"__PW__"}'. Each payload is
+                           JSON-escaped and spliced in at the __PW__ placeholder instead
+                           of serializing a fresh dict per request. It must set
+                           username_field to username and password_field to __PW__.
+                           Ignored when CSRF tokens are injected into the request body.
         """
         super().__init__(
             name="Login Bruteforce",
@@ -73,6 +85,29 @@ class LoginBruteforceTTP(TTP):
             'status_code': 200,
             'response_not_contains': 'invalid'
         }
+        if body_template is not None:
+            self._check_body_template(body_template)
+        self.body_template = body_template
+
+    def _check_body_template(self, body_template: bytes) -> None:
+        """Ensure a body template sends the same credentials as the dict body would."""
+        placeholder = self.BODY_TEMPLATE_PLACEHOLDER.decode()
+        if self.BODY_TEMPLATE_PLACEHOLDER not in body_template:
+            raise ValueError(f"body_template must contain the {placeholder} placeholder")
+        try:
+            fields = json.loads(body_template)
+        except ValueError as e:
+            raise ValueError(f"body_template is not valid JSON: {e}")
+        if not isinstance(fields, dict):
+            raise ValueError("body_template must be a JSON object")
+        if fields.get(self.username_field) != self.username:
+            raise ValueError(
+                f"body_template must set {self.username_field!r} to the username {self.username!r}"
+            )
+        if fields.get(self.password_field) != placeholder:
+            raise ValueError(
+                f"body_template must set {self.password_field!r} to {placeholder!r}"
+            )
 
     def get_payloads(self):
         """Yields passwords from the configured generator."""
@@ -128,20 +163,29 @@ class LoginBruteforceTTP(TTP):
         
         url = urljoin(base_url, self.api_endpoint or '/login')
         
-        # Build request body
-        body = {
-            self.username_field: self.username,
-            self.password_field: payload
-        }
-        
         # Merge auth headers from context
         headers = {}
         auth_headers = context.get('auth_headers', {})
         if auth_headers:
             headers.update(auth_headers)
 
-        # Inject CSRF token if configured
+        # Build request body; a template is only usable when nothing has to be
+        # added to the body afterwards
         csrf_protection = context.get('csrf_protection')
+        raw_body = None
+        body = None
+        if self.body_template is not None and not (
+            isinstance(csrf_protection, CSRFProtection) and csrf_protection.inject_into == 'body'
+        ):
+            raw_body = self._render_body_template(payload)
+            headers['Content-Type'] = 'application/json'
+        else:
+            body = {
+                self.username_field: self.username,
+                self.password_field: payload
+            }
+
+        # Inject CSRF token if configured
         if isinstance(csrf_protection, CSRFProtection):
             headers, body = csrf_protection.inject_token(
                 headers=headers,
@@ -160,7 +204,10 @@ class LoginBruteforceTTP(TTP):
                 time.sleep(wait_s)
 
         # Make the request
-        response = session.post(url, json=body, headers=headers or None, timeout=10.0)
+        if raw_body is not None:
+            response = session.post(url, data=raw_body, headers=headers, timeout=10.0)
+        else:
+            response = session.post(url, json=body, headers=headers or None, timeout=10.0)
         
         # Handle rate limiting
         if response.status_code == 429:
@@ -177,6 +224,11 @@ class LoginBruteforceTTP(TTP):
 
         return response
     
+    def _render_body_template(self, payload: str) -> bytes:
+        """Splice a JSON-escaped payload into the configured body template."""
+        escaped = json.dumps(str(payload))[1:-1].encode('utf-8')
+        return self.body_template.replace(self.BODY_TEMPLATE_PLACEHOLDER, escaped)
+
     def verify_result_api(self, response: requests.Response, context: Dict[str, Any]) -> bool:
         """
         Verifies if the login attempt was successful based on the API response.
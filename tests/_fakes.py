@@ -0,0 +1,39 @@
+"""
+Lightweight stand-ins for requests objects used by the auth tests.
+
+Mock(spec=requests.Session) introspects the whole Session class every time it
+is built; these fakes only carry the attributes the login code touches.
+"""
+
+from unittest.mock import MagicMock
+
+
+class FakeResponse:
+    """Minimal requests.Response double with a JSON body."""
+
+    def __init__(self, status_code=200, json_data=None, text="", headers=None, cookies=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.cookies = cookies or {}
+        # No raw content, so callers fall back to json()
+        self.content = None
+        self._json_data = json_data
+
+    def json(self):
+        if self._json_data is None:
+            raise ValueError("No JSON body")
+        return self._json_data
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Minimal requests.Session double whose get/post record their calls."""
+
+    def __init__(self):
+        self.headers = {}
+        self.cookies = MagicMock()
+        self.get = MagicMock()
+        self.post = MagicMock()
@@ -0,0 +1,20 @@
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+
+from scythe.auth import cookie_jwt
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    """
+    Start and end every test with an empty process-wide CookieJWTAuth token cache.
+
+    Login tokens are shared by all instances in a process, so without this a
+    test could pick up an entry another test left behind. That matters most
+    under pytest-xdist (``pytest -n auto``), where each worker runs an
+    arbitrary subset of the suite in its own order.
+    """
+    cookie_jwt._TOKEN_CACHE.clear()
+    yield
+    cookie_jwt._TOKEN_CACHE.clear()
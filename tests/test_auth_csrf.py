@@ -11,88 +11,96 @@ from scythe.auth.basic import BasicAuth
 from scythe.auth.bearer import BearerTokenAuth
 from scythe.auth.cookie_jwt import CookieJWTAuth
 from scythe.core.csrf import CSRFProtection
-
-
-class TestAuthenticationBaseWithCSRF(unittest.TestCase):
-    """Test CSRF support in base Authentication class."""
-
-    def test_base_auth_accepts_csrf_protection(self):
-        """Test that Authentication base class accepts csrf_protection parameter."""
-        csrf = CSRFProtection(
-            cookie_name='csrftoken',
-            header_name='X-CSRF-Token'
-        )
-
-        class TestAuth(Authentication):
-            def authenticate(self, driver, target_url):
-                return True
-
-            def is_authenticated(self, driver):
-                return True
-
-        auth = TestAuth(
-            name="Test Auth",
-            description="Test",
-            csrf_protection=csrf
-        )
-
-        self.assertIsNotNone(auth.csrf_protection)
-        self.assertEqual(auth.csrf_protection.cookie_name, 'csrftoken')
-
-    def test_base_auth_csrf_protection_optional(self):
-        """Test that csrf_protection is optional."""
-        class TestAuth(Authentication):
-            def authenticate(self, driver, target_url):
-                return True
-
-            def is_authenticated(self, driver):
-                return True
-
-        auth = TestAuth(
-            name="Test Auth",
-            description="Test"
-            # No csrf_protection parameter
-        )
-
-        self.assertIsNone(auth.csrf_protection)
+from tests._fakes import FakeResponse, FakeSession
+
+# Shared CSRF configurations for tests that only read them. Tests that log in
+# build their own, since extracting a token stores it on the instance.
+_DEFAULT_CSRF = CSRFProtection()
+_STD_CSRF = CSRFProtection(cookie_name='csrftoken', header_name='X-CSRF-Token')
+_DJANGO_CSRF = CSRFProtection(
+    extract_from='cookie',
+    cookie_name='csrftoken',      # Django default
+    header_name='X-CSRFToken',     # Django header name
+    inject_into='header'
+)
+_HOST_CSRF = CSRFProtection(
+    extract_from='cookie',
+    cookie_name='__Host-csrf_',
+    header_name='X-CSRF-Token',
+    inject_into='header'
+)
+_COOKIE_CSRF = CSRFProtection(extract_from='cookie', cookie_name='csrftoken')
+_FIBER_CSRF = CSRFProtection(
+    extract_from='cookie',
+    cookie_name='__Host-csrf_',
+    header_name='X-Csrf-Token'
+)
+
+class _MinimalAuth(Authentication):
+    """Concrete Authentication for exercising the base class."""
+
+    def authenticate(self, driver, target_url):
+        return True
+
+    def is_authenticated(self, driver):
+        return True
+
+
+# Each auth class with the minimal arguments it needs, for checks shared by all of them
+AUTH_FACTORIES = [
+    (_MinimalAuth, dict(name='Test Auth', description='Test')),
+    (BasicAuth, dict(username='user', password='pass')),
+    (BearerTokenAuth, dict(token='test-token')),
+    (CookieJWTAuth, dict(
+        login_url='https://api.example.com/login',
+        username='user@example.com',
+        password='secret'
+    )),
+]
+
+# Attribute names of requests.Session, read once. Speccing a Mock from a list
+# skips re-introspecting the class for every test; copy.copy of a spec'd Mock
+# would share its child mocks (and their return values) instead.
+_SESSION_SPEC = dir(requests.Session)
+
+
+def make_session():
+    """Mock requests.Session with a MagicMock cookie jar."""
+    session = Mock(spec=_SESSION_SPEC)
+    session.cookies = MagicMock()
+    return session
+
+
+class TestAuthClassesCSRFParameter(unittest.TestCase):
+    """Test the csrf_protection parameter across all auth classes."""
+
+    def test_auth_accepts_csrf(self):
+        """Test each auth class stores the CSRF protection it is given."""
+        for auth_class, kwargs in AUTH_FACTORIES:
+            with self.subTest(auth=auth_class.__name__):
+                auth = auth_class(**kwargs, csrf_protection=_STD_CSRF)
+
+                self.assertIsNotNone(auth.csrf_protection)
+                self.assertEqual(auth.csrf_protection.cookie_name, 'csrftoken')
+
+    def test_auth_without_csrf(self):
+        """Test each auth class works without CSRF."""
+        for auth_class, kwargs in AUTH_FACTORIES:
+            with self.subTest(auth=auth_class.__name__):
+                auth = auth_class(**kwargs)
+
+                self.assertIsNone(auth.csrf_protection)
 
 
 class TestBasicAuthWithCSRF(unittest.TestCase):
     """Test CSRF support in BasicAuth."""
 
-    def test_basic_auth_initialization_with_csrf(self):
-        """Test BasicAuth accepts CSRF protection."""
-        csrf = CSRFProtection(
-            cookie_name='csrftoken',
-            header_name='X-CSRF-Token'
-        )
-
-        auth = BasicAuth(
-            username='user',
-            password='pass',
-            csrf_protection=csrf
-        )
-
-        self.assertIsNotNone(auth.csrf_protection)
-        self.assertEqual(auth.csrf_protection.cookie_name, 'csrftoken')
-
-    def test_basic_auth_without_csrf(self):
-        """Test BasicAuth works without CSRF."""
-        auth = BasicAuth(
-            username='user',
-            password='pass'
-            # No csrf_protection
-        )
-
-        self.assertIsNone(auth.csrf_protection)
-
     def test_basic_auth_csrf_docstring_updated(self):
         """Test that BasicAuth docstring mentions CSRF."""
-        csrf = CSRFProtection()
         auth = BasicAuth(
             username='user',
             password='pass',
-            csrf_protection=csrf
+            csrf_protection=_DEFAULT_CSRF
         )
 
         # Verify the csrf_protection parameter was passed
@@ -102,35 +110,11 @@ class TestBasicAuthWithCSRF(unittest.TestCase):
 class TestBearerTokenAuthWithCSRF(unittest.TestCase):
     """Test CSRF support in BearerTokenAuth."""
 
-    def test_bearer_auth_initialization_with_csrf(self):
-        """Test BearerTokenAuth accepts CSRF protection."""
-        csrf = CSRFProtection(
-            cookie_name='csrftoken',
-            header_name='X-CSRF-Token'
-        )
-
-        auth = BearerTokenAuth(
-            token='test-token',
-            csrf_protection=csrf
-        )
-
-        self.assertIsNotNone(auth.csrf_protection)
-
-    def test_bearer_auth_without_csrf(self):
-        """Test BearerTokenAuth works without CSRF."""
-        auth = BearerTokenAuth(
-            token='test-token'
-            # No csrf_protection
-        )
-
-        self.assertIsNone(auth.csrf_protection)
-
     def test_bearer_auth_get_auth_headers_with_csrf_configured(self):
         """Test that get_auth_headers works with CSRF configured."""
-        csrf = CSRFProtection()
         auth = BearerTokenAuth(
             token='my-bearer-token',
-            csrf_protection=csrf
+            csrf_protection=_DEFAULT_CSRF
         )
 
         headers = auth.get_auth_headers()
@@ -141,33 +125,6 @@ class TestBearerTokenAuthWithCSRF(unittest.TestCase):
 class TestCookieJWTAuthWithCSRF(unittest.TestCase):
     """Test CSRF support in CookieJWTAuth."""
 
-    def test_cookie_jwt_auth_initialization_with_csrf(self):
-        """Test CookieJWTAuth accepts CSRF protection."""
-        csrf = CSRFProtection(
-            cookie_name='csrftoken',
-            header_name='X-CSRF-Token'
-        )
-
-        auth = CookieJWTAuth(
-            login_url='https://api.example.com/login',
-            username='user@example.com',
-            password='secret',
-            csrf_protection=csrf
-        )
-
-        self.assertIsNotNone(auth.csrf_protection)
-
-    def test_cookie_jwt_auth_without_csrf(self):
-        """Test CookieJWTAuth works without CSRF."""
-        auth = CookieJWTAuth(
-            login_url='https://api.example.com/login',
-            username='user@example.com',
-            password='secret'
-            # No csrf_protection
-        )
-
-        self.assertIsNone(auth.csrf_protection)
-
     def test_cookie_jwt_auth_login_with_csrf_protection(self):
         """Test that CookieJWTAuth handles CSRF during login."""
         csrf = CSRFProtection(
@@ -176,25 +133,20 @@ class TestCookieJWTAuthWithCSRF(unittest.TestCase):
             header_name='X-CSRF-Token'
         )
 
-        # Mock session
-        mock_session = Mock(spec=requests.Session)
+        # Fake session
+        mock_session = FakeSession()
 
-        # Mock GET response (for initial CSRF token)
-        mock_get_response = Mock(spec=requests.Response)
-        mock_get_response.status_code = 200
-        mock_get_response.text = '{"status":"ok"}'
+        # GET response (for initial CSRF token)
+        mock_get_response = FakeResponse(text='{"status":"ok"}')
 
-        # Mock POST response (login)
-        mock_post_response = Mock(spec=requests.Response)
-        mock_post_response.status_code = 200
-        mock_post_response.text = '{"token":"jwt-token-123"}'
-        mock_post_response.json.return_value = {'token': 'jwt-token-123'}
-        mock_post_response.raise_for_status = Mock()
+        # POST response (login)
+        mock_post_response = FakeResponse(
+            text='{"token":"jwt-token-123"}',
+            json_data={'token': 'jwt-token-123'}
+        )
 
-        # Setup mock session
-        mock_session_cookies = MagicMock()
-        mock_session_cookies.get.return_value = 'csrf-token-from-cookie'
-        mock_session.cookies = mock_session_cookies
+        # Setup session cookies
+        mock_session.cookies.get.return_value = 'csrf-token-from-cookie'
 
         mock_session.get.return_value = mock_get_response
         mock_session.post.return_value = mock_post_response
@@ -232,8 +184,8 @@ class TestCookieJWTAuthWithCSRF(unittest.TestCase):
             auto_extract=True
         )
 
-        # Mock session
-        mock_session = Mock(spec=requests.Session)
+        # Fake session
+        mock_session = FakeSession()
 
         # Initial CSRF token
         initial_csrf = 'csrf-token-initial'
@@ -241,22 +193,15 @@ class TestCookieJWTAuthWithCSRF(unittest.TestCase):
         # Updated CSRF token (from POST response)
         updated_csrf = 'csrf-token-updated'
 
-        # Mock responses
-        mock_get_response = Mock(spec=requests.Response)
-        mock_get_response.status_code = 200
-
-        mock_post_response = Mock(spec=requests.Response)
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = {'token': 'jwt-123'}
-        mock_post_response.raise_for_status = Mock()
+        # Responses
+        mock_get_response = FakeResponse()
+        mock_post_response = FakeResponse(json_data={'token': 'jwt-123'})
 
         # Setup session cookies
-        mock_session_cookies = MagicMock()
-        mock_session_cookies.get.side_effect = [
+        mock_session.cookies.get.side_effect = [
             initial_csrf,  # First GET request
             updated_csrf   # After POST request
         ]
-        mock_session.cookies = mock_session_cookies
 
         mock_session.get.return_value = mock_get_response
         mock_session.post.return_value = mock_post_response
@@ -286,19 +231,13 @@ class TestCookieJWTAuthWithCSRF(unittest.TestCase):
         )
 
         # Mock session
-        mock_session = Mock(spec=requests.Session)
-        mock_get_response = Mock(spec=requests.Response)
-        mock_get_response.status_code = 200
+        mock_session = make_session()
+        mock_get_response = FakeResponse()
 
-        mock_post_response = Mock(spec=requests.Response)
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = {'token': 'jwt-123'}
-        mock_post_response.raise_for_status = Mock()
+        mock_post_response = FakeResponse(json_data={'token': 'jwt-123'})
 
         # Setup session cookies with CSRF token
-        mock_session_cookies = MagicMock()
-        mock_session_cookies.get.return_value = 'csrf-token-value'
-        mock_session.cookies = mock_session_cookies
+        mock_session.cookies.get.return_value = 'csrf-token-value'
 
         mock_session.get.return_value = mock_get_response
         mock_session.post.return_value = mock_post_response
@@ -340,35 +279,36 @@ class TestCookieJWTAuthWithCSRF(unittest.TestCase):
 class TestAuthenticationSessionEndpoint(unittest.TestCase):
     """Test session_endpoint feature for all authentication methods."""
 
-    def test_basic_auth_with_session_endpoint(self):
-        """Test BasicAuth with session_endpoint."""
-        auth = BasicAuth(
+    @classmethod
+    def setUpClass(cls):
+        # Auth objects for the tests that only read attributes back
+        cls.basic_auth = BasicAuth(
             username='user',
             password='pass',
             session_endpoint='https://app.com/session'
         )
-
-        self.assertEqual(auth.session_endpoint, 'https://app.com/session')
-
-    def test_bearer_token_auth_with_session_endpoint(self):
-        """Test BearerTokenAuth with session_endpoint."""
-        auth = BearerTokenAuth(
+        cls.bearer_auth = BearerTokenAuth(
             token='test-token',
             session_endpoint='https://api.example.com/session'
         )
-
-        self.assertEqual(auth.session_endpoint, 'https://api.example.com/session')
-
-    def test_cookie_jwt_auth_with_session_endpoint(self):
-        """Test CookieJWTAuth with session_endpoint."""
-        auth = CookieJWTAuth(
+        cls.cookie_jwt_auth = CookieJWTAuth(
             login_url='https://api.example.com/login',
             username='user',
             password='pass',
             session_endpoint='https://api.example.com/login'  # GET this first
         )
 
-        self.assertEqual(auth.session_endpoint, 'https://api.example.com/login')
+    def test_basic_auth_with_session_endpoint(self):
+        """Test BasicAuth with session_endpoint."""
+        self.assertEqual(self.basic_auth.session_endpoint, 'https://app.com/session')
+
+    def test_bearer_token_auth_with_session_endpoint(self):
+        """Test BearerTokenAuth with session_endpoint."""
+        self.assertEqual(self.bearer_auth.session_endpoint, 'https://api.example.com/session')
+
+    def test_cookie_jwt_auth_with_session_endpoint(self):
+        """Test CookieJWTAuth with session_endpoint."""
+        self.assertEqual(self.cookie_jwt_auth.session_endpoint, 'https://api.example.com/login')
 
     def test_session_endpoint_called_before_login(self):
         """Test that session_endpoint is called before login attempt."""
@@ -379,21 +319,15 @@ class TestAuthenticationSessionEndpoint(unittest.TestCase):
         )
 
         # Mock session
-        mock_session = Mock(spec=requests.Session)
+        mock_session = make_session()
 
         # Mock responses
-        mock_session_response = Mock(spec=requests.Response)
-        mock_session_response.status_code = 200
+        mock_session_response = FakeResponse()
 
-        mock_login_response = Mock(spec=requests.Response)
-        mock_login_response.status_code = 200
-        mock_login_response.json.return_value = {'token': 'jwt-123'}
-        mock_login_response.raise_for_status = Mock()
+        mock_login_response = FakeResponse(json_data={'token': 'jwt-123'})
 
         # Setup session cookies
-        mock_session_cookies = MagicMock()
-        mock_session_cookies.get.return_value = 'csrf-token-from-session'
-        mock_session.cookies = mock_session_cookies
+        mock_session.cookies.get.return_value = 'csrf-token-from-session'
 
         # First GET to session endpoint, then GET for CSRF, then POST for login
         mock_session.get.return_value = mock_session_response
@@ -426,21 +360,15 @@ class TestAuthenticationSessionEndpoint(unittest.TestCase):
         )
 
         # Mock session
-        mock_session = Mock(spec=requests.Session)
+        mock_session = make_session()
 
         # Mock responses
-        mock_session_response = Mock(spec=requests.Response)
-        mock_session_response.status_code = 200
+        mock_session_response = FakeResponse()
 
-        mock_login_response = Mock(spec=requests.Response)
-        mock_login_response.status_code = 200
-        mock_login_response.json.return_value = {'token': 'jwt-token-xyz'}
-        mock_login_response.raise_for_status = Mock()
+        mock_login_response = FakeResponse(json_data={'token': 'jwt-token-xyz'})
 
         # Setup session cookies with CSRF token
-        mock_session_cookies = MagicMock()
-        mock_session_cookies.get.return_value = '__Host-csrf_token-value'
-        mock_session.cookies = mock_session_cookies
+        mock_session.cookies.get.return_value = '__Host-csrf_token-value'
 
         mock_session.get.return_value = mock_session_response
         mock_session.post.return_value = mock_login_response
@@ -468,79 +396,54 @@ class TestAuthenticationSessionEndpoint(unittest.TestCase):
 class TestAuthenticationCSRFFrameworkPatterns(unittest.TestCase):
     """Test different framework patterns with authentication."""
 
-    def test_django_csrf_with_cookie_jwt_auth(self):
-        """Test Django CSRF pattern with CookieJWTAuth."""
-        csrf = CSRFProtection(
-            extract_from='cookie',
-            cookie_name='csrftoken',      # Django default
-            header_name='X-CSRFToken',     # Django header name
-            inject_into='header'
-        )
-
-        auth = CookieJWTAuth(
+    @classmethod
+    def setUpClass(cls):
+        # Each pattern is only configured and read back, so build them once
+        cls.django_auth = CookieJWTAuth(
             login_url='https://django-app.com/api/login',
             username='user',
             password='pass',
-            csrf_protection=csrf
+            csrf_protection=_DJANGO_CSRF
         )
-
-        self.assertEqual(auth.csrf_protection.cookie_name, 'csrftoken')
-        self.assertEqual(auth.csrf_protection.header_name, 'X-CSRFToken')
-
-    def test_custom_host_csrf_with_bearer_token_auth(self):
-        """Test custom __Host-csrf_ pattern with BearerTokenAuth."""
-        csrf = CSRFProtection(
-            extract_from='cookie',
-            cookie_name='__Host-csrf_',
-            header_name='X-CSRF-Token',
-            inject_into='header'
-        )
-
-        auth = BearerTokenAuth(
+        cls.host_bearer_auth = BearerTokenAuth(
             token='existing-token',
-            csrf_protection=csrf
-        )
-
-        self.assertEqual(auth.csrf_protection.cookie_name, '__Host-csrf_')
-
-    def test_csrf_with_basic_auth_ui_mode(self):
-        """Test CSRF with BasicAuth in UI mode (browser handles it)."""
-        csrf = CSRFProtection(
-            extract_from='cookie',
-            cookie_name='csrftoken'
+            csrf_protection=_HOST_CSRF
         )
-
-        auth = BasicAuth(
+        cls.basic_ui_auth = BasicAuth(
             username='testuser',
             password='testpass',
             login_url='https://app.com/login',
-            csrf_protection=csrf
-        )
-
-        # UI mode authentication uses WebDriver/browser which handles CSRF
-        self.assertIsNotNone(auth.csrf_protection)
-        # The browser (Selenium/WebDriver) automatically handles CSRF in forms
-
-    def test_go_fiber_pattern_with_session_endpoint(self):
-        """Test Go Fiber pattern: separate session and login endpoints with CSRF."""
-        csrf = CSRFProtection(
-            extract_from='cookie',
-            cookie_name='__Host-csrf_',
-            header_name='X-Csrf-Token'
+            csrf_protection=_COOKIE_CSRF
         )
-
-        auth = CookieJWTAuth(
+        cls.fiber_auth = CookieJWTAuth(
             login_url='https://localhost:8181/api/v1/auth/login-handler',
             username='testuser@test-mfa.local',
             password='TestPassword123!',
             username_field='email',
             password_field='password',
-            csrf_protection=csrf,
+            csrf_protection=_FIBER_CSRF,
             session_endpoint='https://localhost:8181/login'  # GET public page first
         )
 
-        self.assertEqual(auth.session_endpoint, 'https://localhost:8181/login')
-        self.assertEqual(auth.csrf_protection.cookie_name, '__Host-csrf_')
+    def test_django_csrf_with_cookie_jwt_auth(self):
+        """Test Django CSRF pattern with CookieJWTAuth."""
+        self.assertEqual(self.django_auth.csrf_protection.cookie_name, 'csrftoken')
+        self.assertEqual(self.django_auth.csrf_protection.header_name, 'X-CSRFToken')
+
+    def test_custom_host_csrf_with_bearer_token_auth(self):
+        """Test custom __Host-csrf_ pattern with BearerTokenAuth."""
+        self.assertEqual(self.host_bearer_auth.csrf_protection.cookie_name, '__Host-csrf_')
+
+    def test_csrf_with_basic_auth_ui_mode(self):
+        """Test CSRF with BasicAuth in UI mode (browser handles it)."""
+        # UI mode authentication uses WebDriver/browser which handles CSRF
+        self.assertIsNotNone(self.basic_ui_auth.csrf_protection)
+        # The browser (Selenium/WebDriver) automatically handles CSRF in forms
+
+    def test_go_fiber_pattern_with_session_endpoint(self):
+        """Test Go Fiber pattern: separate session and login endpoints with CSRF."""
+        self.assertEqual(self.fiber_auth.session_endpoint, 'https://localhost:8181/login')
+        self.assertEqual(self.fiber_auth.csrf_protection.cookie_name, '__Host-csrf_')
 
 
 if __name__ == '__main__':
@@ -85,6 +85,15 @@ class TestAuthenticationBase(unittest.TestCase):
         self.assertEqual(auth.get_auth_data("test_key"), "test_value")
         self.assertEqual(auth.get_auth_data("nonexistent", "default"), "default")
 
+    def test_store_auth_data_bulk(self):
+        """Test storing several auth data values at once."""
+        auth = MockAuthentication("Test Auth", "Test Description")
+        auth.store_auth_data("kept", 1)
+
+        auth.store_auth_data_bulk({"jwt": "abc", "login_time": 123.0})
+
+        self.assertEqual(auth.auth_data, {"kept": 1, "jwt": "abc", "login_time": 123.0})
+
     def test_clear_auth_data(self):
         """Test clearing auth data."""
         auth = MockAuthentication("Test Auth", "Test Description")
@@ -1,6 +1,7 @@
 import io
 import json
 import os
+import shutil
 import sqlite3
 import socket
 import sys
@@ -12,15 +13,59 @@ from contextlib import redirect_stdout, redirect_stderr
 
 from scythe.cli.main import main as scythe_main
 
+cli_module = sys.modules["scythe.cli.main"]
+
+# Keep test projects (and their SQLite files) on tmpfs where there is one
+_TMP_BASE = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
 
 class TestScytheCLI(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._start_cwd = os.getcwd()
+        # Initialize one project per class; tests that only need an initialized
+        # project copy it instead of running init (and the schema DDL) again
+        cls._template_tmpdir = tempfile.TemporaryDirectory(dir=_TMP_BASE)
+        cls._template_root = os.path.join(cls._template_tmpdir.name, "project")
+        scythe_main(["init", "--path", cls._template_root])
+        # Closing the cached connection checkpoints the WAL into scythe.db
+        cli_module._close_db(cls._template_root)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template_tmpdir.cleanup()
+
     def setUp(self):
-        self.tmpdir = tempfile.TemporaryDirectory()
+        self.tmpdir = tempfile.TemporaryDirectory(dir=_TMP_BASE)
         self.addCleanup(self.tmpdir.cleanup)
         self.root = self.tmpdir.name
+        self._ro_conn = None
+
+    def _db(self):
+        """Read-only connection to the project database, opened once per test."""
+        if self._ro_conn is None:
+            db_path = os.path.join(self.root, ".scythe", "scythe.db")
+            self._ro_conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+            self.addCleanup(self._ro_conn.close)
+        return self._ro_conn
+
+    def _use_initialized_project(self):
+        """Turn self.root into an initialized project, as `scythe init` would."""
+        shutil.copytree(self._template_root, self.root, dirs_exist_ok=True)
+        self.addCleanup(cli_module._close_db, self.root)
+
+    def _insert_test_row(self, name):
+        """Register a test in the project DB without writing its template."""
+        filename = f"{name}.py"
+        with cli_module._write_txn(cli_module._open_db(self.root)) as conn:
+            conn.execute(
+                cli_module._SQL_INSERT_TEST,
+                (filename, os.path.join(".scythe", "scythe_tests", filename), "", ""),
+            )
 
     def _chdir(self, path):
-        self.addCleanup(os.chdir, os.getcwd())
+        # Tests only chdir from the directory the class started in
+        self.addCleanup(os.chdir, self._start_cwd)
         os.chdir(path)
 
     def _free_port(self):
@@ -37,23 +82,23 @@ class TestScytheCLI(unittest.TestCase):
         )
         db_path = os.path.join(self.root, ".scythe", "scythe.db")
         self.assertTrue(os.path.exists(db_path))
-        # verify tables exist
-        conn = sqlite3.connect(db_path)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='tests'"
-            )
-            self.assertIsNotNone(cur.fetchone())
-            cur.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='runs'"
-            )
-            self.assertIsNotNone(cur.fetchone())
-        finally:
-            conn.close()
+        # verify tables exist (table_info is empty for a missing table)
+        cur = self._db().cursor()
+        cur.execute("PRAGMA table_info(tests)")
+        self.assertIsNotNone(cur.fetchone())
+        cur.execute("PRAGMA table_info(runs)")
+        self.assertIsNotNone(cur.fetchone())
+        cur.execute("PRAGMA journal_mode")
+        self.assertEqual(cur.fetchone()[0], "wal")
+        cur.execute("PRAGMA user_version")
+        self.assertEqual(cur.fetchone()[0], 1)
+        cur.execute("PRAGMA index_list(runs)")
+        self.assertEqual(
+            {row[1] for row in cur.fetchall()}, {"idx_runs_name", "idx_runs_dt"}
+        )
 
     def test_new_creates_test_file_and_db_entry(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         code = scythe_main(["new", "alpha_test"])
         self.assertEqual(code, 0)
@@ -63,19 +108,30 @@ class TestScytheCLI(unittest.TestCase):
             content = f.read()
         self.assertIn("scythe_test_definition", content)
         # check DB entry
-        db_path = os.path.join(self.root, ".scythe", "scythe.db")
-        conn = sqlite3.connect(db_path)
-        try:
-            cur = conn.cursor()
-            cur.execute("SELECT name, path FROM tests WHERE name=?", ("alpha_test.py",))
-            row = cur.fetchone()
-            self.assertIsNotNone(row)
-            self.assertEqual(row[0], "alpha_test.py")
-        finally:
-            conn.close()
+        row = self._db().execute(
+            "SELECT name, path FROM tests WHERE name=?", ("alpha_test.py",)
+        ).fetchone()
+        self.assertIsNotNone(row)
+        self.assertEqual(row[0], "alpha_test.py")
+
+    def test_new_refuses_existing_test(self):
+        self._use_initialized_project()
+        self._chdir(self.root)
+        self.assertEqual(scythe_main(["new", "golf_test"]), 0)
+        test_path = os.path.join(self.root, ".scythe", "scythe_tests", "golf_test.py")
+        self.assertEqual(os.stat(test_path).st_mode & 0o777, 0o755)
+        with open(test_path, "w", encoding="utf-8") as f:
+            f.write("# edited\n")
+
+        with redirect_stderr(io.StringIO()), redirect_stdout(io.StringIO()):
+            code = scythe_main(["new", "golf_test"])
+
+        self.assertNotEqual(code, 0)
+        with open(test_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), "# edited\n")
 
     def test_run_records_run_success(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         scythe_main(["new", "bravo_test"])
         test_path = os.path.join(self.root, ".scythe", "scythe_tests", "bravo_test.py")
@@ -98,24 +154,83 @@ class TestScytheCLI(unittest.TestCase):
         out = buf.getvalue()
         self.assertIsInstance(out, str)
         # Check DB run entry
+        row = self._db().execute(
+            "SELECT name_of_test, result FROM runs ORDER BY rowid DESC LIMIT 1"
+        ).fetchone()
+        self.assertIsNotNone(row)
+        self.assertEqual(row[0], "bravo_test.py")
+        self.assertEqual(row[1], "SUCCESS")
+
+    def test_record_run_truncates_long_output(self):
+        # Database from before raw_output_len was added
+        os.makedirs(os.path.join(self.root, ".scythe"))
         db_path = os.path.join(self.root, ".scythe", "scythe.db")
         conn = sqlite3.connect(db_path)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT name_of_test, result FROM runs ORDER BY rowid DESC LIMIT 1"
-            )
-            row = cur.fetchone()
-            self.assertIsNotNone(row)
-            self.assertEqual(row[0], "bravo_test.py")
-            self.assertEqual(row[1], "SUCCESS")
-        finally:
-            conn.close()
+        conn.execute(
+            "CREATE TABLE runs (datetime TEXT NOT NULL, name_of_test TEXT NOT NULL, "
+            "x_scythe_target_version TEXT, result TEXT NOT NULL, raw_output TEXT NOT NULL)"
+        )
+        conn.close()
+        self.addCleanup(cli_module._close_db, self.root)
+
+        output = "H" * 40000 + "M" * 10000 + "T" * 40000
+        cli_module._record_run(self.root, "echo_test", 0, output, None)
+
+        stored, length = self._db().execute(
+            "SELECT raw_output, raw_output_len FROM runs"
+        ).fetchone()
+        self.assertEqual(length, len(output))
+        self.assertTrue(stored.startswith("H" * 32768))
+        self.assertTrue(stored.endswith("T" * 32768))
+        self.assertIn(f"[truncated {len(output) - 65536} characters]", stored)
+        self.assertNotIn("M", stored)
+
+    def test_parse_version_from_output(self):
+        parse = cli_module._parse_version_from_output
+        self.assertEqual(parse("Target versions detected: ['1.0', '2.0']"), "1.0")
+        # A header wins even when it comes after a detected-versions list
+        self.assertEqual(
+            parse("Target versions detected: ['2.0.1']\n'X-Scythe-Target-Version': '3.1'"),
+            "3.1",
+        )
+        self.assertEqual(parse("Target versions detected: none X-Scythe-Target-Version: 9.9"), "9.9")
+        self.assertIsNone(parse("no version here"))
+        filler = "x" * 20000
+        self.assertEqual(parse(filler + "Target versions detected: ['4.2']"), "4.2")
+        self.assertIsNone(parse(filler + "X-Scythe-Target-Version: 5.0" + filler))
+
+    def test_run_batch_writes_runs_on_exit(self):
+        self._use_initialized_project()
+
+        def count_runs():
+            return self._db().execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+        with cli_module.scythe_run_batch(self.root):
+            for i in range(3):
+                cli_module._record_run(self.root, f"t{i}", i, "out", None)
+            self.assertEqual(count_runs(), 0)
+        self.assertEqual(count_runs(), 3)
+
+        cli_module._record_run(self.root, "t3", 0, "out", None)
+        self.assertEqual(count_runs(), 4)
+
+    def test_write_txn_rolls_back_on_error(self):
+        self._use_initialized_project()
+        conn = cli_module._open_db(self.root)
+        self.assertIsNone(conn.isolation_level)
+
+        with self.assertRaises(RuntimeError):
+            with cli_module._write_txn(conn):
+                conn.execute(cli_module._SQL_INSERT_RUN, ("d", "t.py", "", "SUCCESS", "", 0))
+                raise RuntimeError("boom")
+
+        self.assertFalse(conn.in_transaction)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0], 0)
 
     def test_db_dump_outputs_json(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
-        scythe_main(["new", "charlie_test"])  # at least one test row
+        self._insert_test_row("charlie_test")  # at least one test row
         buf = io.StringIO()
         with redirect_stdout(buf):
             code = scythe_main(["db", "dump"])  # dump as json
@@ -125,8 +240,83 @@ class TestScytheCLI(unittest.TestCase):
         self.assertIn("runs", j)
         self.assertTrue(any(row.get("name") == "charlie_test.py" for row in j["tests"]))
 
-    def test_db_sync_compat_updates_versions(self):
+    def test_db_dump_streams_same_json_as_dict_dump(self):
+        self._use_initialized_project()
+        for name in ("echo_test", "foxtrot_test"):
+            self._insert_test_row(name)
+
+        def streamed():
+            buf = io.StringIO()
+            cli_module._write_db_dump(self.root, buf)
+            return buf.getvalue()
+
+        # runs table still empty
+        self.assertEqual(streamed(), json.dumps(cli_module._dump_db(self.root), indent=2) + "\n")
+        cli_module._record_run(self.root, "echo_test", 1, 'line "one"\nline two', "1.0")
+        self.assertEqual(streamed(), json.dumps(cli_module._dump_db(self.root), indent=2) + "\n")
+
+    def test_find_project_root_tracks_init_and_removal(self):
+        nested = os.path.join(self.root, "a", "b")
+        os.makedirs(nested)
+        self.assertIsNone(cli_module._find_project_root(nested))
+
         scythe_main(["init", "--path", self.root])
+        self.assertEqual(cli_module._find_project_root(nested), os.path.abspath(self.root))
+        self.assertEqual(cli_module._find_project_root(nested), os.path.abspath(self.root))
+
+        cli_module._close_db(self.root)
+        shutil.rmtree(os.path.join(self.root, ".scythe"))
+        self.assertIsNone(cli_module._find_project_root(nested))
+
+    def test_nested_init_shadows_cached_outer_project(self):
+        outer = os.path.join(self.root, "outer")
+        sub = os.path.join(outer, "sub")
+        scythe_main(["init", "--path", outer])
+        self.addCleanup(cli_module._close_db, outer)
+        os.makedirs(sub)
+        self._chdir(sub)
+        self.assertEqual(cli_module._find_project_root(), outer)
+
+        scythe_main(["init", "--path", sub])
+        self.addCleanup(cli_module._close_db, sub)
+        with redirect_stdout(io.StringIO()):
+            scythe_main(["new", "x_test"])
+
+        self.assertTrue(
+            os.path.exists(os.path.join(sub, ".scythe", "scythe_tests", "x_test.py"))
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(outer, ".scythe", "scythe_tests", "x_test.py"))
+        )
+
+    def test_fast_path_selection(self):
+        fast = cli_module._is_fast_path
+        self.assertTrue(fast(["init", "--path", "x"]))
+        self.assertTrue(fast(["new", "t", "-k", "ttp-api"]))
+        self.assertTrue(fast(["run", "--json", "t", "--", "--json"]))
+        self.assertTrue(fast(["db", "dump"]))
+        self.assertFalse(fast(["run", "t", "--json"]))
+        self.assertFalse(fast(["new", "--help"]))
+        self.assertFalse(fast(["db"]))
+        self.assertFalse(fast(["check", "t"]))
+        self.assertFalse(fast([]))
+
+    def test_db_connection_reused_within_process(self):
+        self._use_initialized_project()
+        root = os.path.realpath(self.root)
+        self._chdir(root)
+        first = cli_module._open_db(root)
+        scythe_main(["new", "delta_test"])
+        with redirect_stdout(io.StringIO()):
+            scythe_main(["db", "dump"])
+        self.assertIs(cli_module._open_db(root), first)
+
+        # Re-initializing drops the cached connection
+        scythe_main(["init", "--path", root])
+        self.assertIsNot(cli_module._open_db(root), first)
+
+    def test_db_sync_compat_updates_versions(self):
+        self._use_initialized_project()
         self._chdir(self.root)
         scythe_main(
             ["new", "delta_test"]
@@ -137,21 +327,14 @@ class TestScytheCLI(unittest.TestCase):
             code = scythe_main(["db", "sync-compat", "delta_test"])  # should succeed
         self.assertEqual(code, 0)
         # verify DB updated
-        db_path = os.path.join(self.root, ".scythe", "scythe.db")
-        conn = sqlite3.connect(db_path)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT compatible_versions FROM tests WHERE name=?", ("delta_test.py",)
-            )
-            row = cur.fetchone()
-            self.assertIsNotNone(row)
-            self.assertEqual(row[0], json.dumps(["1.2.3"]))
-        finally:
-            conn.close()
+        row = self._db().execute(
+            "SELECT compatible_versions FROM tests WHERE name=?", ("delta_test.py",)
+        ).fetchone()
+        self.assertIsNotNone(row)
+        self.assertEqual(row[0], json.dumps(["1.2.3"]))
 
     def test_db_sync_compat_handles_missing(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         scythe_main(["new", "echo_test"])  # create test
         # Remove the COMPATIBLE_VERSIONS line from the test file
@@ -175,21 +358,14 @@ class TestScytheCLI(unittest.TestCase):
             )  # should succeed gracefully
         self.assertEqual(code, 0)
         # verify DB updated with empty string
-        db_path = os.path.join(self.root, ".scythe", "scythe.db")
-        conn = sqlite3.connect(db_path)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT compatible_versions FROM tests WHERE name=?", ("echo_test.py",)
-            )
-            row = cur.fetchone()
-            self.assertIsNotNone(row)
-            self.assertEqual(row[0], "")
-        finally:
-            conn.close()
+        row = self._db().execute(
+            "SELECT compatible_versions FROM tests WHERE name=?", ("echo_test.py",)
+        ).fetchone()
+        self.assertIsNotNone(row)
+        self.assertEqual(row[0], "")
 
     def test_new_supports_template_kind(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         code = scythe_main(["new", "foxtrot_test", "--kind", "ttp-api"])
         self.assertEqual(code, 0)
@@ -203,7 +379,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertIn("def scythe_test_definition(args) -> int:", content)
 
     def test_new_supports_stellarbridge_template_kind(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         code = scythe_main(["new", "hotel_test", "--kind", "sb-route-matrix"])
         self.assertEqual(code, 0)
@@ -215,7 +391,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertIn("JourneyExecutor", content)
 
     def test_check_command_outputs_json(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         scythe_main(["new", "golf_test"])
         buf = io.StringIO()
@@ -227,7 +403,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertEqual(report["errors"], [])
 
     def test_check_command_reports_errors(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         bad_path = os.path.join(self.root, ".scythe", "scythe_tests", "broken_test.py")
         with open(bad_path, "w", encoding="utf-8") as f:
@@ -244,7 +420,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertIn("compatible_versions_missing_or_invalid", error_codes)
 
     def test_check_strict_fails_on_warnings(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         warn_path = os.path.join(
             self.root, ".scythe", "scythe_tests", "warning_test.py"
@@ -328,7 +504,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertEqual(result_holder.get("code"), 0)
 
     def test_new_from_intent_json_selects_kind(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         buf = io.StringIO()
         with redirect_stdout(buf):
@@ -348,7 +524,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertEqual(report["data"]["kind"], "sb-org-rbac")
 
     def test_run_json_output(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         scythe_main(["new", "run_json_test"])
         test_path = os.path.join(
@@ -376,7 +552,7 @@ class TestScytheCLI(unittest.TestCase):
         self.assertEqual(report["data"]["summary"]["passed"], 1)
 
     def test_check_fix_applies_changes(self):
-        scythe_main(["init", "--path", self.root])
+        self._use_initialized_project()
         self._chdir(self.root)
         test_path = os.path.join(self.root, ".scythe", "scythe_tests", "fix_test.py")
         with open(test_path, "w", encoding="utf-8") as f:
@@ -1,8 +1,12 @@
 import unittest
 from unittest.mock import Mock, patch
 from typing import Any, Dict, Optional
+import asyncio
+import json as jsonlib
 import sys
+import threading
 import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Provide minimal shims if dependencies are not installed
 # requests shim
@@ -99,7 +103,10 @@ except Exception:
     sys.modules["selenium.common"] = selenium_common_mod
     sys.modules["selenium.common.exceptions"] = selenium_common_ex_mod
 
+from scythe.auth import cookie_jwt
+from scythe.auth.base import AuthenticationError
 from scythe.auth.cookie_jwt import CookieJWTAuth
+from scythe.core.csrf import CSRFProtection
 
 
 class _FakeLoginResponse:
@@ -125,6 +132,9 @@ class _CookieJar:
     def get(self, key: str, default=None):
         return self._cookies.get(key, default)
 
+    def __contains__(self, key: str) -> bool:
+        return key in self._cookies
+
 
 class _FakeLoginSession:
     def __init__(self, data: Dict[str, Any]):
@@ -138,6 +148,16 @@ class _FakeLoginSession:
         return _FakeLoginResponse(self._data, 200)
 
 
+class _CountingLoginSession(_FakeLoginSession):
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(data)
+        self.post_count = 0
+
+    def post(self, url, json=None, timeout=None, data=None, headers=None):
+        self.post_count += 1
+        return super().post(url, json=json, timeout=timeout, data=data, headers=headers)
+
+
 class _FakeRequestsSession:
     def __init__(self):
         self.headers: Dict[str, str] = {}
@@ -203,6 +223,81 @@ class TestCookieJWTAuth(unittest.TestCase):
         self.assertEqual(auth.token, "ABC123")
         self.assertEqual(auth.get_auth_headers(), {})
 
+    def test_cookie_source_requests_identity_body(self):
+        import requests as real_requests
+
+        if not isinstance(real_requests.Session, type) or cookie_jwt.requests is None:
+            self.skipTest("requests is not installed")
+        session = Mock(spec=real_requests.Session)
+        resp = Mock(status_code=200, cookies={"stellarbridge": "COOKIEJWT"})
+        session.post.return_value = resp
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login",
+            jwt_source="cookie",
+            session=session,
+            token_ttl=0,
+        )
+
+        self.assertEqual(auth.get_auth_cookies(), {"stellarbridge": "COOKIEJWT"})
+
+        kwargs = session.post.call_args.kwargs
+        self.assertNotIn("stream", kwargs)
+        self.assertEqual(kwargs["headers"]["Accept-Encoding"], "identity")
+        resp.close.assert_called_once()
+
+    def test_failed_streamed_login_closes_response(self):
+        if cookie_jwt.requests is None:
+            self.skipTest("requests is not installed")
+        session = Mock()
+        resp = Mock(status_code=500)
+        resp.raise_for_status.side_effect = RuntimeError("HTTP Error")
+        session.post.return_value = resp
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login",
+            jwt_source="cookie",
+            session=session,
+            token_ttl=0,
+        )
+
+        with self.assertRaises(AuthenticationError):
+            auth.get_auth_cookies()
+
+        resp.close.assert_called_once()
+
+    def test_json_source_requests_compressed_body(self):
+        if cookie_jwt.requests is None:
+            self.skipTest("requests is not installed")
+        session = Mock()
+        session.post.return_value = _FakeLoginResponse({"token": "J"})
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login", session=session, token_ttl=0
+        )
+
+        auth.get_auth_cookies()
+
+        kwargs = session.post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Accept-Encoding"], cookie_jwt._ACCEPT_ENCODING)
+        self.assertNotIn("stream", kwargs)
+
+    def test_login_body_parsed_once_for_csrf_and_jwt(self):
+        resp = Mock(status_code=200, cookies={}, url="http://api.example.com/login")
+        resp.json.return_value = {"csrfToken": "NEXT", "token": "J"}
+        session = Mock()
+        session.cookies = _CookieJar()
+        session.get.return_value = Mock(status_code=200, headers={}, url="http://api.example.com/login")
+        session.get.return_value.json.return_value = {"csrfToken": "FIRST"}
+        session.post.return_value = resp
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login",
+            session=session,
+            csrf_protection=CSRFProtection(extract_from="body", body_field="csrfToken"),
+        )
+
+        self.assertEqual(auth.get_auth_cookies(), {"stellarbridge": "J"})
+
+        self.assertEqual(resp.json.call_count, 1)
+        self.assertEqual(auth.csrf_protection.get_token(), "NEXT")
+
     def test_ui_auth_sets_browser_cookie(self):
         fake_login = _FakeLoginSession({"token": "XYZ"})
         auth = CookieJWTAuth(
@@ -223,6 +318,572 @@ class TestCookieJWTAuth(unittest.TestCase):
         self.assertEqual(called_args["name"], "stellarbridge")
         self.assertEqual(called_args["value"], "XYZ")
 
+    def test_ui_auth_skips_navigation_when_already_on_domain(self):
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login",
+            session=_FakeLoginSession({"token": "XYZ"}),
+            token_ttl=0,
+        )
+        driver = Mock()
+        driver.current_url = "http://app.example.com/somewhere"
+
+        self.assertTrue(auth.authenticate(driver, target_url="http://app.example.com/protected"))
+
+        driver.get.assert_not_called()
+        driver.add_cookie.assert_called_once()
+
+    def test_ui_auth_navigates_when_on_other_domain(self):
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login",
+            session=_FakeLoginSession({"token": "XYZ"}),
+            token_ttl=0,
+        )
+        driver = Mock()
+        driver.current_url = "data:,"
+
+        auth.authenticate(driver, target_url="http://app.example.com/protected")
+
+        driver.get.assert_called_once_with("http://app.example.com")
+
+    def test_target_url_parsed_once_and_bounded(self):
+        auth = CookieJWTAuth(login_url="http://api.example.com/login")
+
+        with patch.object(cookie_jwt, "urlparse", wraps=cookie_jwt.urlparse) as parse:
+            first = auth._target_parts("http://app.example.com:8080/a")
+            second = auth._target_parts("http://app.example.com:8080/a")
+        self.assertIs(first, second)
+        self.assertEqual(first, ("http://app.example.com:8080", "app.example.com:8080", "app.example.com"))
+        self.assertEqual(parse.call_count, 1)
+
+        for i in range(6):
+            auth._target_parts(f"http://host{i}.example.com/")
+        self.assertEqual(len(auth._url_cache), 4)
+
+    def test_ui_auth_uses_cdp_on_chromium(self):
+        try:
+            from selenium.webdriver.chromium.webdriver import ChromiumDriver
+        except ImportError:
+            self.skipTest("selenium is not installed")
+        auth = CookieJWTAuth(
+            login_url="http://api.example.com/login",
+            session=_FakeLoginSession({"token": "XYZ"}),
+            token_ttl=0,
+        )
+        driver = Mock(spec=ChromiumDriver)
+
+        auth.authenticate(driver, target_url="http://app.example.com/protected")
+
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.setCookie",
+            {"name": "stellarbridge", "value": "XYZ", "path": "/", "domain": "app.example.com"},
+        )
+        driver.get.assert_not_called()
+        driver.add_cookie.assert_not_called()
+
+    def test_default_sessions_share_connection_pool(self):
+        first = CookieJWTAuth(login_url="https://api.example.com/login")
+        second = CookieJWTAuth(login_url="https://api.example.com/login")
+
+        self.assertIsNot(first._session, second._session)
+        self.assertIs(
+            first._session.get_adapter("https://api.example.com/login"),
+            second._session.get_adapter("https://api.example.com/login"),
+        )
+
+    def test_http2_falls_back_to_requests_without_httpx(self):
+        with patch.dict(sys.modules, {"httpx": None}):
+            auth = CookieJWTAuth(login_url="https://api.example.com/login", http2=True)
+
+        self.assertIsInstance(auth._session, requests.Session)
+
+    def test_default_session_is_per_thread(self):
+        import threading
+
+        auth = CookieJWTAuth(login_url="https://api.example.com/login")
+        if cookie_jwt.requests is None:
+            self.skipTest("requests is not installed")
+        main_session = auth._session
+        seen = []
+        worker = threading.Thread(target=lambda: seen.append(auth._session))
+        worker.start()
+        worker.join()
+
+        self.assertIs(auth._session, main_session)
+        self.assertIsNot(seen[0], main_session)
+
+    def test_deepcopy_gives_fresh_sessions(self):
+        import copy
+
+        given = _FakeLoginSession({"token": "XYZ"})
+        auth = CookieJWTAuth(login_url="https://api.example.com/login", session=given)
+
+        clone = copy.deepcopy(auth)
+
+        self.assertEqual(clone.login_url, auth.login_url)
+        self.assertIsInstance(clone._session, _FakeLoginSession)
+
+    def test_http2_ignored_when_session_given(self):
+        fake_login = _FakeLoginSession({"token": "T"})
+        auth = CookieJWTAuth(
+            login_url="https://api.example.com/login", session=fake_login, http2=True
+        )
+
+        self.assertIs(auth._session, fake_login)
+
+
+class TestDotPathExtraction(unittest.TestCase):
+    def test_extracts_nested_dict_and_list_values(self):
+        data = {"data": {"items": [{"token": "T0"}, {"token": "T1"}], "0": "key"}}
+
+        self.assertEqual(cookie_jwt._extract_by_dot_path(data, "data.items.1.token"), "T1")
+        # Numeric segments are plain keys on dicts
+        self.assertEqual(cookie_jwt._extract_by_dot_path(data, "data.0"), "key")
+
+    def test_missing_or_invalid_segments_return_none(self):
+        data = {"items": [{"token": "T0"}]}
+
+        self.assertIsNone(cookie_jwt._extract_by_dot_path(data, "items.5.token"))
+        self.assertIsNone(cookie_jwt._extract_by_dot_path(data, "items.-1.token"))
+        self.assertIsNone(cookie_jwt._extract_by_dot_path(data, "items.first"))
+        self.assertIsNone(cookie_jwt._extract_by_dot_path(data, "missing"))
+        self.assertIsNone(cookie_jwt._extract_by_dot_path(data, ""))
+
+
+class TestCookieJWTAuthTokenCache(unittest.TestCase):
+    def setUp(self):
+        CookieJWTAuth.invalidate_cache()
+        self.addCleanup(CookieJWTAuth.invalidate_cache)
+
+    def _auth(self, session, **kwargs):
+        return CookieJWTAuth(
+            login_url="http://cache.example.com/login",
+            username="user@example.com",
+            password="secret",
+            session=session,
+            **kwargs,
+        )
+
+    def test_instances_share_cached_token(self):
+        session = _CountingLoginSession({"token": "SHARED"})
+
+        first = self._auth(session)
+        second = self._auth(session)
+
+        self.assertEqual(first.get_auth_cookies(), {"stellarbridge": "SHARED"})
+        self.assertEqual(second.get_auth_cookies(), {"stellarbridge": "SHARED"})
+        self.assertEqual(session.post_count, 1)
+        self.assertEqual(second.get_auth_data("jwt"), "SHARED")
+
+    def test_different_password_is_not_shared(self):
+        session = _CountingLoginSession({"token": "T"})
+
+        self._auth(session).get_auth_cookies()
+        CookieJWTAuth(
+            login_url="http://cache.example.com/login",
+            username="user@example.com",
+            password="other",
+            session=session,
+        ).get_auth_cookies()
+
+        self.assertEqual(session.post_count, 2)
+
+    def test_zero_ttl_disables_cache(self):
+        session = _CountingLoginSession({"token": "T"})
+
+        self._auth(session, token_ttl=0).get_auth_cookies()
+        self._auth(session, token_ttl=0).get_auth_cookies()
+
+        self.assertEqual(session.post_count, 2)
+
+    def test_invalidate_cache_forces_new_login(self):
+        session = _CountingLoginSession({"token": "T"})
+
+        self._auth(session).get_auth_cookies()
+        CookieJWTAuth.invalidate_cache()
+        self._auth(session).get_auth_cookies()
+
+        self.assertEqual(session.post_count, 2)
+
+
+class TestCookieJWTAuthAsync(unittest.TestCase):
+    def setUp(self):
+        CookieJWTAuth.invalidate_cache()
+        self.addCleanup(CookieJWTAuth.invalidate_cache)
+
+    def test_async_login_reuses_cached_token(self):
+        session = _CountingLoginSession({"token": "SHARED"})
+        kwargs = dict(
+            login_url="http://async.example.com/login",
+            username="user@example.com",
+            password="secret",
+            session=session,
+        )
+        CookieJWTAuth(**kwargs).get_auth_cookies()
+
+        cookies = asyncio.run(CookieJWTAuth(**kwargs).get_auth_cookies_async())
+
+        self.assertEqual(cookies, {"stellarbridge": "SHARED"})
+        self.assertEqual(session.post_count, 1)
+
+    def test_async_csrf_login_runs_sync_flow(self):
+        session = _ETagSession()
+        auth = CookieJWTAuth(
+            login_url="http://async-csrf.example.com/login",
+            csrf_protection=CSRFProtection(extract_from="body", auto_extract=False),
+            session=session,
+        )
+
+        cookies = asyncio.run(auth.get_auth_cookies_async())
+
+        self.assertEqual(cookies, {"stellarbridge": "JWT"})
+        self.assertEqual(session.last_post_headers["X-CSRF-Token"], "CSRF-1")
+
+    def test_async_login_requires_aiohttp(self):
+        auth = CookieJWTAuth(login_url="http://async.example.com/login", token_ttl=0)
+
+        with patch.dict(sys.modules, {"aiohttp": None}):
+            with self.assertRaises(ImportError):
+                asyncio.run(auth.get_auth_cookies_async())
+
+
+class _FakeAiohttpSession:
+    def __init__(self, **kwargs):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _fake_aiohttp():
+    """Just enough of the aiohttp module for _aiohttp_session() to build a session."""
+    module = types.ModuleType("aiohttp")
+    module.ClientSession = _FakeAiohttpSession
+    module.TCPConnector = lambda **kwargs: None
+    module.DummyCookieJar = lambda: None
+    module.ClientTimeout = lambda **kwargs: None
+    return module
+
+
+class TestAiohttpSessionLifetime(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(sys.modules, {"aiohttp": _fake_aiohttp()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cookie_jwt._AIOHTTP_SESSIONS.clear)
+
+    def test_sessions_closed_when_asyncio_run_finishes(self):
+        async def grab():
+            first = cookie_jwt._aiohttp_session()
+            self.assertIs(cookie_jwt._aiohttp_session(), first)
+            return first
+
+        sessions = [asyncio.run(grab()) for _ in range(3)]
+
+        self.assertTrue(all(session.closed for session in sessions))
+        self.assertEqual(cookie_jwt._AIOHTTP_SESSIONS, {})
+
+    def test_close_async_sessions(self):
+        async def grab_and_close():
+            session = cookie_jwt._aiohttp_session()
+            await cookie_jwt.close_async_sessions()
+            return session
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        session = loop.run_until_complete(grab_and_close())
+
+        self.assertTrue(session.closed)
+        self.assertEqual(cookie_jwt._AIOHTTP_SESSIONS, {})
+
+
+class _ETagResponse:
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes = b""):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.cookies = _CookieJar()
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return jsonlib.loads(self.content)
+
+    def close(self):
+        self.closed = True
+
+
+class _ETagSession:
+    """Serves a CSRF page with an ETag and answers revalidations with 304."""
+
+    def __init__(self, page_headers=None):
+        self.cookies = _CookieJar()
+        self.get_headers = []
+        self.page_headers = {"ETag": '"v1"', **(page_headers or {})}
+
+    def get(self, url, headers=None, timeout=None):
+        self.get_headers.append(headers or {})
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return _ETagResponse(304, {"ETag": '"v1"'})
+        return _ETagResponse(200, dict(self.page_headers), b'{"csrfToken": "CSRF-1"}')
+
+    def post(self, url, json=None, timeout=None, data=None, headers=None):
+        self.last_post_headers = headers
+        return _ETagResponse(200, {}, b'{"token": "JWT"}')
+
+
+class TestCSRFPageCache(unittest.TestCase):
+    def _auth(self, session, auto_extract=False):
+        return CookieJWTAuth(
+            login_url="http://etag.example.com/login",
+            username="user@example.com",
+            password="secret",
+            csrf_protection=CSRFProtection(extract_from="body", auto_extract=auto_extract),
+            session=session,
+        )
+
+    def test_revalidates_with_etag_and_reuses_cached_body(self):
+        session = _ETagSession()
+        auth = self._auth(session)
+
+        auth._login_and_get_token()
+        token = auth._login_and_get_token()
+
+        self.assertEqual(token, "JWT")
+        self.assertEqual(session.get_headers[0], {})
+        self.assertEqual(session.get_headers[1], {"If-None-Match": '"v1"'})
+        # Token came from the cached body even though the 304 had none
+        self.assertEqual(session.last_post_headers["X-CSRF-Token"], "CSRF-1")
+
+    def test_cache_is_per_instance(self):
+        session = _ETagSession()
+
+        self._auth(session)._login_and_get_token()
+        self._auth(session)._login_and_get_token()
+
+        self.assertEqual(session.get_headers, [{}, {}])
+
+    def test_private_and_cookie_varying_pages_are_not_cached(self):
+        for page_headers in ({"Cache-Control": "private"}, {"Vary": "Accept, Cookie"}):
+            with self.subTest(headers=page_headers):
+                session = _ETagSession(page_headers)
+                auth = self._auth(session)
+
+                auth._login_and_get_token()
+                auth._login_and_get_token()
+
+                self.assertEqual(session.get_headers, [{}, {}])
+
+    def test_set_cookie_is_not_stored(self):
+        session = _ETagSession({"Set-Cookie": "sid=first"})
+        auth = self._auth(session)
+
+        auth._login_and_get_token()
+
+        cached_headers = auth._page_cache["http://etag.example.com/login"][2]
+        self.assertNotIn("Set-Cookie", cached_headers)
+
+    def test_auto_extract_always_fetches_fresh_page(self):
+        session = _ETagSession()
+        auth = self._auth(session, auto_extract=True)
+
+        auth._login_and_get_token()
+        auth._login_and_get_token()
+
+        self.assertEqual(session.get_headers, [{}, {}])
+        self.assertEqual(auth._page_cache, {})
+
+
+class _HeaderCSRFSession:
+    """Hands out CSRF tokens in a response header; rejects stale ones with 403."""
+
+    def __init__(self):
+        self.cookies = _CookieJar()
+        self.get_count = 0
+        self.valid_token = "CSRF-1"
+        self.posted_tokens = []
+        self.responses = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.get_count += 1
+        resp = _ETagResponse(200, {"X-CSRF-Token": self.valid_token})
+        resp.url = url
+        return resp
+
+    def post(self, url, json=None, timeout=None, data=None, headers=None):
+        token = (headers or {}).get("X-CSRF-Token")
+        self.posted_tokens.append(token)
+        if token != self.valid_token:
+            resp = _ETagResponse(403, {})
+        else:
+            resp = _ETagResponse(200, {}, b'{"token": "JWT"}')
+        self.responses.append(resp)
+        return resp
+
+
+class _CSRFLoginHandler(BaseHTTPRequestHandler):
+    """GET sets a csrftoken cookie; POST answers with a JWT."""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Set-Cookie", "csrftoken=CSRF1; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"token": "JWT"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _CookieLoginHandler(BaseHTTPRequestHandler):
+    """Keep-alive login endpoint that sets the JWT cookie; counts connections."""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Set-Cookie", "stellarbridge=JWT; Path=/")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCookieJWTAuthConnectionReuse(unittest.TestCase):
+    def test_cookie_source_logins_reuse_pooled_connection(self):
+        if cookie_jwt.requests is None:
+            self.skipTest("requests is not installed")
+        _CookieLoginHandler.connections = 0
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _CookieLoginHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        login_url = f"http://127.0.0.1:{server.server_address[1]}/login"
+
+        for _ in range(4):
+            auth = CookieJWTAuth(login_url=login_url, jwt_source="cookie", token_ttl=0)
+            self.assertEqual(auth.get_auth_cookies(), {"stellarbridge": "JWT"})
+
+        self.assertEqual(_CookieLoginHandler.connections, 1)
+
+
+class TestCookieJWTAuthCrossThreadCookies(unittest.TestCase):
+    """Cookies from a login on one thread are visible on the others."""
+
+    def setUp(self):
+        if cookie_jwt.requests is None:
+            self.skipTest("requests is not installed")
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _CSRFLoginHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.auth = CookieJWTAuth(
+            login_url=f"http://127.0.0.1:{server.server_address[1]}/login",
+            username="user@example.com",
+            password="secret",
+            csrf_protection=CSRFProtection(
+                extract_from="cookie", cookie_name="csrftoken", header_name="X-CSRF-Token"
+            ),
+        )
+
+    def test_headers_include_cookie_after_login_on_other_thread(self):
+        worker = threading.Thread(target=self.auth.get_auth_cookies)
+        worker.start()
+        worker.join()
+
+        self.assertEqual(
+            self.auth.get_auth_headers(),
+            {"X-CSRF-Token": "CSRF1", "Cookie": "csrftoken=CSRF1"},
+        )
+
+    def test_headers_include_cookie_after_async_csrf_login(self):
+        cookies = asyncio.run(self.auth.get_auth_cookies_async())
+
+        self.assertEqual(cookies, {"stellarbridge": "JWT"})
+        self.assertEqual(
+            self.auth.get_auth_headers(),
+            {"X-CSRF-Token": "CSRF1", "Cookie": "csrftoken=CSRF1"},
+        )
+
+
+class TestCookieJWTAuthCachedCSRF(unittest.TestCase):
+    def setUp(self):
+        self.session = _HeaderCSRFSession()
+        self.csrf = CSRFProtection(extract_from="header", auto_extract=False)
+
+    def _login(self):
+        auth = CookieJWTAuth(
+            login_url="http://csrf.example.com/login",
+            username="user@example.com",
+            password="secret",
+            csrf_protection=self.csrf,
+            session=self.session,
+        )
+        return auth._login_and_get_token()
+
+    def test_second_login_skips_csrf_get(self):
+        self._login()
+        self.assertEqual(self._login(), "JWT")
+
+        self.assertEqual(self.session.get_count, 1)
+        self.assertEqual(self.session.posted_tokens, ["CSRF-1", "CSRF-1"])
+
+    def test_cached_token_not_reused_by_other_session(self):
+        self._login()
+        other = _HeaderCSRFSession()
+        CookieJWTAuth(
+            login_url="http://csrf.example.com/login",
+            csrf_protection=self.csrf,
+            session=other,
+        )._login_and_get_token()
+
+        self.assertEqual(other.get_count, 1)
+        self.assertEqual(other.posted_tokens, ["CSRF-1"])
+
+    def test_session_endpoint_always_fetched(self):
+        auth = CookieJWTAuth(
+            login_url="http://csrf.example.com/login",
+            csrf_protection=self.csrf,
+            session_endpoint="http://csrf.example.com/session",
+            session=self.session,
+        )
+
+        auth._login_and_get_token()
+        auth._login_and_get_token()
+
+        self.assertEqual(self.session.get_count, 2)
+        self.assertEqual(self.session.posted_tokens, ["CSRF-1", "CSRF-1"])
+
+    def test_rejected_cached_token_is_refreshed_once(self):
+        self._login()
+        self.session.valid_token = "CSRF-2"
+
+        self.assertEqual(self._login(), "JWT")
+
+        self.assertEqual(self.session.get_count, 2)
+        self.assertEqual(self.session.posted_tokens, ["CSRF-1", "CSRF-1", "CSRF-2"])
+        # The rejected response is released before the retry
+        self.assertTrue(all(resp.closed for resp in self.session.responses))
+
 
 if __name__ == "__main__":
     unittest.main()
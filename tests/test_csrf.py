@@ -102,6 +102,19 @@ class TestCSRFTokenExtraction(unittest.TestCase):
         self.assertEqual(token, 'body_token')
         self.assertEqual(self.context['csrf_token'], 'body_token')
 
+    def test_extract_from_parsed_body(self):
+        """Test that an already-parsed body is used instead of re-parsing."""
+        csrf = CSRFProtection(extract_from='body', body_field='csrfToken')
+        mock_response = Mock()
+
+        token = csrf.extract_token(
+            response=mock_response, context=self.context,
+            parsed_body={'csrfToken': 'parsed_token'}
+        )
+
+        self.assertEqual(token, 'parsed_token')
+        mock_response.json.assert_not_called()
+
     def test_extract_token_not_found(self):
         """Test extraction when token is not found."""
         mock_response = Mock()
@@ -418,6 +431,87 @@ class TestCSRFGetToken(unittest.TestCase):
         self.assertIsNone(token)
 
 
+class TestCSRFCachedToken(unittest.TestCase):
+    """Test cases for reusing an extracted CSRF token."""
+
+    def _extract(self, csrf, url='https://example.com/login'):
+        mock_response = Mock()
+        mock_response.url = url
+        mock_response.headers = {'X-CSRF-Token': 'token123'}
+        return csrf.extract_token(response=mock_response)
+
+    def test_cached_token_for_same_origin(self):
+        """Test token is reusable for any URL on the origin it came from."""
+        csrf = CSRFProtection(extract_from='header')
+        self._extract(csrf)
+
+        self.assertEqual(csrf.get_cached_token('https://example.com/api/login'), 'token123')
+
+    def test_no_cached_token_for_other_origin(self):
+        """Test token is not offered to a different host or scheme."""
+        csrf = CSRFProtection(extract_from='header')
+        self._extract(csrf)
+
+        self.assertIsNone(csrf.get_cached_token('https://other.example.com/login'))
+        self.assertIsNone(csrf.get_cached_token('http://example.com/login'))
+
+    def test_cached_token_expires(self):
+        """Test token stops being reused after token_ttl seconds."""
+        csrf = CSRFProtection(extract_from='header', token_ttl=60)
+        with patch('scythe.core.csrf.time.time', return_value=1000.0):
+            self._extract(csrf)
+        with patch('scythe.core.csrf.time.time', return_value=1059.0):
+            self.assertEqual(csrf.get_cached_token('https://example.com/'), 'token123')
+        with patch('scythe.core.csrf.time.time', return_value=1060.0):
+            self.assertIsNone(csrf.get_cached_token('https://example.com/'))
+
+    def test_token_without_response_url_is_not_cached(self):
+        """Test tokens read only from session cookies have no origin to match."""
+        csrf = CSRFProtection()
+        mock_session = Mock()
+        mock_session.cookies = MagicMock()
+        mock_session.cookies.get.return_value = 'session_token'
+        csrf.extract_token(session=mock_session)
+
+        self.assertIsNone(csrf.get_cached_token('https://example.com/'))
+
+    def test_cached_token_tied_to_session_cookie_jar(self):
+        """Test a token is only offered to a session sharing the jar it came with."""
+        csrf = CSRFProtection(extract_from='header')
+        session = Mock()
+        session.cookies = MagicMock()
+        mock_response = Mock()
+        mock_response.url = 'https://example.com/login'
+        mock_response.headers = {'X-CSRF-Token': 'token123'}
+        csrf.extract_token(response=mock_response, session=session)
+
+        other = Mock()
+        other.cookies = MagicMock()
+        self.assertEqual(
+            csrf.get_cached_token('https://example.com/', session=session), 'token123'
+        )
+        self.assertIsNone(csrf.get_cached_token('https://example.com/', session=other))
+
+    def test_token_without_session_not_offered_to_session(self):
+        """Test a token extracted without a session can't be matched to one."""
+        csrf = CSRFProtection(extract_from='header')
+        self._extract(csrf)
+        session = Mock()
+        session.cookies = MagicMock()
+
+        self.assertIsNone(csrf.get_cached_token('https://example.com/', session=session))
+
+    def test_invalidate_cached_token(self):
+        """Test invalidated tokens are no longer returned."""
+        csrf = CSRFProtection(extract_from='header')
+        self._extract(csrf)
+
+        csrf.invalidate_cached_token()
+
+        self.assertIsNone(csrf.get_cached_token('https://example.com/'))
+        self.assertIsNone(csrf.get_token())
+
+
 class TestCSRFFrameworkPatterns(unittest.TestCase):
     """Test cases for common framework CSRF patterns."""
 
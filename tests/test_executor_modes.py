@@ -141,6 +141,25 @@ class TestTTPExecutorUIMode(unittest.TestCase):
         # Driver should be quit
         self.mock_driver.quit.assert_called_once()
 
+    @patch("scythe.core.executor.webdriver.Chrome")
+    def test_ui_mode_uses_provided_driver(self, mock_webdriver):
+        """Test that a caller-provided WebDriver is used and left running."""
+        ttp = MockTTPDualMode(execution_mode="ui")
+        executor = TTPExecutor(
+            ttp=ttp,
+            target_url="http://test.com",
+            headless=True,
+            sleep_fn=lambda _: None,
+            driver=self.mock_driver,
+        )
+
+        with patch.object(executor, "logger"):
+            executor.run()
+
+        mock_webdriver.assert_not_called()
+        self.assertTrue(ttp.ui_execute_called)
+        self.mock_driver.quit.assert_not_called()
+
 
 class TestTTPExecutorAPIMode(unittest.TestCase):
     """Test cases for TTPExecutor in API mode."""
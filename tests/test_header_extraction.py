@@ -1,6 +1,8 @@
+import sys
 import unittest
 from unittest.mock import Mock, patch
 import json
+import requests
 from scythe.core.headers import HeaderExtractor
 
 
@@ -395,6 +397,180 @@ class TestHeaderExtractor(unittest.TestCase):
         
         self.assertEqual(version, '2.0.0')
 
+    def test_banner_grab_reuses_session(self):
+        """Test that repeated banner grabs go through the extractor's session."""
+        mock_response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.1.0'})
+
+        with patch.object(self.extractor._client(), 'head', return_value=mock_response) as mock_head, \
+                patch('scythe.core.headers.requests.head') as module_head:
+            self.assertEqual(self.extractor.banner_grab('http://example.com'), '3.1.0')
+            self.assertEqual(
+                self.extractor.get_all_headers_via_request('http://example.com'),
+                {'X-Scythe-Target-Version': '3.1.0'}
+            )
+
+        self.assertEqual(mock_head.call_count, 2)
+        module_head.assert_not_called()
+
+    def test_banner_grab_skips_get_when_head_has_header(self):
+        """Test that a HEAD response carrying the header needs no GET."""
+        head_response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.1.0'})
+
+        with patch.object(self.extractor._client(), 'head', return_value=head_response), \
+                patch.object(self.extractor._client(), 'get') as mock_get:
+            self.assertEqual(self.extractor.banner_grab('http://example.com'), '3.1.0')
+
+        mock_get.assert_not_called()
+
+    def test_banner_grab_falls_back_to_get(self):
+        """Test GET fallback when HEAD is rejected or lacks the header."""
+        get_response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.2.0'})
+        for head_response in (Mock(status_code=405, headers={}), Mock(status_code=200, headers={})):
+            with self.subTest(status=head_response.status_code), \
+                    patch.object(self.extractor._client(), 'head', return_value=head_response), \
+                    patch.object(self.extractor._client(), 'get', return_value=get_response) as mock_get:
+                self.assertEqual(self.extractor.banner_grab('http://example.com'), '3.2.0')
+                mock_get.assert_called_once()
+
+    def test_banner_grab_force_all(self):
+        """Test that force_all sends GET even after a successful HEAD."""
+        head_response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.1.0'})
+        get_response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.2.0'})
+
+        with patch.object(self.extractor._client(), 'head', return_value=head_response), \
+                patch.object(self.extractor._client(), 'get', return_value=get_response) as mock_get:
+            version = self.extractor.banner_grab('http://example.com', force_all=True)
+
+        self.assertEqual(version, '3.1.0')
+        mock_get.assert_called_once()
+
+    @patch('builtins.print')
+    def test_debug_headers_writes_report_once(self, mock_print):
+        """Test that debug_headers emits its whole report in a single write."""
+        response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.1.0', 'Server': 'test'})
+
+        with patch.object(self.extractor._client(), 'head', return_value=response), \
+                patch.object(self.extractor._client(), 'get', return_value=response):
+            self.extractor.debug_headers('http://example.com')
+
+        mock_print.assert_called_once()
+        report = mock_print.call_args[0][0]
+        self.assertIn('--- HEAD Request ---', report)
+        self.assertIn('--- GET Request ---', report)
+        self.assertEqual(report.count('*** POTENTIAL VERSION HEADER ***'), 2)
+        self.assertIn('Target version extraction result: 3.1.0', report)
+
+    def test_http2_falls_back_to_requests_without_httpx(self):
+        """Test that http2=True still works with requests when httpx is missing."""
+        with patch.dict(sys.modules, {'httpx': None}):
+            extractor = HeaderExtractor(http2=True)
+            client = extractor._client()
+
+        self.assertIsInstance(client, requests.Session)
+        self.assertFalse(extractor._http2)
+
+    def test_banner_grab_cache_ttl(self):
+        """Test that cache_ttl reuses a recent probe result per (method, URL)."""
+        extractor = HeaderExtractor(cache_ttl=60)
+        response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.1.0'})
+
+        with patch.object(extractor._client(), 'head', return_value=response) as mock_head:
+            self.assertEqual(extractor.banner_grab('http://example.com'), '3.1.0')
+            self.assertEqual(extractor.banner_grab('http://example.com'), '3.1.0')
+            extractor.banner_grab('http://example.com/other')
+
+        self.assertEqual(mock_head.call_count, 2)
+
+    def test_banner_grab_uncached_by_default(self):
+        """Test that every banner grab probes the server without cache_ttl."""
+        response = Mock(status_code=200, headers={'X-Scythe-Target-Version': '3.1.0'})
+
+        with patch.object(self.extractor._client(), 'head', return_value=response) as mock_head:
+            self.extractor.banner_grab('http://example.com')
+            self.extractor.banner_grab('http://example.com')
+
+        self.assertEqual(mock_head.call_count, 2)
+
+    def test_session_created_lazily_and_closed(self):
+        """Test that the HTTP client is only opened by a probe and close() releases it."""
+        extractor = HeaderExtractor()
+        self.assertIsNone(extractor._session)
+
+        session = extractor._client()
+        with patch.object(session, 'close') as mock_close:
+            with extractor:
+                pass
+
+        mock_close.assert_called_once()
+        self.assertIsNone(extractor._session)
+        extractor.close()
+
+    def _response_log(self, url, headers):
+        return {
+            'message': json.dumps({
+                'message': {
+                    'method': 'Network.responseReceived',
+                    'params': {'response': {'url': url, 'headers': headers}}
+                }
+            })
+        }
+
+    @patch('scythe.core.headers.time.sleep')
+    def test_wait_for_response_log_returns_on_matching_response(self, mock_sleep):
+        """Test that the log wait stops as soon as the target response is logged."""
+        other = self._response_log('http://cdn.example.org/app.css', {})
+        target = self._response_log('http://example.com/', {'X-SCYTHE-TARGET-VERSION': '4.0.0'})
+        self.mock_driver.get_log.side_effect = [[other], [], [target], [other]]
+
+        logs = self.extractor.wait_for_response_log(
+            self.mock_driver, 'http://example.com/', timeout=5.0
+        )
+
+        self.assertEqual(
+            [entry['message']['message']['params']['response']['url'] for entry in logs],
+            ['http://cdn.example.org/app.css', 'http://example.com/']
+        )
+        self.assertEqual(self.mock_driver.get_log.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('scythe.core.headers.time.sleep')
+    def test_wait_for_response_log_times_out(self, mock_sleep):
+        """Test that the log wait gives up after the timeout."""
+        self.mock_driver.get_log.return_value = []
+
+        logs = self.extractor.wait_for_response_log(self.mock_driver, timeout=0)
+
+        self.assertEqual(logs, [])
+        self.mock_driver.get_log.assert_called_once_with('performance')
+        mock_sleep.assert_not_called()
+
+    def test_parse_performance_logs_keeps_decoded_responses(self):
+        """Test that logs are decoded once and filtered to response events."""
+        response = self._response_log('http://example.com/', {'X-SCYTHE-TARGET-VERSION': '4.0.0'})
+        other_event = {'message': json.dumps({'message': {'method': 'Network.requestWillBeSent'}})}
+        malformed = {'message': '{not json'}
+
+        parsed = HeaderExtractor.parse_performance_logs([other_event, response, malformed])
+
+        self.assertEqual(parsed, [{'message': json.loads(response['message'])}])
+        with patch('scythe.core.headers.json.loads') as mock_loads:
+            version = self.extractor.extract_target_version(self.mock_driver, preloaded_logs=parsed)
+            headers = self.extractor.extract_all_headers(self.mock_driver, preloaded_logs=parsed)
+        mock_loads.assert_not_called()
+        self.assertEqual(version, '4.0.0')
+        self.assertEqual(headers, {'X-SCYTHE-TARGET-VERSION': '4.0.0'})
+
+    def test_extract_with_preloaded_logs(self):
+        """Test that preloaded logs are used instead of querying the driver."""
+        logs = [self._response_log('http://example.com/', {'X-SCYTHE-TARGET-VERSION': '4.0.0'})]
+
+        version = self.extractor.extract_target_version(self.mock_driver, preloaded_logs=logs)
+        headers = self.extractor.extract_all_headers(self.mock_driver, preloaded_logs=logs)
+
+        self.assertEqual(version, '4.0.0')
+        self.assertEqual(headers, {'X-SCYTHE-TARGET-VERSION': '4.0.0'})
+        self.mock_driver.get_log.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
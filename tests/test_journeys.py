@@ -804,6 +804,41 @@ class TestJourneyExecutor(unittest.TestCase):
         self.assertTrue(auth.auth_called)
         self.assertTrue(results["overall_success"])
 
+    @patch("scythe.journeys.executor.webdriver.Chrome")
+    def test_executor_uses_provided_driver(self, mock_webdriver):
+        """Test a caller-provided WebDriver is used and not quit afterwards."""
+        action = MockAction("Test Action", "Test Description", execution_result=True)
+        step = Step("Test Step", "Test Description", actions=[action])
+        journey = Journey("Test Journey", "Test Description", steps=[step])
+
+        executor = JourneyExecutor(
+            journey=journey, target_url="http://test.com", driver=self.mock_driver
+        )
+
+        with patch.object(executor, "logger"):
+            results = executor.run()
+
+        mock_webdriver.assert_not_called()
+        self.assertTrue(results["overall_success"])
+        self.mock_driver.quit.assert_not_called()
+
+    def test_executor_api_mode_uses_provided_http_session(self):
+        """Test API mode seeds the context with a caller-provided session."""
+        session = Mock()
+        journey = Journey("Test Journey", "Test Description")
+
+        executor = JourneyExecutor(
+            journey=journey,
+            target_url="http://test.com",
+            mode="API",
+            http_session=session,
+        )
+
+        with patch.object(executor, "logger"):
+            executor.run()
+
+        self.assertIs(journey.get_context("requests_session"), session)
+
     def test_executor_was_successful(self):
         """Test executor success check method."""
         executor = JourneyExecutor(
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Add the scythe package to the path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scythe.payloads.generators import MmapPayloadGenerator, WordlistPayloadGenerator
+
+
+class TestMmapPayloadGenerator(unittest.TestCase):
+    """Test cases for MmapPayloadGenerator."""
+
+    def _write_wordlist(self, content: bytes) -> str:
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_yields_stripped_lines(self):
+        """Test lines are yielded stripped, matching WordlistPayloadGenerator."""
+        path = self._write_wordlist(b"admin\r\npassword123\n  letmein  \nlast")
+
+        payloads = list(MmapPayloadGenerator(path))
+
+        self.assertEqual(payloads, ["admin", "password123", "letmein", "last"])
+        self.assertEqual(payloads, list(WordlistPayloadGenerator(path)))
+
+    def test_can_be_iterated_repeatedly(self):
+        """Test each iteration restarts from the beginning of the file."""
+        path = self._write_wordlist(b"one\ntwo\n")
+        generator = MmapPayloadGenerator(path)
+
+        self.assertEqual(list(generator()), ["one", "two"])
+        self.assertEqual(list(generator()), ["one", "two"])
+
+    def test_empty_file_yields_nothing(self):
+        """Test an empty wordlist produces no payloads."""
+        path = self._write_wordlist(b"")
+
+        self.assertEqual(list(MmapPayloadGenerator(path)), [])
+
+    def test_decodes_utf8(self):
+        """Test non-ASCII payloads are decoded with the configured encoding."""
+        path = self._write_wordlist("pässwörd\n".encode("utf-8"))
+
+        self.assertEqual(list(MmapPayloadGenerator(path)), ["pässwörd"])
+
+    def test_rejects_non_ascii_compatible_encoding(self):
+        """Test encodings whose newline is not the b'\\n' byte are refused."""
+        path = self._write_wordlist("admin\n".encode("latin-1"))
+
+        self.assertEqual(list(MmapPayloadGenerator(path, encoding="latin-1")), ["admin"])
+        for encoding in ("utf-16", "utf-16-le", "utf-32", "cp037"):
+            with self.subTest(encoding=encoding):
+                with self.assertRaises(ValueError):
+                    MmapPayloadGenerator(path, encoding=encoding)
+
+
+if __name__ == "__main__":
+    unittest.main()
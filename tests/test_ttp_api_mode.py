@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import json
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the scythe package to the path for testing
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -10,7 +12,7 @@ from scythe.core.ttp import TTP
 from scythe.ttps.web.login_bruteforce import LoginBruteforceTTP
 from scythe.ttps.web.sql_injection import InputFieldInjector, URLManipulation
 from scythe.payloads.generators import StaticPayloadGenerator
-from scythe.journeys.actions import TTPAction
+from scythe.journeys.actions import TTPAction, _bounded_map
 from scythe.journeys.base import Journey, Step
 
 
@@ -212,6 +214,79 @@ class TestLoginBruteforceTTPAPIMode(unittest.TestCase):
             call_args[1]["json"], {"username": "admin", "password": "testpass"}
         )
 
+    def test_login_bruteforce_execute_step_api_with_body_template(self):
+        """Test execute_step_api splices the payload into a body template."""
+        ttp = LoginBruteforceTTP(
+            payload_generator=self.payload_gen,
+            username="admin",
+            execution_mode="api",
+            api_endpoint="/api/auth/login",
+            body_template=b'{"username":"admin","password":"__PW__"}',
+        )
+
+        mock_session = Mock()
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_response.headers = {}
+        mock_session.post.return_value = mock_response
+
+        context = {"target_url": "http://test.com"}
+
+        ttp.execute_step_api(mock_session, 'pa"ss\\word', context)
+
+        call_kwargs = mock_session.post.call_args[1]
+        self.assertNotIn("json", call_kwargs)
+        self.assertEqual(
+            json.loads(call_kwargs["data"]),
+            {"username": "admin", "password": 'pa"ss\\word'},
+        )
+        self.assertEqual(call_kwargs["headers"]["Content-Type"], "application/json")
+
+    def test_login_bruteforce_body_template_requires_placeholder(self):
+        """Test a body template without the placeholder is rejected."""
+        with self.assertRaises(ValueError):
+            LoginBruteforceTTP(
+                payload_generator=self.payload_gen,
+                username="admin",
+                execution_mode="api",
+                body_template=b'{"username":"admin"}',
+            )
+
+    def test_login_bruteforce_body_template_must_match_credentials(self):
+        """Test a body template disagreeing with username or field names is rejected."""
+        cases = {
+            "other_username": (b'{"username":"root","password":"__PW__"}', {}),
+            "username_field": (
+                b'{"username":"admin","password":"__PW__"}',
+                {"username_field": "email"},
+            ),
+            "password_field": (
+                b'{"username":"admin","password":"__PW__"}',
+                {"password_field": "pass"},
+            ),
+            "not_json": (b'username=admin&password=__PW__', {}),
+        }
+        for name, (template, kwargs) in cases.items():
+            with self.subTest(name):
+                with self.assertRaises(ValueError):
+                    LoginBruteforceTTP(
+                        payload_generator=self.payload_gen,
+                        username="admin",
+                        execution_mode="api",
+                        body_template=template,
+                        **kwargs,
+                    )
+
+        ttp = LoginBruteforceTTP(
+            payload_generator=self.payload_gen,
+            username="a@b.c",
+            execution_mode="api",
+            username_field="email",
+            password_field="pass",
+            body_template=b'{"email":"a@b.c","pass":"__PW__"}',
+        )
+        self.assertIsNotNone(ttp.body_template)
+
     def test_login_bruteforce_verify_result_api_success(self):
         """Test LoginBruteforceTTP verify_result_api with successful login."""
         ttp = LoginBruteforceTTP(
@@ -562,6 +637,45 @@ class TestTTPActionAPIMode(unittest.TestCase):
         # Should reuse the same session
         self.assertIs(context["requests_session"], mock_session)
 
+    def test_ttp_action_api_mode_with_workers(self):
+        """Test payloads dispatched on a thread pool keep their order in results."""
+        api_ttp = MockTTPWithAPISupport(execution_mode="api")
+        action = TTPAction(ttp=api_ttp, target_url="http://test.com")
+
+        mock_driver = Mock()
+        context = {"target_url": "http://test.com", "api_workers": 4}
+
+        result = action.execute(mock_driver, context)
+
+        self.assertTrue(result)
+        self.assertEqual(action.get_result("total_payloads"), 2)
+        self.assertEqual(action.get_result("successful_payloads"), 2)
+        self.assertEqual(
+            [r["payload"] for r in action.get_result("ttp_results")],
+            ["payload1", "payload2"],
+        )
+
+
+    def test_bounded_map_limits_payloads_in_flight(self):
+        """Test the pool only pulls payloads a bounded window ahead of results."""
+        consumed = [0]
+        lead = []
+
+        def payloads():
+            for i in range(200):
+                consumed[0] += 1
+                yield i
+
+        def send(i):
+            lead.append(consumed[0] - i)
+            return i * 2
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(_bounded_map(pool, send, payloads(), window=4))
+
+        self.assertEqual(results, [i * 2 for i in range(200)])
+        self.assertLessEqual(max(lead), 5)
+
 
 class TestBackwardCompatibility(unittest.TestCase):
     """Test cases to ensure backward compatibility."""
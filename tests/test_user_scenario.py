@@ -0,0 +1,65 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from scythe.journeys import ApiRequestAction
+from scythe.journeys import JourneyExecutor
+from scythe.journeys import Journey, Step
+
+
+class TestUserScenario(unittest.TestCase):
+    """Regression test for the reported API-mode exit code issue."""
+
+    def test_exit_code_on_unexpected_200(self):
+        """Test a route that doesn't return the expected 401 makes the run exit non-zero."""
+        journey = Journey(
+            name="test API routes",
+            description="test API routes",
+            steps=[
+                Step(
+                    name="Test routes that should return 401",
+                    description="tests routes expecting 401",
+                    actions=[
+                        ApiRequestAction(
+                            method="GET",
+                            url="/api/v1/auth/me",
+                            expected_status=401,
+                            expected_result=True,
+                        ),
+                    ],
+                )
+            ],
+        )
+
+        executor = JourneyExecutor(
+            journey=journey,
+            mode="API",
+            target_url="https://httpbin.org",
+        )
+
+        # The route answers 200 instead of 401; no socket is opened
+        mock_response = Mock(spec=requests.Response)
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.text = "{}"
+        mock_response.json.return_value = {}
+
+        with patch("requests.Session.request", return_value=mock_response) as mock_request:
+            result = executor.run()
+
+        # The route request comes first; later calls are the version banner grab
+        self.assertEqual(
+            mock_request.call_args_list[0][0], ("GET", "https://httpbin.org/api/v1/auth/me")
+        )
+
+        self.assertFalse(result.get("overall_success"))
+        self.assertTrue(result.get("expected_result"))
+        self.assertEqual(result.get("steps_failed"), 1)
+        self.assertEqual(result.get("steps_succeeded"), 0)
+        self.assertFalse(executor.was_successful())
+        self.assertEqual(executor.exit_code(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()